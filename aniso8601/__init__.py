@@ -6,21 +6,65 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
-from aniso8601.date import get_date_resolution, parse_date
-from aniso8601.duration import get_duration_resolution, parse_duration
+from aniso8601.batch import (
+    parse_dates,
+    parse_datetimes,
+    parse_durations,
+    parse_intervals,
+    parse_times,
+)
+from aniso8601.cache import (
+    ParseCache,
+    cached_parse_date,
+    cached_parse_datetime,
+    cached_parse_duration,
+    cached_parse_interval,
+    cached_parse_repeating_interval,
+    cached_parse_time,
+    disable_cache,
+    enable_cache,
+)
+from aniso8601.column import ColumnParser
+from aniso8601.compiler import compile_format
+from aniso8601.date import (
+    get_date_resolution,
+    is_valid_date,
+    parse_date,
+    parse_date_with_resolution,
+)
+from aniso8601.duration import (
+    get_duration_resolution,
+    is_valid_duration,
+    parse_duration,
+    parse_duration_with_resolution,
+)
 from aniso8601.interval import (
     get_interval_resolution,
     get_repeating_interval_resolution,
+    is_valid_interval,
     parse_interval,
+    parse_interval_with_resolution,
     parse_repeating_interval,
+    parse_repeating_interval_with_resolution,
 )
 
 # Import the main parsing functions so they are readily available
 from aniso8601.time import (
     get_datetime_resolution,
     get_time_resolution,
+    is_valid_datetime,
+    is_valid_time,
     parse_datetime,
+    parse_datetime_with_resolution,
     parse_time,
+    parse_time_with_resolution,
+)
+from aniso8601.tryparse import (
+    try_parse_date,
+    try_parse_datetime,
+    try_parse_duration,
+    try_parse_interval,
+    try_parse_time,
 )
 
 __version__ = "9.0.2-dev.0"
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from functools import partial
+
+from aniso8601 import compat
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.compat import is_string
+from aniso8601.date import parse_date
+from aniso8601.duration import parse_duration
+from aniso8601.interval import parse_interval
+from aniso8601.time import parse_datetime, parse_datetime_string, parse_time
+
+
+class ErrorPolicy(object):
+    Raise, Skip, Null, Collect = list(compat.range(4))
+
+
+def parse_dates(
+    isodatestrs, builder=PythonTimeBuilder, errors=ErrorPolicy.Raise, out=None
+):
+    # parse_date over an iterable of strings, see _parse_batch for errors
+    # and out
+    return _parse_batch(partial(parse_date, builder=builder), isodatestrs, errors, out)
+
+
+def parse_times(
+    isotimestrs, builder=PythonTimeBuilder, errors=ErrorPolicy.Raise, out=None
+):
+    # parse_time over an iterable of strings, see _parse_batch for errors
+    # and out
+    return _parse_batch(partial(parse_time, builder=builder), isotimestrs, errors, out)
+
+
+def parse_datetimes(
+    isodatetimestrs,
+    delimiter="T",
+    builder=PythonTimeBuilder,
+    errors=ErrorPolicy.Raise,
+    out=None,
+):
+    # parse_datetime over an iterable of strings, see _parse_batch for errors
+    # and out
+    def parse(isodatetimestr):
+        # Strings skip the type checks, anything else is handled, and
+        # reported, by parse_datetime
+        if is_string(isodatetimestr) is True:
+            return parse_datetime_string(isodatetimestr, delimiter, builder)
+
+        return parse_datetime(isodatetimestr, delimiter=delimiter, builder=builder)
+
+    return _parse_batch(parse, isodatetimestrs, errors, out)
+
+
+def parse_durations(
+    isodurationstrs, builder=PythonTimeBuilder, errors=ErrorPolicy.Raise, out=None
+):
+    # parse_duration over an iterable of strings, see _parse_batch for errors
+    # and out
+    return _parse_batch(
+        partial(parse_duration, builder=builder), isodurationstrs, errors, out
+    )
+
+
+def parse_intervals(
+    isointervalstrs,
+    intervaldelimiter="/",
+    datetimedelimiter="T",
+    builder=PythonTimeBuilder,
+    errors=ErrorPolicy.Raise,
+    out=None,
+):
+    # parse_interval over an iterable of strings, see _parse_batch for errors
+    # and out
+    return _parse_batch(
+        partial(
+            parse_interval,
+            intervaldelimiter=intervaldelimiter,
+            datetimedelimiter=datetimedelimiter,
+            builder=builder,
+        ),
+        isointervalstrs,
+        errors,
+        out,
+    )
+
+
+def _parse_batch(parse, isostrs, errors, out):
+    # Parses each string with parse, which has already been bound to the
+    # builder and delimiters for the whole batch. Results are returned as a
+    # list, or written to out[index] if out is given, in which case out is
+    # returned. Strings which fail to parse are handled according to errors:
+    #
+    # ErrorPolicy.Raise - the error is raised
+    # ErrorPolicy.Skip - the string is left out of the results, out is left
+    # unchanged at that index
+    # ErrorPolicy.Null - None is used as the result
+    # ErrorPolicy.Collect - None is used as the result, and (results,
+    # errors) is returned, errors being a list of (index, exception) tuples
+    if errors == ErrorPolicy.Raise:
+        if out is None:
+            return [parse(isostr) for isostr in isostrs]
+
+        for index, isostr in enumerate(isostrs):
+            out[index] = parse(isostr)
+
+        return out
+
+    if errors not in (ErrorPolicy.Skip, ErrorPolicy.Null, ErrorPolicy.Collect):
+        raise ValueError("Unknown error policy.")
+
+    if out is None:
+        results = []
+    else:
+        results = out
+
+    collected = []
+
+    for index, isostr in enumerate(isostrs):
+        try:
+            result = parse(isostr)
+        except (ValueError, NotImplementedError) as e:
+            if errors == ErrorPolicy.Skip:
+                continue
+
+            if errors == ErrorPolicy.Collect:
+                collected.append((index, e))
+
+            result = None
+
+        if out is None:
+            results.append(result)
+        else:
+            out[index] = result
+
+    if errors == ErrorPolicy.Collect:
+        return (results, collected)
+
+    return results
@@ -264,6 +264,10 @@ class BaseTimeBuilder(object):
 
     LEAP_SECONDS_SUPPORTED = False
 
+    # Builders setting INTEGER_FIELDS have build_datetime_fields called
+    # instead of build_datetime for the common calendar datetime forms
+    INTEGER_FIELDS = False
+
     @classmethod
     def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
         raise NotImplementedError
@@ -296,6 +300,22 @@ class BaseTimeBuilder(object):
     def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
         raise NotImplementedError
 
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        # Given a calendar datetime to the second as ints, with a decimal
+        # fraction of the second of fraction / 10 ** fractiondigits, and tz
+        # as a TimezoneTuple or None, build the datetime. Only called for
+        # builders setting INTEGER_FIELDS, those builders skip the
+        # range_check_* methods for the fields. The default builds the
+        # TupleBuilder tuples and calls build_datetime.
+        datetimetuple = TupleBuilder.build_datetime_fields(
+            YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+        )
+
+        return cls.build_datetime(datetimetuple.date, datetimetuple.time)
+
     @classmethod
     def range_check_date(
         cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None, rangedict=None
@@ -612,3 +632,26 @@ class TupleBuilder(BaseTimeBuilder):
     @classmethod
     def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
         return TimezoneTuple(negative, Z, hh, mm, name)
+
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        # The tuples the fields were read from, with any "," decimal
+        # separator normalized to "."
+        if fractiondigits == 0:
+            secondstr = "{0:02d}".format(ss)
+        else:
+            secondstr = "{0:02d}.{1:0{2}d}".format(ss, fraction, fractiondigits)
+
+        return DatetimeTuple(
+            DateTuple(
+                "{0:04d}".format(YYYY),
+                "{0:02d}".format(MM),
+                "{0:02d}".format(DD),
+                None,
+                None,
+                None,
+            ),
+            TimeTuple("{0:02d}".format(hh), "{0:02d}".format(mm), secondstr, tz),
+        )
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import array
+import datetime
+from collections import namedtuple
+
+from aniso8601.batch import ErrorPolicy, parse_dates, parse_datetimes, parse_times
+from aniso8601.builders.python import (
+    MICROSECONDS_PER_MINUTE,
+    MICROSECONDS_PER_SECOND,
+    PythonTimeBuilder,
+)
+from aniso8601.builders.validating import ValidatingBuilder
+from aniso8601.resolution import DateResolution, TimeResolution
+
+# Offset column value for a time without a timezone
+NO_OFFSET = -32768
+
+# Resolution column value for a string which failed to parse, see
+# ErrorPolicy.Null
+NULL_RESOLUTION = -1
+
+DateRow = namedtuple("DateRow", ["year", "month", "day", "resolution"])
+TimeRow = namedtuple(
+    "TimeRow", ["hour", "minute", "second", "microsecond", "offset", "resolution"]
+)
+DatetimeRow = namedtuple(
+    "DatetimeRow",
+    [
+        "year",
+        "month",
+        "day",
+        "hour",
+        "minute",
+        "second",
+        "microsecond",
+        "offset",
+        "resolution",
+    ],
+)
+
+# array.array typecodes for each field, offset is in minutes
+FIELD_TYPECODES = {
+    "year": "H",
+    "month": "B",
+    "day": "B",
+    "hour": "B",
+    "minute": "B",
+    "second": "B",
+    "microsecond": "I",
+    "offset": "h",
+    "resolution": "b",
+}
+
+
+class ColumnarTimeBuilder(ValidatingBuilder):
+    # Builds dates, times, and datetimes as DateRow, TimeRow, and
+    # DatetimeRow tuples of range checked ints, to be appended to columns.
+    # Week and ordinal dates are converted to calendar dates, fractional
+    # components are distributed, and midnight is moved into range, as by
+    # the PythonTimeBuilder. Times are not normalized to UTC, offset is the
+    # UTC offset in minutes, or NO_OFFSET. Resolution is a DateResolution
+    # for dates, and a TimeResolution for times and datetimes. Timezones
+    # are built as their offset, durations and intervals are not supported.
+    @classmethod
+    def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
+        if Www is not None or DDD is not None:
+            date = datetime.date.fromordinal(
+                cls._date_ordinal(YYYY, MM, DD, Www, D, DDD)
+            )
+
+            year, month, day = date.year, date.month, date.day
+        else:
+            year, month, day, _, _, _ = cls.range_check_date(YYYY, MM, DD, Www, D, DDD)
+
+            if month is None:
+                month = 1
+
+            if day is None:
+                day = 1
+
+        return DateRow(year, month, day, _get_date_resolution(MM, DD, Www, D, DDD))
+
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        hh, mm, ss, tz = cls.range_check_time(hh, mm, ss, tz)
+
+        hours, minutes, seconds, microseconds = PythonTimeBuilder._time_components(
+            hh, mm, ss
+        )
+
+        if tz is None:
+            offset = NO_OFFSET
+        else:
+            offset = cls._timezone_microseconds(*tz) // MICROSECONDS_PER_MINUTE
+
+        if ss is not None:
+            resolution = TimeResolution.Seconds
+        elif mm is not None:
+            resolution = TimeResolution.Minutes
+        else:
+            resolution = TimeResolution.Hours
+
+        return TimeRow(hours, minutes, seconds, microseconds, offset, resolution)
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        daterow = cls._build_object(date)
+        timerow = cls._build_object(time)
+
+        return DatetimeRow(daterow.year, daterow.month, daterow.day, *timerow)
+
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        if (
+            cls._fields_microseconds(YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits)
+            is None
+        ):
+            return super(ColumnarTimeBuilder, cls).build_datetime_fields(
+                YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+            )
+
+        if tz is None:
+            offset = NO_OFFSET
+        else:
+            offset = cls._timezone_microseconds(*tz) // MICROSECONDS_PER_MINUTE
+
+        return DatetimeRow(
+            YYYY,
+            MM,
+            DD,
+            hh,
+            mm,
+            ss,
+            fraction * MICROSECONDS_PER_SECOND // 10**fractiondigits,
+            offset,
+            TimeResolution.Seconds,
+        )
+
+    @classmethod
+    def build_duration(
+        cls, PnY=None, PnM=None, PnW=None, PnD=None, TnH=None, TnM=None, TnS=None
+    ):
+        raise NotImplementedError("Durations have no columnar representation.")
+
+    @classmethod
+    def build_interval(cls, start=None, end=None, duration=None):
+        raise NotImplementedError("Intervals have no columnar representation.")
+
+    @classmethod
+    def build_repeating_interval(cls, R=None, Rnn=None, interval=None):
+        raise NotImplementedError(
+            "Repeating intervals have no columnar representation."
+        )
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        # The UTC offset in minutes
+        return (
+            cls._timezone_microseconds(negative, Z, hh, mm, name)
+            // MICROSECONDS_PER_MINUTE
+        )
+
+
+class Columns(object):
+    # Parallel array.array columns, one for each field of ROW, available as
+    # attributes by field name. Indexing returns a ROW.
+    ROW = None
+
+    def __init__(self):
+        for field in self.ROW._fields:
+            setattr(self, field, array.array(FIELD_TYPECODES[field]))
+
+    def __len__(self):
+        return len(self.resolution)
+
+    def __getitem__(self, index):
+        return self.ROW(*[getattr(self, field)[index] for field in self.ROW._fields])
+
+    def append(self, row):
+        for field, value in zip(self.ROW._fields, row):
+            getattr(self, field).append(value)
+
+    def append_null(self):
+        # A row of 0, with an offset of NO_OFFSET and a resolution of
+        # NULL_RESOLUTION
+        for field in self.ROW._fields:
+            if field == "offset":
+                getattr(self, field).append(NO_OFFSET)
+            elif field == "resolution":
+                getattr(self, field).append(NULL_RESOLUTION)
+            else:
+                getattr(self, field).append(0)
+
+    def is_null(self, index):
+        return self.resolution[index] == NULL_RESOLUTION
+
+
+class DateColumns(Columns):
+    ROW = DateRow
+
+
+class TimeColumns(Columns):
+    ROW = TimeRow
+
+
+class DatetimeColumns(Columns):
+    ROW = DatetimeRow
+
+
+def parse_dates_to_columns(isodatestrs, errors=ErrorPolicy.Raise, out=None):
+    # As aniso8601.batch.parse_dates, see _parse_to_columns for errors and
+    # out
+    return _parse_to_columns(parse_dates, isodatestrs, errors, out, DateColumns, {})
+
+
+def parse_times_to_columns(isotimestrs, errors=ErrorPolicy.Raise, out=None):
+    # As aniso8601.batch.parse_times, see _parse_to_columns for errors and
+    # out
+    return _parse_to_columns(parse_times, isotimestrs, errors, out, TimeColumns, {})
+
+
+def parse_datetimes_to_columns(
+    isodatetimestrs, delimiter="T", errors=ErrorPolicy.Raise, out=None
+):
+    # As aniso8601.batch.parse_datetimes, see _parse_to_columns for errors
+    # and out
+    return _parse_to_columns(
+        parse_datetimes,
+        isodatetimestrs,
+        errors,
+        out,
+        DatetimeColumns,
+        {"delimiter": delimiter},
+    )
+
+
+def _parse_to_columns(parsebatch, isostrs, errors, out, columnstype, kwargs):
+    # Parses with ColumnarTimeBuilder, appending a row to out, or a new
+    # columnstype, for each string. Errors are handled as by
+    # aniso8601.batch._parse_batch, except ErrorPolicy.Null and
+    # ErrorPolicy.Collect append a null row, see Columns.append_null.
+    # Returns the columns, or (columns, errors) for ErrorPolicy.Collect.
+    if out is None:
+        out = columnstype()
+
+    result = parsebatch(
+        isostrs,
+        builder=ColumnarTimeBuilder,
+        errors=errors,
+        out=_ColumnAppender(out),
+        **kwargs
+    )
+
+    if errors == ErrorPolicy.Collect:
+        return (out, result[1])
+
+    return out
+
+
+class _ColumnAppender(object):
+    # The out container given to _parse_batch, which writes each result in
+    # order, None for a string that failed to parse, and nothing for a
+    # skipped string, so every write is an append
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __setitem__(self, index, row):
+        if row is None:
+            self.columns.append_null()
+        else:
+            self.columns.append(row)
+
+
+def _get_date_resolution(MM, DD, Www, D, DDD):
+    if DDD is not None:
+        return DateResolution.Ordinal
+
+    if D is not None:
+        return DateResolution.Weekday
+
+    if Www is not None:
+        return DateResolution.Week
+
+    if DD is not None:
+        return DateResolution.Day
+
+    if MM is not None:
+        return DateResolution.Month
+
+    return DateResolution.Year
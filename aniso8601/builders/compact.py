@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from collections import OrderedDict
+
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    RepeatingIntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+    TupleBuilder,
+)
+from aniso8601.builders.python import PythonTimeBuilder
+
+# The most timezone records kept by CompactTupleBuilder.build_timezone
+TIMEZONE_CACHE_SIZE = 1024
+
+
+class CompactRecord(object):
+    # Base of the CompactTupleBuilder results, an immutable record with a
+    # slot for each field of the corresponding TUPLE, so fields are read by
+    # the same attribute names. Records compare equal, and hash, by type and
+    # field values.
+    __slots__ = ()
+
+    TUPLE = None
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{0} is immutable.".format(type(self).__name__))
+
+    def __iter__(self):
+        for field in self.__slots__:
+            yield getattr(self, field)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((type(self), tuple(self)))
+
+    def __repr__(self):
+        return "{0}({1})".format(
+            type(self).__name__,
+            ", ".join(
+                "{0}={1!r}".format(field, getattr(self, field))
+                for field in self.__slots__
+            ),
+        )
+
+    def __reduce__(self):
+        return (type(self), tuple(self))
+
+    def to_tuple(self):
+        # The TupleBuilder tuple with the same fields, as strings
+        return self.TUPLE(*[_to_tuple_value(value) for value in self])
+
+    def build(self, builder=PythonTimeBuilder):
+        return builder._build_object(self.to_tuple())
+
+
+class CompactDate(CompactRecord):
+    # YYYY has truncated years expanded, "19" is stored as 1900
+    __slots__ = ("YYYY", "MM", "DD", "Www", "D", "DDD")
+
+    TUPLE = DateTuple
+
+    def to_tuple(self):
+        if self.YYYY is None:
+            YYYY = None
+        else:
+            YYYY = "{0:04d}".format(self.YYYY)
+
+        return DateTuple(
+            YYYY,
+            _to_tuple_value(self.MM),
+            _to_tuple_value(self.DD),
+            _to_tuple_value(self.Www),
+            _to_tuple_value(self.D),
+            _to_tuple_value(self.DDD),
+        )
+
+
+class CompactTime(CompactRecord):
+    __slots__ = ("hh", "mm", "ss", "tz")
+
+    TUPLE = TimeTuple
+
+
+class CompactDatetime(CompactRecord):
+    __slots__ = ("date", "time")
+
+    TUPLE = DatetimeTuple
+
+
+class CompactDuration(CompactRecord):
+    __slots__ = ("PnY", "PnM", "PnW", "PnD", "TnH", "TnM", "TnS")
+
+    TUPLE = DurationTuple
+
+
+class CompactInterval(CompactRecord):
+    __slots__ = ("start", "end", "duration")
+
+    TUPLE = IntervalTuple
+
+
+class CompactRepeatingInterval(CompactRecord):
+    __slots__ = ("R", "Rnn", "interval")
+
+    TUPLE = RepeatingIntervalTuple
+
+
+class CompactTimezone(CompactRecord):
+    __slots__ = ("negative", "Z", "hh", "mm", "name")
+
+    TUPLE = TimezoneTuple
+
+
+class CompactTupleBuilder(TupleBuilder):
+    # Builder returning the parse result as compact records in place of
+    # named tuples, see CompactRecord. Components are stored as ints, a
+    # component with a decimal fraction is kept as its string. Equal
+    # timezones are built as a single shared CompactTimezone, for the last
+    # TIMEZONE_CACHE_SIZE timezones built. Use the build method of a record
+    # to build it with another builder.
+
+    # Built timezones, oldest first, see build_timezone
+    _timezones = OrderedDict()
+
+    @classmethod
+    def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
+        if YYYY is not None:
+            # Truncated years are expanded as by range_check_date
+            YYYY = int(YYYY.ljust(4, "0"))
+
+        return CompactDate(
+            YYYY,
+            _cast_component(MM),
+            _cast_component(DD),
+            _cast_component(Www),
+            _cast_component(D),
+            _cast_component(DDD),
+        )
+
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        return CompactTime(
+            _cast_component(hh),
+            _cast_component(mm),
+            _cast_component(ss),
+            cls._compact(tz),
+        )
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        return CompactDatetime(cls._compact(date), cls._compact(time))
+
+    @classmethod
+    def build_duration(
+        cls, PnY=None, PnM=None, PnW=None, PnD=None, TnH=None, TnM=None, TnS=None
+    ):
+        return CompactDuration(
+            _cast_component(PnY),
+            _cast_component(PnM),
+            _cast_component(PnW),
+            _cast_component(PnD),
+            _cast_component(TnH),
+            _cast_component(TnM),
+            _cast_component(TnS),
+        )
+
+    @classmethod
+    def build_interval(cls, start=None, end=None, duration=None):
+        return CompactInterval(
+            cls._compact(start), cls._compact(end), cls._compact(duration)
+        )
+
+    @classmethod
+    def build_repeating_interval(cls, R=None, Rnn=None, interval=None):
+        return CompactRepeatingInterval(R, _cast_component(Rnn), cls._compact(interval))
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        # Parsing with the TupleBuilder skips the range checks, so any
+        # spelling of the digits is a new timezone. Once TIMEZONE_CACHE_SIZE
+        # are kept the oldest is dropped for each new one.
+        key = (negative, Z, hh, mm, name)
+
+        timezone = CompactTupleBuilder._timezones.get(key)
+
+        if timezone is None:
+            timezone = CompactTimezone(
+                negative, Z, _cast_component(hh), _cast_component(mm), name
+            )
+
+            if len(CompactTupleBuilder._timezones) >= TIMEZONE_CACHE_SIZE:
+                CompactTupleBuilder._timezones.popitem(last=False)
+
+            CompactTupleBuilder._timezones[key] = timezone
+
+        return timezone
+
+    @classmethod
+    def _compact(cls, value):
+        # The parsers build the parts of a datetime, interval, or time with
+        # a timezone with the TupleBuilder, convert those tuples to records
+        if value is None or isinstance(value, CompactRecord):
+            return value
+
+        return cls._build_object(value)
+
+
+def _cast_component(componentstr):
+    if componentstr is None or "." in componentstr:
+        return componentstr
+
+    return int(componentstr)
+
+
+def _to_tuple_value(value):
+    if isinstance(value, CompactRecord):
+        return value.to_tuple()
+
+    if type(value) is int:
+        return str(value)
+
+    return value
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+
+from aniso8601.builders import DateTuple, TupleBuilder
+from aniso8601.builders.python import (
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_HOUR,
+    MICROSECONDS_PER_MINUTE,
+    MICROSECONDS_PER_MONTH,
+    MICROSECONDS_PER_SECOND,
+    MICROSECONDS_PER_WEEK,
+    MICROSECONDS_PER_YEAR,
+)
+from aniso8601.builders.validating import ValidatingBuilder
+
+EPOCH_MICROSECONDS = datetime.date(1970, 1, 1).toordinal() * MICROSECONDS_PER_DAY
+
+NANOSECONDS_PER_MICROSECOND = 1000
+
+# Values are converted from microseconds by multiplying by the first, and
+# floor dividing by the second
+UNIT_CONVERSIONS = {"s": (1, 1000000), "ms": (1, 1000), "us": (1, 1), "ns": (1000, 1)}
+
+
+class EpochTimeBuilder(ValidatingBuilder):
+    # Builds dates and datetimes as an int number of UNIT since the Unix
+    # epoch, UNIT being one of "s", "ms", "us", or "ns". Datetimes with a UTC
+    # offset are normalized to UTC, dates are taken as midnight UTC. Times
+    # are built as UNIT since midnight, less any UTC offset, so a time added
+    # to a date gives the datetime. Durations and UTC offsets are built as
+    # an int number of UNIT. Values are computed from the range checked
+    # components with integer arithmetic, without building any datetime
+    # objects. Fractions finer than UNIT are floored, for "ns" the digits
+    # the PythonTimeBuilder truncates to microseconds are kept. Interval
+    # endpoints computed from a duration are only floored once the duration
+    # is applied.
+    # Use with_unit to get a builder for a unit other than microseconds.
+    UNIT = "us"
+
+    _unit_builders = {}
+
+    @classmethod
+    def with_unit(cls, unit):
+        if unit not in UNIT_CONVERSIONS:
+            raise ValueError("Unit must be one of s, ms, us, or ns.")
+
+        if unit == cls.UNIT:
+            return cls
+
+        key = (cls, unit)
+
+        if key not in EpochTimeBuilder._unit_builders:
+            EpochTimeBuilder._unit_builders[key] = type(cls)(
+                cls.__name__, (cls,), {"UNIT": unit}
+            )
+
+        return EpochTimeBuilder._unit_builders[key]
+
+    @classmethod
+    def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
+        return cls._from_epoch_units(
+            cls._epoch_units(DateTuple(YYYY, MM, DD, Www, D, DDD))
+        )
+
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        microseconds = cls._time_microseconds(hh, mm, ss, tz)
+
+        if tz is not None:
+            microseconds -= cls._timezone_microseconds(*tz)
+
+        return cls._to_units(microseconds, cls._time_nanoseconds(hh, mm, ss))
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        return cls._from_epoch_units(
+            cls._epoch_units(TupleBuilder.build_datetime(date, time))
+        )
+
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        microseconds = cls._fields_microseconds(
+            YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits
+        )
+
+        if microseconds is None:
+            return super(EpochTimeBuilder, cls).build_datetime_fields(
+                YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+            )
+
+        microseconds -= EPOCH_MICROSECONDS
+
+        if tz is not None:
+            microseconds -= cls._timezone_microseconds(*tz)
+
+        if cls.UNIT != "ns":
+            return cls._from_epoch_units(cls._to_units(microseconds))
+
+        return cls._from_epoch_units(
+            cls._to_units(
+                microseconds,
+                _get_fraction_nanoseconds(
+                    fraction, 10**fractiondigits, MICROSECONDS_PER_SECOND
+                ),
+            )
+        )
+
+    @classmethod
+    def build_duration(
+        cls, PnY=None, PnM=None, PnW=None, PnD=None, TnH=None, TnM=None, TnS=None
+    ):
+        return cls._from_duration_units(
+            cls._duration_units(PnY, PnM, PnW, PnD, TnH, TnM, TnS)
+        )
+
+    @classmethod
+    def build_interval(cls, start=None, end=None, duration=None):
+        start, end, duration = cls.range_check_interval(start, end, duration)
+
+        if start is not None and end is not None:
+            # <start>/<end>
+            return (
+                cls._from_epoch_units(cls._epoch_units(start)),
+                cls._from_epoch_units(cls._epoch_units(end)),
+            )
+
+        # The endpoints are computed in nanoseconds, and only floored to UNIT
+        # once the duration is applied
+        durationnanoseconds = cls._duration_nanoseconds(*duration)
+
+        if end is not None:
+            # <duration>/<end>
+            endnanoseconds = cls._epoch_nanoseconds(end)
+
+            return (
+                cls._from_epoch_units(cls._nanoseconds_to_units(endnanoseconds)),
+                cls._from_epoch_units(
+                    cls._nanoseconds_to_units(endnanoseconds - durationnanoseconds)
+                ),
+            )
+
+        # <start>/<duration>
+        startnanoseconds = cls._epoch_nanoseconds(start)
+
+        return (
+            cls._from_epoch_units(cls._nanoseconds_to_units(startnanoseconds)),
+            cls._from_epoch_units(
+                cls._nanoseconds_to_units(startnanoseconds + durationnanoseconds)
+            ),
+        )
+
+    @classmethod
+    def build_repeating_interval(cls, R=None, Rnn=None, interval=None):
+        # Range checks, and checks the start and end can be subtracted, as
+        # the PythonTimeBuilder would
+        super(EpochTimeBuilder, cls).build_repeating_interval(
+            R=R, Rnn=Rnn, interval=interval
+        )
+
+        if R is True:
+            iterations = None
+        else:
+            iterations = int(Rnn)
+
+        if interval.start is not None:
+            startnanoseconds = cls._epoch_nanoseconds(interval.start)
+
+            if interval.duration is not None:
+                return cls._epoch_generator(
+                    startnanoseconds,
+                    cls._duration_nanoseconds(*interval.duration),
+                    iterations,
+                )
+
+            return cls._epoch_generator(
+                startnanoseconds,
+                cls._epoch_nanoseconds(interval.end) - startnanoseconds,
+                iterations,
+            )
+
+        return cls._epoch_generator(
+            cls._epoch_nanoseconds(interval.end),
+            -cls._duration_nanoseconds(*interval.duration),
+            iterations,
+        )
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        # The UTC offset
+        return cls._from_duration_units(
+            cls._to_units(cls._timezone_microseconds(negative, Z, hh, mm, name))
+        )
+
+    @classmethod
+    def _from_epoch_units(cls, units):
+        # Builds the result for a date or datetime, subclasses can override
+        # this to return another type
+        return units
+
+    @classmethod
+    def _from_duration_units(cls, units):
+        # Builds the result for a duration or UTC offset, subclasses can
+        # override this to return another type
+        return units
+
+    @classmethod
+    def _epoch_units(cls, parsetuple):
+        # Range checks a date or datetime tuple, and returns the UTC time
+        # since the epoch in UNIT
+        microseconds = cls._datetime_microseconds(parsetuple) - EPOCH_MICROSECONDS
+
+        if type(parsetuple) is DateTuple:
+            return cls._to_units(microseconds)
+
+        if parsetuple.time.tz is not None:
+            microseconds -= cls._timezone_microseconds(*parsetuple.time.tz)
+
+        return cls._to_units(
+            microseconds,
+            cls._time_nanoseconds(
+                parsetuple.time.hh, parsetuple.time.mm, parsetuple.time.ss
+            ),
+        )
+
+    @classmethod
+    def _epoch_nanoseconds(cls, parsetuple):
+        # As _epoch_units, in nanoseconds whatever UNIT is, so intervals can
+        # be computed before flooring to UNIT
+        microseconds = cls._datetime_microseconds(parsetuple) - EPOCH_MICROSECONDS
+
+        if type(parsetuple) is DateTuple:
+            return microseconds * NANOSECONDS_PER_MICROSECOND
+
+        if parsetuple.time.tz is not None:
+            microseconds -= cls._timezone_microseconds(*parsetuple.time.tz)
+
+        return microseconds * NANOSECONDS_PER_MICROSECOND + _get_time_nanoseconds(
+            parsetuple.time.hh, parsetuple.time.mm, parsetuple.time.ss
+        )
+
+    @classmethod
+    def _duration_units(cls, PnY, PnM, PnW, PnD, TnH, TnM, TnS):
+        if cls.UNIT != "ns":
+            return cls._to_units(
+                cls._duration_microseconds(PnY, PnM, PnW, PnD, TnH, TnM, TnS)
+            )
+
+        return cls._duration_nanoseconds(PnY, PnM, PnW, PnD, TnH, TnM, TnS)
+
+    @classmethod
+    def _duration_nanoseconds(cls, PnY, PnM, PnW, PnD, TnH, TnM, TnS):
+        microseconds = cls._duration_microseconds(PnY, PnM, PnW, PnD, TnH, TnM, TnS)
+
+        # Only the lowest order component can have a fraction
+        nanoseconds = 0
+
+        for componentstr, conversion in (
+            (PnY, MICROSECONDS_PER_YEAR),
+            (PnM, MICROSECONDS_PER_MONTH),
+            (PnW, MICROSECONDS_PER_WEEK),
+            (PnD, MICROSECONDS_PER_DAY),
+            (TnH, MICROSECONDS_PER_HOUR),
+            (TnM, MICROSECONDS_PER_MINUTE),
+            (TnS, MICROSECONDS_PER_SECOND),
+        ):
+            nanoseconds += _get_nanosecond_remainder(componentstr, conversion)
+
+        return microseconds * NANOSECONDS_PER_MICROSECOND + nanoseconds
+
+    @classmethod
+    def _time_nanoseconds(cls, hh, mm, ss):
+        # The nanoseconds truncated from the time's microseconds, 0 unless
+        # UNIT is "ns"
+        if cls.UNIT != "ns":
+            return 0
+
+        return _get_time_nanoseconds(hh, mm, ss)
+
+    @classmethod
+    def _to_units(cls, microseconds, nanoseconds=0):
+        # nanoseconds is between 0 and 999, and only changes the result for
+        # "ns", which keeps this working for int64 arrays of microseconds
+        multiplier, divisor = UNIT_CONVERSIONS[cls.UNIT]
+
+        if multiplier == 1:
+            return microseconds // divisor
+
+        return microseconds * multiplier + nanoseconds
+
+    @classmethod
+    def _nanoseconds_to_units(cls, nanoseconds):
+        multiplier, divisor = UNIT_CONVERSIONS[cls.UNIT]
+
+        return nanoseconds * multiplier // (divisor * NANOSECONDS_PER_MICROSECOND)
+
+    @classmethod
+    def _epoch_generator(cls, startnanoseconds, stepnanoseconds, iterations):
+        # As PythonTimeBuilder._date_generator, unbounded if iterations is
+        # None, the values are kept as nanoseconds, and only floored to UNIT
+        # when they are yielded
+        currentnanoseconds = startnanoseconds
+        currentiteration = 0
+
+        while iterations is None or currentiteration < iterations:
+            yield cls._from_epoch_units(cls._nanoseconds_to_units(currentnanoseconds))
+
+            currentnanoseconds += stepnanoseconds
+            currentiteration += 1
+
+
+def _get_time_nanoseconds(hh, mm, ss):
+    # The nanoseconds truncated from a time's microseconds
+    return (
+        _get_nanosecond_remainder(hh, MICROSECONDS_PER_HOUR)
+        + _get_nanosecond_remainder(mm, MICROSECONDS_PER_MINUTE)
+        + _get_nanosecond_remainder(ss, MICROSECONDS_PER_SECOND)
+    )
+
+
+def _get_nanosecond_remainder(componentstr, conversion):
+    # The nanoseconds below the microseconds a component string is
+    # converted to by _cast_to_fractional_component, conversion being the
+    # microseconds per component, 0 for components without a fraction
+    if componentstr is None or "." not in componentstr:
+        return 0
+
+    fractionstr = componentstr.split(".")[1]
+
+    return _get_fraction_nanoseconds(
+        int(fractionstr), 10 ** len(fractionstr), conversion
+    )
+
+
+def _get_fraction_nanoseconds(fraction, scale, conversion):
+    # The nanoseconds below the microseconds of fraction / scale of a
+    # component, conversion being the microseconds per component
+    return (
+        fraction * conversion * NANOSECONDS_PER_MICROSECOND // scale
+        - fraction * conversion // scale * NANOSECONDS_PER_MICROSECOND
+    )
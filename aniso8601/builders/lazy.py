@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from aniso8601.builders import TupleBuilder
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.builders.validating import ValidatingBuilder
+
+# LazyResult value before it is built
+_UNBUILT = object()
+
+
+class LazyBuilder(TupleBuilder):
+    # Builds LazyResult proxies holding the TupleBuilder tuple, the parse
+    # checks the format, range checks are deferred until the value is
+    # built by BUILDER. Use with_builder to get a LazyBuilder for a builder
+    # other than the PythonTimeBuilder.
+    BUILDER = PythonTimeBuilder
+
+    _lazy_builders = {}
+
+    @classmethod
+    def with_builder(cls, builder):
+        if builder is cls.BUILDER:
+            return cls
+
+        key = (cls, builder)
+
+        if key not in LazyBuilder._lazy_builders:
+            LazyBuilder._lazy_builders[key] = type(cls)(
+                cls.__name__, (cls,), {"BUILDER": builder}
+            )
+
+        return LazyBuilder._lazy_builders[key]
+
+    @classmethod
+    def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
+        return LazyResult(
+            cls.BUILDER, TupleBuilder.build_date(YYYY, MM, DD, Www, D, DDD)
+        )
+
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        return LazyResult(cls.BUILDER, TupleBuilder.build_time(hh, mm, ss, tz))
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        return LazyResult(cls.BUILDER, TupleBuilder.build_datetime(date, time))
+
+    @classmethod
+    def build_duration(
+        cls, PnY=None, PnM=None, PnW=None, PnD=None, TnH=None, TnM=None, TnS=None
+    ):
+        return LazyResult(
+            cls.BUILDER,
+            TupleBuilder.build_duration(PnY, PnM, PnW, PnD, TnH, TnM, TnS),
+        )
+
+    @classmethod
+    def build_interval(cls, start=None, end=None, duration=None):
+        return LazyResult(
+            cls.BUILDER, TupleBuilder.build_interval(start, end, duration)
+        )
+
+    @classmethod
+    def build_repeating_interval(cls, R=None, Rnn=None, interval=None):
+        return LazyResult(
+            cls.BUILDER, TupleBuilder.build_repeating_interval(R, Rnn, interval)
+        )
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        return LazyResult(
+            cls.BUILDER, TupleBuilder.build_timezone(negative, Z, hh, mm, name)
+        )
+
+
+class LazyResult(object):
+    # Proxy for a parse result, built from parsetuple by builder when value
+    # is first read, and cached. Attributes are read from, and comparisons
+    # and hashing are done on, the built value. Range errors are raised
+    # when the value is built, is_valid checks for them.
+    __slots__ = ("builder", "parsetuple", "_value")
+
+    def __init__(self, builder, parsetuple):
+        self.builder = builder
+        self.parsetuple = parsetuple
+        self._value = _UNBUILT
+
+    @property
+    def value(self):
+        if self._value is _UNBUILT:
+            self._value = self.builder._build_object(self.parsetuple)
+
+        return self._value
+
+    @property
+    def is_built(self):
+        return self._value is not _UNBUILT
+
+    def is_valid(self):
+        # True if building the value with builder will not raise. For the
+        # PythonTimeBuilder the range checks are run by the ValidatingBuilder,
+        # which has the same limits, and nothing is built. Other builders
+        # can have other limits, so the value is built, and kept.
+        if self.is_built:
+            return True
+
+        try:
+            if self.builder is PythonTimeBuilder:
+                ValidatingBuilder._build_object(self.parsetuple)
+            else:
+                self.value
+        except (ValueError, NotImplementedError):
+            return False
+
+        return True
+
+    def __reduce__(self):
+        # Reduced to the unbuilt result, so copy and pickle never look up
+        # attributes on the value
+        return (LazyResult, (self.builder, self.parsetuple))
+
+    def __getattr__(self, name):
+        return getattr(self.value, name)
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __eq__(self, other):
+        return self.value == _get_value(other)
+
+    def __ne__(self, other):
+        return self.value != _get_value(other)
+
+    def __lt__(self, other):
+        return self.value < _get_value(other)
+
+    def __le__(self, other):
+        return self.value <= _get_value(other)
+
+    def __gt__(self, other):
+        return self.value > _get_value(other)
+
+    def __ge__(self, other):
+        return self.value >= _get_value(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return "LazyResult({0!r})".format(self.parsetuple)
+
+
+def _get_value(other):
+    if isinstance(other, LazyResult):
+        return other.value
+
+    return other
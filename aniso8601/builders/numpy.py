@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from __future__ import absolute_import
+
+from functools import partial
+
+import numpy
+
+from aniso8601 import compat
+from aniso8601.batch import ErrorPolicy, _parse_batch
+from aniso8601.builders import TupleBuilder
+from aniso8601.builders.epoch import (
+    EPOCH_MICROSECONDS,
+    NANOSECONDS_PER_MICROSECOND,
+    UNIT_CONVERSIONS,
+    EpochTimeBuilder,
+)
+from aniso8601.builders.python import (
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_HOUR,
+    MICROSECONDS_PER_MINUTE,
+    MICROSECONDS_PER_SECOND,
+    PythonTimeBuilder,
+)
+from aniso8601.builders.validating import DAYS_BEFORE_MONTH
+from aniso8601.exceptions import DayOutOfBoundsError, YearOutOfBoundsError
+from aniso8601.time import parse_datetime
+
+# The smallest int64 is NaT
+INT64_MIN = -(2**63) + 1
+INT64_MAX = 2**63 - 1
+
+NAT = -(2**63)
+
+# The YYYY-MM-DDThh:mm:ss layout scanned by _scan_datetime_column, indexed
+# by column
+DATETIME_COLUMN_LENGTH = 19
+DATETIME_COLUMN_DIGITS = (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18)
+DATETIME_COLUMN_SEPARATORS = ((4, "-"), (7, "-"), (13, ":"), (16, ":"))
+
+# Days in, and before, each month of a common year, indexed by month
+DAYS_IN_MONTH = numpy.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+DAYS_BEFORE_MONTH_ARRAY = numpy.array([0] + list(DAYS_BEFORE_MONTH[1:]))
+
+
+class NumpyTimeBuilder(EpochTimeBuilder):
+    # Builds dates and datetimes as numpy.datetime64, and durations and UTC
+    # offsets as numpy.timedelta64, in UNIT, as EpochTimeBuilder. Times
+    # have no NumPy equivalent and are built as a datetime.time. Values
+    # outside the int64 range of UNIT raise a range error.
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        return PythonTimeBuilder.build_time(hh=hh, mm=mm, ss=ss, tz=tz)
+
+    @classmethod
+    def _from_epoch_units(cls, units):
+        return numpy.datetime64(cls._range_check_datetime64(units), cls.UNIT)
+
+    @classmethod
+    def _from_duration_units(cls, units):
+        if units < INT64_MIN or units > INT64_MAX:
+            raise DayOutOfBoundsError(
+                "Duration exceeds the range of timedelta64[{0}].".format(cls.UNIT)
+            )
+
+        return numpy.timedelta64(units, cls.UNIT)
+
+    @classmethod
+    def _range_check_datetime64(cls, units):
+        if units < INT64_MIN or units > INT64_MAX:
+            raise YearOutOfBoundsError(
+                "Datetime exceeds the range of datetime64[{0}].".format(cls.UNIT)
+            )
+
+        return units
+
+
+def parse_datetimes_to_array(
+    isodatetimestrs, unit="us", delimiter="T", errors=ErrorPolicy.Raise, out=None
+):
+    # Parses an iterable of datetime strings to a numpy.datetime64 array of
+    # the given unit, normalized to UTC. If out is given, it must be a
+    # datetime64 array of one of the supported units, which is used in place
+    # of unit, and the results are written directly into it. Errors are
+    # handled as by aniso8601.batch._parse_batch, ErrorPolicy.Null leaves
+    # NaT in place of the result. A one dimensional NumPy bytes or str array
+    # is parsed by _parse_datetime_column.
+    if out is not None:
+        if out.dtype.kind != "M":
+            raise ValueError("out must be a datetime64 array.")
+
+        unit = numpy.datetime_data(out.dtype)[0]
+
+    builder = NumpyTimeBuilder.with_unit(unit)
+
+    if (
+        isinstance(isodatetimestrs, numpy.ndarray) is True
+        and isodatetimestrs.dtype.kind in ("S", "U")
+        and isodatetimestrs.ndim == 1
+        and len(delimiter) == 1
+        and ord(delimiter) < 128
+    ):
+        return _parse_datetime_column(builder, isodatetimestrs, delimiter, errors, out)
+
+    parse = partial(_parse_units, builder, delimiter=delimiter)
+
+    if out is not None:
+        return _parse_batch(parse, isodatetimestrs, errors, out)
+
+    dtype = "datetime64[{0}]".format(unit)
+
+    if errors == ErrorPolicy.Collect:
+        results, collected = _parse_batch(parse, isodatetimestrs, errors, None)
+
+        return (numpy.array(results, dtype=dtype), collected)
+
+    return numpy.array(_parse_batch(parse, isodatetimestrs, errors, None), dtype=dtype)
+
+
+def _parse_units(builder, isodatetimestr, delimiter):
+    # The units are written to the array as they are, without building a
+    # datetime64 for each
+    return builder._range_check_datetime64(
+        builder._epoch_units(
+            parse_datetime(isodatetimestr, delimiter=delimiter, builder=TupleBuilder)
+        )
+    )
+
+
+def _parse_datetime_column(builder, column, delimiter, errors, out):
+    # As parse_datetimes_to_array, rows matched by _scan_datetime_column
+    # are converted for the whole column at once, the remaining rows are
+    # parsed one at a time by parse_datetime, which also reports any errors
+    if errors not in (
+        ErrorPolicy.Raise,
+        ErrorPolicy.Skip,
+        ErrorPolicy.Null,
+        ErrorPolicy.Collect,
+    ):
+        raise ValueError("Unknown error policy.")
+
+    matched, microseconds, nanoseconds = _scan_datetime_column(column, delimiter)
+
+    multiplier = UNIT_CONVERSIONS[builder.UNIT][0]
+
+    if multiplier != 1:
+        # Leave values which won't fit the unit to the range check
+        matched &= microseconds <= (INT64_MAX - NANOSECONDS_PER_MICROSECOND) // (
+            multiplier
+        )
+        matched &= microseconds >= -(INT64_MAX // multiplier)
+
+    values = numpy.empty(len(column), dtype="int64")
+    values[matched] = builder._to_units(microseconds[matched], nanoseconds[matched])
+
+    kept = None
+    collected = []
+
+    for index in numpy.flatnonzero(~matched).tolist():
+        try:
+            values[index] = _parse_units(builder, column[index].item(), delimiter)
+        except (ValueError, NotImplementedError) as e:
+            if errors == ErrorPolicy.Raise:
+                raise
+
+            if errors == ErrorPolicy.Skip:
+                if kept is None:
+                    kept = numpy.ones(len(column), dtype="bool")
+
+                kept[index] = False
+
+                continue
+
+            if errors == ErrorPolicy.Collect:
+                collected.append((index, e))
+
+            values[index] = NAT
+
+    results = values.view("datetime64[{0}]".format(builder.UNIT))
+
+    if out is not None:
+        if kept is None:
+            out[0 : len(results)] = results
+        else:
+            numpy.copyto(out[0 : len(results)], results, where=kept)
+
+        results = out
+    elif kept is not None:
+        results = results[kept]
+
+    if errors == ErrorPolicy.Collect:
+        return (results, collected)
+
+    return results
+
+
+def _scan_datetime_column(column, delimiter):
+    # Checks and converts every row of a bytes or str array in the
+    # YYYY-MM-DDThh:mm:ss layout, with an optional fraction and Z or ±hh:mm
+    # suffix, using array operations on the character codes. Returns
+    # (matched, microseconds, nanoseconds), matched being True for the rows
+    # which passed the same range checks the PythonTimeBuilder would make,
+    # microseconds the UTC microseconds since the epoch for those rows, and
+    # nanoseconds the fraction digits below microseconds. Rows which don't
+    # match may still be valid, they are left to parse_datetime.
+    column = numpy.ascontiguousarray(column)
+
+    if column.dtype.kind == "S":
+        codes = column.view(numpy.uint8).reshape(len(column), column.dtype.itemsize)
+    else:
+        codes = column.view(numpy.uint32).reshape(
+            len(column), column.dtype.itemsize // 4
+        )
+
+    lengths = numpy.char.str_len(column)
+
+    matched = lengths >= DATETIME_COLUMN_LENGTH
+    microseconds = numpy.zeros(len(column), dtype="int64")
+    nanoseconds = numpy.zeros(len(column), dtype="int64")
+
+    if codes.shape[1] < DATETIME_COLUMN_LENGTH:
+        return (matched, microseconds, nanoseconds)
+
+    for index in DATETIME_COLUMN_DIGITS:
+        matched &= _is_digit(codes[:, index])
+
+    for index, separator in DATETIME_COLUMN_SEPARATORS:
+        matched &= codes[:, index] == ord(separator)
+
+    matched &= codes[:, 10] == ord(delimiter)
+
+    years = _get_number(codes, 0, 4)
+    months = _get_number(codes, 5, 2)
+    days = _get_number(codes, 8, 2)
+    hours = _get_number(codes, 11, 2)
+    minutes = _get_number(codes, 14, 2)
+    seconds = _get_number(codes, 17, 2)
+
+    # Day lengths are found for any month, matched is False for the rows
+    # with an invalid one
+    monthindexes = numpy.clip(months, 1, 12)
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+    matched &= years >= 1
+    matched &= (months >= 1) & (months <= 12)
+    matched &= (days >= 1) & (
+        days <= DAYS_IN_MONTH[monthindexes] + (leap & (months == 2))
+    )
+    matched &= (hours <= 24) & (minutes <= 59) & (seconds <= 59)
+    matched &= (hours != 24) | ((minutes == 0) & (seconds == 0))
+
+    # As ValidatingBuilder._date_ordinal
+    yearsbefore = years - 1
+    ordinals = (
+        yearsbefore * 365
+        + yearsbefore // 4
+        - yearsbefore // 100
+        + yearsbefore // 400
+        + DAYS_BEFORE_MONTH_ARRAY[monthindexes]
+        + days
+        + (leap & (months > 2))
+    )
+
+    microseconds += ordinals * MICROSECONDS_PER_DAY - EPOCH_MICROSECONDS
+    microseconds += (hours % 24) * MICROSECONDS_PER_HOUR
+    microseconds += minutes * MICROSECONDS_PER_MINUTE
+    microseconds += seconds * MICROSECONDS_PER_SECOND
+
+    suffixmatched = numpy.zeros(len(column), dtype="bool")
+
+    for length in numpy.unique(lengths[matched]).tolist():
+        rowindexes = numpy.flatnonzero(matched & (lengths == length))
+        rowcodes = codes[rowindexes]
+
+        # At most one split of the remaining length can match a row, the
+        # timezone and decimal signs aren't digits
+        for timezonelength in (0, 1, 6):
+            fractionlength = length - DATETIME_COLUMN_LENGTH - timezonelength
+
+            if fractionlength < 0 or fractionlength == 1:
+                # The decimal sign must be followed by at least one digit
+                continue
+
+            rowmatched, rowmicroseconds, rownanoseconds = _scan_suffix(
+                rowcodes, fractionlength, timezonelength
+            )
+
+            if fractionlength != 0:
+                # Hour 24 may only represent midnight, a fraction of 0
+                # included
+                rowmatched &= hours[rowindexes] != 24
+
+            suffixmatched[rowindexes[rowmatched]] = True
+            microseconds[rowindexes[rowmatched]] += rowmicroseconds[rowmatched]
+            nanoseconds[rowindexes[rowmatched]] = rownanoseconds[rowmatched]
+
+    matched &= suffixmatched
+
+    return (matched, microseconds, nanoseconds)
+
+
+def _scan_suffix(rowcodes, fractionlength, timezonelength):
+    # Checks and converts the fraction and timezone following the seconds,
+    # returns (matched, microseconds, nanoseconds), the microseconds of the
+    # fraction less the UTC offset, and the nanoseconds of the fraction
+    # below that
+    matched = numpy.ones(len(rowcodes), dtype="bool")
+    microseconds = numpy.zeros(len(rowcodes), dtype="int64")
+    nanoseconds = numpy.zeros(len(rowcodes), dtype="int64")
+
+    position = DATETIME_COLUMN_LENGTH
+
+    if fractionlength != 0:
+        matched &= (rowcodes[:, position] == ord(".")) | (
+            rowcodes[:, position] == ord(",")
+        )
+
+        for index in compat.range(position + 1, position + fractionlength):
+            matched &= _is_digit(rowcodes[:, index])
+
+        # Digits past nanoseconds are truncated, as by
+        # _cast_to_fractional_component for microseconds
+        digitcount = min(fractionlength - 1, 6)
+
+        microseconds += _get_number(rowcodes, position + 1, digitcount) * 10 ** (
+            6 - digitcount
+        )
+
+        if fractionlength > 7:
+            digitcount = min(fractionlength - 7, 3)
+
+            nanoseconds += _get_number(rowcodes, position + 7, digitcount) * 10 ** (
+                3 - digitcount
+            )
+
+        position += fractionlength
+
+    if timezonelength == 1:
+        matched &= rowcodes[:, position] == ord("Z")
+    elif timezonelength == 6:
+        negative = rowcodes[:, position] == ord("-")
+
+        matched &= negative | (rowcodes[:, position] == ord("+"))
+        matched &= rowcodes[:, position + 3] == ord(":")
+
+        for index in (1, 2, 4, 5):
+            matched &= _is_digit(rowcodes[:, position + index])
+
+        offsethours = _get_number(rowcodes, position + 1, 2)
+        offsetminutes = _get_number(rowcodes, position + 4, 2)
+
+        matched &= (offsethours <= 23) & (offsetminutes <= 59)
+
+        # A negative offset must not be 0
+        matched &= ~negative | (offsethours != 0) | (offsetminutes != 0)
+
+        offsets = (
+            offsethours * MICROSECONDS_PER_HOUR
+            + offsetminutes * MICROSECONDS_PER_MINUTE
+        )
+
+        microseconds -= numpy.where(negative, -offsets, offsets)
+
+    return (matched, microseconds, nanoseconds)
+
+
+def _is_digit(codes):
+    # Codes below "0" wrap around to large unsigned values
+    return (codes - ord("0")) < 10
+
+
+def _get_number(codes, start, length):
+    # Numbers for rows with anything other than digits are meaningless
+    number = numpy.zeros(len(codes), dtype="int64")
+
+    for index in compat.range(start, start + length):
+        number *= 10
+        number += (codes[:, index] - ord("0")).astype("int64")
+
+    return number
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.builders.validating import ValidatingBuilder, _get_calendar_ordinal
+
+
+class OrdinalDateBuilder(ValidatingBuilder):
+    # Builds dates as their proleptic Gregorian ordinal, as given by
+    # date.toordinal, computed from the range checked calendar, week, or
+    # ordinal date components without building a date. Calendar dates with
+    # a four digit year within the calendar are counted without the
+    # range_check_date limits.
+    # Dates in intervals are built as ordinals, everything else is built by
+    # the PythonTimeBuilder.
+    INTEGER_FIELDS = False
+
+    @classmethod
+    def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
+        if YYYY is not None and len(YYYY) == 4 and MM is not None and DD is not None:
+            # Truncated years are expanded by range_check_date
+            try:
+                ordinal = _get_calendar_ordinal(int(YYYY), int(MM), int(DD))
+            except ValueError:
+                # Left to range_check_date to raise
+                ordinal = None
+
+            if ordinal is not None:
+                return ordinal
+
+        return cls._date_ordinal(YYYY, MM, DD, Www, D, DDD)
+
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        return PythonTimeBuilder.build_time(hh=hh, mm=mm, ss=ss, tz=tz)
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        return PythonTimeBuilder.build_datetime(date, time)
+
+    @classmethod
+    def build_duration(
+        cls, PnY=None, PnM=None, PnW=None, PnD=None, TnH=None, TnM=None, TnS=None
+    ):
+        return PythonTimeBuilder.build_duration(
+            PnY=PnY, PnM=PnM, PnW=PnW, PnD=PnD, TnH=TnH, TnM=TnM, TnS=TnS
+        )
+
+    @classmethod
+    def build_interval(cls, start=None, end=None, duration=None):
+        return tuple(
+            _get_ordinal(value)
+            for value in PythonTimeBuilder.build_interval(
+                start=start, end=end, duration=duration
+            )
+        )
+
+    @classmethod
+    def build_repeating_interval(cls, R=None, Rnn=None, interval=None):
+        return cls._ordinal_generator(
+            PythonTimeBuilder.build_repeating_interval(R=R, Rnn=Rnn, interval=interval)
+        )
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        return PythonTimeBuilder.build_timezone(
+            negative=negative, Z=Z, hh=hh, mm=mm, name=name
+        )
+
+    @staticmethod
+    def _ordinal_generator(generator):
+        for value in generator:
+            yield _get_ordinal(value)
+
+
+def _get_ordinal(value):
+    # Dates are returned as their ordinal, datetimes as is
+    if type(value) is datetime.date:
+        return value.toordinal()
+
+    return value
@@ -0,0 +1,509 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import struct
+
+from aniso8601 import compat
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    RepeatingIntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+    TupleBuilder,
+)
+
+
+class RecordKind(object):
+    # The first byte of every record, the rest of the layout is fixed for
+    # each kind
+    Date, Time, Datetime, Duration, Interval, RepeatingInterval, Timezone = list(
+        compat.range(1, 8)
+    )
+
+
+# Fractions are kept to this many digits, the most the fraction field holds
+MAX_FRACTION_DIGITS = 18
+
+# Field layouts, little endian with no padding. A mask has a bit set for
+# each component present, in component order.
+#
+# Date - mask, YYYY, MM, DD, Www, D, DDD
+DATE_FORMAT = "BHBBBBH"
+# Timezone - flags, hh, mm
+TIMEZONE_FORMAT = "BBB"
+# Time - mask, hh, mm, ss, fraction, fraction digits, timezone
+TIME_FORMAT = "BBBBQB" + TIMEZONE_FORMAT
+DATETIME_FORMAT = DATE_FORMAT + TIME_FORMAT
+# Duration - mask, PnY, PnM, PnW, PnD, TnH, TnM, TnS, fraction,
+# fraction digits
+DURATION_FORMAT = "B7IQB"
+# Interval endpoint - kind, 0 for none, and a datetime layout, dates and
+# times leave the other half empty
+ENDPOINT_FORMAT = "B" + DATETIME_FORMAT
+# Interval - start, end, duration, an empty duration for none
+INTERVAL_FORMAT = ENDPOINT_FORMAT + ENDPOINT_FORMAT + DURATION_FORMAT
+# Repeating interval - flags, Rnn, interval
+REPEATING_INTERVAL_FORMAT = "BI" + INTERVAL_FORMAT
+
+RECORD_STRUCTS = {
+    RecordKind.Date: struct.Struct("<B" + DATE_FORMAT),
+    RecordKind.Time: struct.Struct("<B" + TIME_FORMAT),
+    RecordKind.Datetime: struct.Struct("<B" + DATETIME_FORMAT),
+    RecordKind.Duration: struct.Struct("<B" + DURATION_FORMAT),
+    RecordKind.Interval: struct.Struct("<B" + INTERVAL_FORMAT),
+    RecordKind.RepeatingInterval: struct.Struct("<B" + REPEATING_INTERVAL_FORMAT),
+    RecordKind.Timezone: struct.Struct("<B" + TIMEZONE_FORMAT),
+}
+
+# The record kind, read before the rest of the record
+KIND_STRUCT = struct.Struct("<B")
+
+# The date mask bits above this hold the number of digits a truncated
+# YYYY is short of four, 0 for four or more
+YEAR_DIGITS_SHIFT = 6
+
+# Timezone flags
+TIMEZONE_PRESENT = 1
+TIMEZONE_Z = 1 << 1
+TIMEZONE_NEGATIVE = 1 << 2
+TIMEZONE_HOURS = 1 << 3
+TIMEZONE_MINUTES = 1 << 4
+TIMEZONE_EXTENDED = 1 << 5
+
+# Repeating interval flags
+REPEATING_R = 1
+REPEATING_RNN = 1 << 1
+
+# Date and time masks with YYYY, MM, and DD, or hh, mm, and ss set
+CALENDAR_DATE_MASK = 0b111
+FULL_TIME_MASK = 0b111
+
+# Two digit strings for every value of a B field
+_TWO_DIGITS = tuple("{0:02d}".format(value) for value in compat.range(256))
+
+_EMPTY_DATE = [0] * 7
+_EMPTY_TIME = [0] * 9
+_EMPTY_DURATION = [0] * 10
+
+
+def pack(parsetuple):
+    # Packs a TupleBuilder tuple as a record of RECORD_STRUCTS[kind].size
+    # bytes. Components are kept as integers, so leading zeros of duration
+    # components are not kept, and fractions are cut to
+    # MAX_FRACTION_DIGITS.
+    kind = _TUPLE_KINDS.get(type(parsetuple))
+
+    if kind is None:
+        raise ValueError("{0!r} is not a TupleBuilder tuple.".format(parsetuple))
+
+    try:
+        return RECORD_STRUCTS[kind].pack(kind, *_PACKERS[kind](parsetuple))
+    except struct.error:
+        raise ValueError("{0!r} is out of range for a record.".format(parsetuple))
+
+
+def pack_many(parsetuples, out=None):
+    # Packs each TupleBuilder tuple, appending the records to out, a
+    # bytearray, or an object with a write method, like a file opened
+    # for binary writing, a new bytearray is returned if out is not given
+    if out is None:
+        out = bytearray()
+
+    if isinstance(out, bytearray):
+        for parsetuple in parsetuples:
+            out += pack(parsetuple)
+    else:
+        for parsetuple in parsetuples:
+            out.write(pack(parsetuple))
+
+    return out
+
+
+def unpack(buffer, builder=TupleBuilder, offset=0):
+    # Builds the record starting at offset in buffer with the given builder
+    recordstruct = _get_record_struct(buffer, offset)
+
+    return _build_record(builder, recordstruct.unpack_from(buffer, offset))
+
+
+def iter_unpack(data, builder=TupleBuilder):
+    # Yields each record in data built with the given builder, data is a
+    # bytes-like object, like a memory map, or an object with a read
+    # method, like a file opened for binary reading
+    if hasattr(data, "read"):
+        while True:
+            kindbyte = data.read(1)
+
+            if not kindbyte:
+                return
+
+            recordstruct = _get_record_struct(kindbyte, 0)
+            record = kindbyte + data.read(recordstruct.size - 1)
+
+            if len(record) != recordstruct.size:
+                raise ValueError("Record is truncated.")
+
+            yield _build_record(builder, recordstruct.unpack(record))
+    else:
+        offset = 0
+        datalength = len(data)
+
+        while offset < datalength:
+            recordstruct = _get_record_struct(data, offset)
+
+            if offset + recordstruct.size > datalength:
+                raise ValueError("Record is truncated.")
+
+            yield _build_record(builder, recordstruct.unpack_from(data, offset))
+
+            offset += recordstruct.size
+
+
+def _get_record_struct(buffer, offset):
+    kind = KIND_STRUCT.unpack_from(buffer, offset)[0]
+
+    if kind not in RECORD_STRUCTS:
+        raise ValueError("{0} is not a record kind.".format(kind))
+
+    return RECORD_STRUCTS[kind]
+
+
+def _build_record(builder, values):
+    # Calendar datetimes with hh, mm, and ss go to build_datetime_fields
+    # for builders setting INTEGER_FIELDS, as they do when parsed
+    if (
+        values[0] == RecordKind.Datetime
+        and values[1] == CALENDAR_DATE_MASK
+        and values[8] == FULL_TIME_MASK
+        and getattr(builder, "INTEGER_FIELDS", False) is True
+    ):
+        return builder.build_datetime_fields(
+            values[2],
+            values[3],
+            values[4],
+            values[9],
+            values[10],
+            values[11],
+            values[12],
+            values[13],
+            _unpack_timezone(values, 14)[0],
+        )
+
+    parsetuple = _UNPACKERS[values[0]](values, 1)[0]
+
+    if builder is TupleBuilder:
+        return parsetuple
+
+    return builder._build_object(parsetuple)
+
+
+def _pack_date(date):
+    mask = 0
+    fields = []
+
+    for bit, component in enumerate(date):
+        if component is None:
+            fields.append(0)
+        else:
+            mask |= 1 << bit
+            fields.append(int(component))
+
+    if date.YYYY is not None and len(date.YYYY) < 4:
+        mask |= (4 - len(date.YYYY)) << YEAR_DIGITS_SHIFT
+
+    return [mask] + fields
+
+
+def _unpack_date(values, index):
+    mask, YYYY, MM, DD, Www, D, DDD = values[index : index + 7]
+
+    if mask & 1:
+        YYYY = "{0:0{1}d}".format(YYYY, 4 - (mask >> YEAR_DIGITS_SHIFT))
+    else:
+        YYYY = None
+
+    return (
+        DateTuple(
+            YYYY,
+            _TWO_DIGITS[MM] if mask & 2 else None,
+            _TWO_DIGITS[DD] if mask & 4 else None,
+            _TWO_DIGITS[Www] if mask & 8 else None,
+            str(D) if mask & 16 else None,
+            "{0:03d}".format(DDD) if mask & 32 else None,
+        ),
+        index + 7,
+    )
+
+
+def _pack_time(time):
+    return _pack_components(time[0:3]) + _pack_timezone(time.tz)
+
+
+def _unpack_time(values, index):
+    mask, hh, mm, ss, fraction, fractiondigits = values[index : index + 6]
+
+    components = [
+        _TWO_DIGITS[hh] if mask & 1 else None,
+        _TWO_DIGITS[mm] if mask & 2 else None,
+        _TWO_DIGITS[ss] if mask & 4 else None,
+    ]
+
+    if fractiondigits > 0:
+        _add_fraction(components, mask, fraction, fractiondigits)
+
+    tz, index = _unpack_timezone(values, index + 6)
+
+    return TimeTuple(components[0], components[1], components[2], tz), index
+
+
+def _pack_datetime(datetime):
+    return _pack_date(datetime.date) + _pack_time(datetime.time)
+
+
+def _unpack_datetime(values, index):
+    date, index = _unpack_date(values, index)
+    time, index = _unpack_time(values, index)
+
+    return DatetimeTuple(date, time), index
+
+
+def _pack_duration(duration):
+    return _pack_components(duration)
+
+
+def _unpack_duration(values, index):
+    mask = values[index]
+
+    if mask == 0:
+        return None, index + 10
+
+    components = [
+        str(values[index + bit + 1]) if mask & (1 << bit) else None
+        for bit in compat.range(7)
+    ]
+
+    if values[index + 9] > 0:
+        _add_fraction(components, mask, values[index + 8], values[index + 9])
+
+    return DurationTuple(*components), index + 10
+
+
+def _pack_interval(interval):
+    if interval.duration is None:
+        duration = _EMPTY_DURATION
+    else:
+        duration = _pack_duration(interval.duration)
+
+    return _pack_endpoint(interval.start) + _pack_endpoint(interval.end) + duration
+
+
+def _unpack_interval(values, index):
+    start, index = _unpack_endpoint(values, index)
+    end, index = _unpack_endpoint(values, index)
+    duration, index = _unpack_duration(values, index)
+
+    return IntervalTuple(start, end, duration), index
+
+
+def _pack_repeating_interval(repeatinginterval):
+    flags = 0
+    Rnn = 0
+
+    if repeatinginterval.R is True:
+        flags |= REPEATING_R
+
+    if repeatinginterval.Rnn is not None:
+        flags |= REPEATING_RNN
+        Rnn = int(repeatinginterval.Rnn)
+
+    return [flags, Rnn] + _pack_interval(repeatinginterval.interval)
+
+
+def _unpack_repeating_interval(values, index):
+    flags, Rnn = values[index : index + 2]
+    interval, index = _unpack_interval(values, index + 2)
+
+    return (
+        RepeatingIntervalTuple(
+            bool(flags & REPEATING_R),
+            str(Rnn) if flags & REPEATING_RNN else None,
+            interval,
+        ),
+        index,
+    )
+
+
+def _pack_timezone(tz):
+    if tz is None:
+        return [0, 0, 0]
+
+    flags = TIMEZONE_PRESENT
+    hh = 0
+    mm = 0
+
+    if tz.Z is True:
+        flags |= TIMEZONE_Z
+
+    if tz.negative is True:
+        flags |= TIMEZONE_NEGATIVE
+
+    if tz.hh is not None:
+        flags |= TIMEZONE_HOURS
+        hh = int(tz.hh)
+
+    if tz.mm is not None:
+        flags |= TIMEZONE_MINUTES
+        mm = int(tz.mm)
+
+    if ":" in tz.name:
+        flags |= TIMEZONE_EXTENDED
+
+    # Only names as written by the parser can be rebuilt
+    if _get_timezone_name(flags, hh, mm) != tz.name:
+        raise ValueError('Timezone name "{0}" cannot be packed.'.format(tz.name))
+
+    return [flags, hh, mm]
+
+
+def _unpack_timezone(values, index):
+    # Timezone tuples are immutable, so they are shared between records
+    key = values[index : index + 3]
+
+    if key not in _timezones:
+        flags, hh, mm = key
+
+        if flags & TIMEZONE_PRESENT:
+            _timezones[key] = TimezoneTuple(
+                bool(flags & TIMEZONE_NEGATIVE),
+                True if flags & TIMEZONE_Z else None,
+                _TWO_DIGITS[hh] if flags & TIMEZONE_HOURS else None,
+                _TWO_DIGITS[mm] if flags & TIMEZONE_MINUTES else None,
+                _get_timezone_name(flags, hh, mm),
+            )
+        else:
+            _timezones[key] = None
+
+    return _timezones[key], index + 3
+
+
+def _get_timezone_name(flags, hh, mm):
+    if flags & TIMEZONE_Z:
+        return "Z"
+
+    name = "-" if flags & TIMEZONE_NEGATIVE else "+"
+
+    if flags & TIMEZONE_HOURS:
+        name += _TWO_DIGITS[hh]
+
+    if flags & TIMEZONE_MINUTES:
+        if flags & TIMEZONE_EXTENDED:
+            name += ":"
+
+        name += _TWO_DIGITS[mm]
+
+    return name
+
+
+def _pack_endpoint(endpoint):
+    if type(endpoint) is DatetimeTuple:
+        return [RecordKind.Datetime] + _pack_datetime(endpoint)
+
+    if type(endpoint) is DateTuple:
+        return [RecordKind.Date] + _pack_date(endpoint) + _EMPTY_TIME
+
+    if type(endpoint) is TimeTuple:
+        return [RecordKind.Time] + _EMPTY_DATE + _pack_time(endpoint)
+
+    return [0] + _EMPTY_DATE + _EMPTY_TIME
+
+
+def _unpack_endpoint(values, index):
+    kind = values[index]
+    datetime, index = _unpack_datetime(values, index + 1)
+
+    if kind == RecordKind.Datetime:
+        return datetime, index
+
+    if kind == RecordKind.Date:
+        return datetime.date, index
+
+    if kind == RecordKind.Time:
+        return datetime.time, index
+
+    return None, index
+
+
+def _pack_components(components):
+    # Packs the mask, the integer part of each component, and the
+    # fraction, which the parser only allows on the last component
+    mask = 0
+    fields = []
+    fraction = 0
+    fractiondigits = 0
+
+    for bit, component in enumerate(components):
+        if component is None:
+            fields.append(0)
+        else:
+            mask |= 1 << bit
+
+            integerstr, _, fractionstr = component.partition(".")
+            fractionstr = fractionstr[:MAX_FRACTION_DIGITS]
+
+            fields.append(int(integerstr))
+
+            if fractionstr:
+                fraction = int(fractionstr)
+                fractiondigits = len(fractionstr)
+
+    return [mask] + fields + [fraction, fractiondigits]
+
+
+def _add_fraction(components, mask, fraction, fractiondigits):
+    # The fraction belongs to the last component present
+    last = mask.bit_length() - 1
+
+    components[last] = "{0}.{1:0{2}d}".format(
+        components[last], fraction, fractiondigits
+    )
+
+
+_timezones = {}
+
+_TUPLE_KINDS = {
+    DateTuple: RecordKind.Date,
+    TimeTuple: RecordKind.Time,
+    DatetimeTuple: RecordKind.Datetime,
+    DurationTuple: RecordKind.Duration,
+    IntervalTuple: RecordKind.Interval,
+    RepeatingIntervalTuple: RecordKind.RepeatingInterval,
+    TimezoneTuple: RecordKind.Timezone,
+}
+
+_PACKERS = {
+    RecordKind.Date: _pack_date,
+    RecordKind.Time: _pack_time,
+    RecordKind.Datetime: _pack_datetime,
+    RecordKind.Duration: _pack_duration,
+    RecordKind.Interval: _pack_interval,
+    RecordKind.RepeatingInterval: _pack_repeating_interval,
+    RecordKind.Timezone: _pack_timezone,
+}
+
+_UNPACKERS = {
+    RecordKind.Date: _unpack_date,
+    RecordKind.Time: _unpack_time,
+    RecordKind.Datetime: _unpack_datetime,
+    RecordKind.Duration: _unpack_duration,
+    RecordKind.Interval: _unpack_interval,
+    RecordKind.RepeatingInterval: _unpack_repeating_interval,
+    RecordKind.Timezone: _unpack_timezone,
+}
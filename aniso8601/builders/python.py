@@ -7,7 +7,7 @@
 # of the BSD license.  See the LICENSE file for details.
 
 import datetime
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from functools import partial
 
 from aniso8601.builders import (
@@ -32,7 +32,7 @@ from aniso8601.exceptions import (
     WeekOutOfBoundsError,
     YearOutOfBoundsError,
 )
-from aniso8601.utcoffset import UTCOffset
+from aniso8601.utcoffset import intern_utcoffset
 
 DAYS_PER_YEAR = 365
 DAYS_PER_MONTH = 30
@@ -57,6 +57,9 @@ MICROSECONDS_PER_YEAR = DAYS_PER_YEAR * MICROSECONDS_PER_DAY
 
 TIMEDELTA_MAX_DAYS = datetime.timedelta.max.days
 
+# The most tzinfos kept by PythonTimeBuilder._build_tzinfo
+TZINFO_CACHE_SIZE = 1024
+
 FractionalComponent = namedtuple(
     "FractionalComponent", ["principal", "microsecondremainder"]
 )
@@ -219,6 +222,10 @@ class PythonTimeBuilder(BaseTimeBuilder):
         "TnS": DURATION_TNS_LIMIT,
     }
 
+    # Built timezones for each builder and TimezoneTuple, oldest first, see
+    # _build_tzinfo
+    _tzinfos = OrderedDict()
+
     @classmethod
     def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
         YYYY, MM, DD, Www, D, DDD = cls.range_check_date(YYYY, MM, DD, Www, D, DDD)
@@ -241,13 +248,58 @@ class PythonTimeBuilder(BaseTimeBuilder):
     def build_time(cls, hh=None, mm=None, ss=None, tz=None):
         # Builds a time from the given parts, handling fractional arguments
         # where necessary
+        hh, mm, ss, tz = cls.range_check_time(hh, mm, ss, tz)
+
+        hours, minutes, seconds, microseconds = PythonTimeBuilder._time_components(
+            hh, mm, ss
+        )
+
+        # Datetimes don't handle fractional components, so we use a timedelta
+        if tz is not None:
+            return (
+                datetime.datetime(
+                    1, 1, 1, hour=hours, minute=minutes, tzinfo=cls._build_tzinfo(tz)
+                )
+                + datetime.timedelta(seconds=seconds, microseconds=microseconds)
+            ).timetz()
+
+        return (
+            datetime.datetime(1, 1, 1, hour=hours, minute=minutes)
+            + datetime.timedelta(seconds=seconds, microseconds=microseconds)
+        ).time()
+
+    @classmethod
+    def _build_tzinfo(cls, tz):
+        # The parsers share a TimezoneTuple for each timezone string, and
+        # the tzinfo built from it is shared in turn, so the range checks
+        # only run once for each. Tuples which fail them are not kept. Once
+        # TZINFO_CACHE_SIZE are kept the oldest is dropped for each new one.
+        # The tzinfo is kept in a local, so an eviction by another thread
+        # after the lookup can't lose it.
+        key = (cls, tz)
+
+        tzinfo = PythonTimeBuilder._tzinfos.get(key)
+
+        if tzinfo is None:
+            tzinfo = cls._build_object(tz)
+
+            if len(PythonTimeBuilder._tzinfos) >= TZINFO_CACHE_SIZE:
+                PythonTimeBuilder._tzinfos.popitem(last=False)
+
+            PythonTimeBuilder._tzinfos[key] = tzinfo
+
+        return tzinfo
+
+    @staticmethod
+    def _time_components(hh, mm, ss):
+        # Given range checked hh, mm, ss, returns hours, minutes, seconds,
+        # and microseconds with fractional components distributed and
+        # midnight moved into range
         hours = 0
         minutes = 0
         seconds = 0
         microseconds = 0
 
-        hh, mm, ss, tz = cls.range_check_time(hh, mm, ss, tz)
-
         if type(hh) is FractionalComponent:
             hours = hh.principal
             microseconds = hh.microsecondremainder
@@ -281,19 +333,7 @@ class PythonTimeBuilder(BaseTimeBuilder):
         if hours == 24:
             hours = 0
 
-        # Datetimes don't handle fractional components, so we use a timedelta
-        if tz is not None:
-            return (
-                datetime.datetime(
-                    1, 1, 1, hour=hours, minute=minutes, tzinfo=cls._build_object(tz)
-                )
-                + datetime.timedelta(seconds=seconds, microseconds=microseconds)
-            ).timetz()
-
-        return (
-            datetime.datetime(1, 1, 1, hour=hours, minute=minutes)
-            + datetime.timedelta(seconds=seconds, microseconds=microseconds)
-        ).time()
+        return (hours, minutes, seconds, microseconds)
 
     @classmethod
     def build_datetime(cls, date, time):
@@ -408,7 +448,7 @@ class PythonTimeBuilder(BaseTimeBuilder):
 
         if Z is True:
             # Z -> UTC
-            return UTCOffset(name="UTC", minutes=0)
+            return intern_utcoffset(name="UTC", minutes=0)
 
         tzhour = int(hh)
 
@@ -418,9 +458,9 @@ class PythonTimeBuilder(BaseTimeBuilder):
             tzminute = 0
 
         if negative is True:
-            return UTCOffset(name=name, minutes=-(tzhour * 60 + tzminute))
+            return intern_utcoffset(name=name, minutes=-(tzhour * 60 + tzminute))
 
-        return UTCOffset(name=name, minutes=tzhour * 60 + tzminute)
+        return intern_utcoffset(name=name, minutes=tzhour * 60 + tzminute)
 
     @classmethod
     def range_check_duration(
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+from collections import OrderedDict
+
+from aniso8601.builders.python import (
+    MICROSECONDS_PER_SECOND,
+    SECONDS_PER_DAY,
+    TZINFO_CACHE_SIZE,
+    PythonTimeBuilder,
+)
+from aniso8601.exceptions import YearOutOfBoundsError
+from aniso8601.utcoffset import get_canonical_minutes
+
+
+class StdlibTimezoneBuilder(PythonTimeBuilder):
+    # Builds timezones as datetime.timezone instead of UTCOffset, the offset
+    # is then looked up in C when comparing, hashing, or subtracting aware
+    # times and datetimes. Z is built as datetime.timezone.utc, other
+    # timezones with a canonical name are shared for equal offsets and
+    # names. Requires datetime.timezone, added in Python 3.2.
+
+    # Built timezones with a canonical name, keyed by offset in minutes and
+    # name, see build_timezone
+    _timezones = {}
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        negative, Z, hh, mm, name = cls.range_check_timezone(negative, Z, hh, mm, name)
+
+        if Z is True:
+            # Z -> UTC
+            return datetime.timezone.utc
+
+        tzhour = int(hh)
+
+        if mm is not None:
+            tzminute = int(mm)
+        else:
+            tzminute = 0
+
+        if negative is True:
+            minutes = -(tzhour * 60 + tzminute)
+        else:
+            minutes = tzhour * 60 + tzminute
+
+        # Only timezones with a canonical name spelling the same offset are
+        # shared, so the table is bounded, others are built every time
+        key = (minutes, name)
+
+        timezone = StdlibTimezoneBuilder._timezones.get(key)
+
+        if timezone is None:
+            if name is None:
+                timezone = datetime.timezone(datetime.timedelta(minutes=minutes))
+            else:
+                timezone = datetime.timezone(datetime.timedelta(minutes=minutes), name)
+
+            if get_canonical_minutes(name) == minutes:
+                StdlibTimezoneBuilder._timezones[key] = timezone
+
+        return timezone
+
+
+class UTCTimeBuilder(StdlibTimezoneBuilder):
+    # Builds datetimes with a timezone in UTC, the offset is applied to the
+    # fields while building instead of attaching the timezone and converting
+    # with astimezone. Datetimes are aware, with datetime.timezone.utc, or
+    # naive if NAIVE is True. Datetimes without a timezone are built as is,
+    # times are not converted as there is no date to carry the offset to.
+    INTEGER_FIELDS = True
+    NAIVE = False
+
+    # UTC offsets in seconds for each builder and TimezoneTuple, oldest
+    # first, see _utc_offset_seconds
+    _offsets = OrderedDict()
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        if time.tz is None:
+            return super(UTCTimeBuilder, cls).build_datetime(date, time)
+
+        dateobject = cls._build_object(date)
+
+        hh, mm, ss, tz = cls.range_check_time(time.hh, time.mm, time.ss, time.tz)
+
+        hours, minutes, seconds, microseconds = PythonTimeBuilder._time_components(
+            hh, mm, ss
+        )
+
+        try:
+            return datetime.datetime(
+                dateobject.year,
+                dateobject.month,
+                dateobject.day,
+                hours,
+                minutes,
+                tzinfo=cls._utc_tzinfo(),
+            ) + datetime.timedelta(
+                seconds=seconds - cls._utc_offset_seconds(tz),
+                microseconds=microseconds,
+            )
+        except OverflowError:
+            raise YearOutOfBoundsError("Datetime is out of range in UTC.")
+
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        if tz is None or ss > 59:
+            return super(UTCTimeBuilder, cls).build_datetime_fields(
+                YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+            )
+
+        try:
+            datetimeobject = datetime.datetime(
+                YYYY,
+                MM,
+                DD,
+                hh,
+                mm,
+                ss,
+                fraction * MICROSECONDS_PER_SECOND // 10**fractiondigits,
+                tzinfo=cls._utc_tzinfo(),
+            )
+        except ValueError:
+            # Midnight as hour 24, and fields out of range, are left to
+            # build_datetime and the range_check_* methods
+            return super(UTCTimeBuilder, cls).build_datetime_fields(
+                YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+            )
+
+        try:
+            return datetimeobject - datetime.timedelta(
+                seconds=cls._utc_offset_seconds(tz)
+            )
+        except OverflowError:
+            raise YearOutOfBoundsError("Datetime is out of range in UTC.")
+
+    @classmethod
+    def _utc_tzinfo(cls):
+        if cls.NAIVE is True:
+            return None
+
+        return datetime.timezone.utc
+
+    @classmethod
+    def _utc_offset_seconds(cls, tz):
+        # Once TZINFO_CACHE_SIZE are kept the oldest is dropped for each new
+        # one, as by _build_tzinfo
+        key = (cls, tz)
+
+        seconds = UTCTimeBuilder._offsets.get(key)
+
+        if seconds is None:
+            offset = cls._build_tzinfo(tz).utcoffset(None)
+            seconds = offset.days * SECONDS_PER_DAY + offset.seconds
+
+            if len(UTCTimeBuilder._offsets) >= TZINFO_CACHE_SIZE:
+                UTCTimeBuilder._offsets.popitem(last=False)
+
+            UTCTimeBuilder._offsets[key] = seconds
+
+        return seconds
+
+
+class NaiveUTCTimeBuilder(UTCTimeBuilder):
+    # Builds datetimes with a timezone as naive datetimes in UTC
+    NAIVE = True
+
+
+def get_utc_builder(builder):
+    # The builder used for to_utc parses, UTC builders are used as is
+    if builder is PythonTimeBuilder or builder is StdlibTimezoneBuilder:
+        return UTCTimeBuilder
+
+    if isinstance(builder, type) and issubclass(builder, UTCTimeBuilder):
+        return builder
+
+    raise ValueError("to_utc is only supported for the PythonTimeBuilder.")
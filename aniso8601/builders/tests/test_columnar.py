@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import unittest
+
+import aniso8601
+from aniso8601.batch import ErrorPolicy
+from aniso8601.builders import (
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+)
+from aniso8601.builders.columnar import (
+    NO_OFFSET,
+    NULL_RESOLUTION,
+    ColumnarTimeBuilder,
+    DateColumns,
+    DateRow,
+    DatetimeColumns,
+    DatetimeRow,
+    TimeColumns,
+    TimeRow,
+    parse_dates_to_columns,
+    parse_datetimes_to_columns,
+    parse_times_to_columns,
+)
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    HoursOutOfBoundsError,
+    ISOFormatError,
+    MonthOutOfBoundsError,
+)
+from aniso8601.resolution import DateResolution, TimeResolution
+
+
+class TestColumnarTimeBuilder(unittest.TestCase):
+    def test_build_date(self):
+        testtuples = (
+            ({"YYYY": "2013"}, DateRow(2013, 1, 1, DateResolution.Year)),
+            ({"YYYY": "19"}, DateRow(1900, 1, 1, DateResolution.Year)),
+            ({"YYYY": "1981", "MM": "04"}, DateRow(1981, 4, 1, DateResolution.Month)),
+            (
+                {"YYYY": "1981", "MM": "04", "DD": "05"},
+                DateRow(1981, 4, 5, DateResolution.Day),
+            ),
+            (
+                {"YYYY": "2004", "Www": "53"},
+                DateRow(2004, 12, 27, DateResolution.Week),
+            ),
+            (
+                {"YYYY": "2004", "Www": "53", "D": "6"},
+                DateRow(2005, 1, 1, DateResolution.Weekday),
+            ),
+            (
+                {"YYYY": "1981", "DDD": "095"},
+                DateRow(1981, 4, 5, DateResolution.Ordinal),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                ColumnarTimeBuilder.build_date(**testtuple[0]), testtuple[1]
+            )
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            ColumnarTimeBuilder.build_date(YYYY="1981", MM="13")
+
+        with self.assertRaises(DayOutOfBoundsError):
+            ColumnarTimeBuilder.build_date(YYYY="1981", DDD="366")
+
+    def test_build_time(self):
+        testtuples = (
+            ({"hh": "01"}, TimeRow(1, 0, 0, 0, NO_OFFSET, TimeResolution.Hours)),
+            (
+                {"hh": "01", "mm": "30.5"},
+                TimeRow(1, 30, 30, 0, NO_OFFSET, TimeResolution.Minutes),
+            ),
+            (
+                {"hh": "23", "mm": "21", "ss": "28.512400"},
+                TimeRow(23, 21, 28, 512400, NO_OFFSET, TimeResolution.Seconds),
+            ),
+            ({"hh": "24"}, TimeRow(0, 0, 0, 0, NO_OFFSET, TimeResolution.Hours)),
+            (
+                {"hh": "01", "tz": TimezoneTuple(False, True, None, None, "Z")},
+                TimeRow(1, 0, 0, 0, 0, TimeResolution.Hours),
+            ),
+            (
+                {"hh": "01", "tz": TimezoneTuple(False, None, "01", "30", "+01:30")},
+                TimeRow(1, 0, 0, 0, 90, TimeResolution.Hours),
+            ),
+            (
+                {"hh": "01", "tz": TimezoneTuple(True, None, "12", None, "-12")},
+                TimeRow(1, 0, 0, 0, -720, TimeResolution.Hours),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                ColumnarTimeBuilder.build_time(**testtuple[0]), testtuple[1]
+            )
+
+        with self.assertRaises(HoursOutOfBoundsError):
+            ColumnarTimeBuilder.build_time(hh="25")
+
+    def test_build_datetime(self):
+        self.assertEqual(
+            ColumnarTimeBuilder.build_datetime(
+                DateTuple("1981", None, None, None, None, "095"),
+                TimeTuple(
+                    "23", "21", None, TimezoneTuple(True, None, "05", None, "-05")
+                ),
+            ),
+            DatetimeRow(1981, 4, 5, 23, 21, 0, 0, -300, TimeResolution.Minutes),
+        )
+
+    def test_build_datetime_fields(self):
+        testtuples = (
+            (
+                (1981, 4, 5, 23, 21, 28, 5124, 4, None),
+                DatetimeRow(
+                    1981, 4, 5, 23, 21, 28, 512400, NO_OFFSET, TimeResolution.Seconds
+                ),
+            ),
+            (
+                (
+                    1981,
+                    4,
+                    5,
+                    23,
+                    21,
+                    28,
+                    0,
+                    0,
+                    TimezoneTuple(True, None, "05", None, "-05"),
+                ),
+                DatetimeRow(1981, 4, 5, 23, 21, 28, 0, -300, TimeResolution.Seconds),
+            ),
+            # Midnight is handled as by build_datetime
+            (
+                (1981, 4, 5, 24, 0, 0, 0, 0, None),
+                DatetimeRow(1981, 4, 5, 0, 0, 0, 0, NO_OFFSET, TimeResolution.Seconds),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                ColumnarTimeBuilder.build_datetime_fields(*testtuple[0]), testtuple[1]
+            )
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            ColumnarTimeBuilder.build_datetime_fields(1981, 13, 5, 0, 0, 0, 0, 0, None)
+
+    def test_build_unsupported(self):
+        duration = DurationTuple(None, None, None, "1", None, None, None)
+        interval = IntervalTuple(
+            DateTuple("1981", "04", "05", None, None, None), None, duration
+        )
+
+        with self.assertRaises(NotImplementedError):
+            ColumnarTimeBuilder.build_duration(PnD="1")
+
+        with self.assertRaises(NotImplementedError):
+            ColumnarTimeBuilder.build_interval(
+                start=DateTuple("1981", "04", "05", None, None, None),
+                duration=duration,
+            )
+
+        with self.assertRaises(NotImplementedError):
+            ColumnarTimeBuilder.build_repeating_interval(
+                R=False, Rnn="2", interval=interval
+            )
+
+    def test_build_timezone(self):
+        self.assertEqual(ColumnarTimeBuilder.build_timezone(Z=True, name="Z"), 0)
+        self.assertEqual(
+            ColumnarTimeBuilder.build_timezone(
+                negative=True, hh="01", mm="30", name="-01:30"
+            ),
+            -90,
+        )
+
+    def test_parse(self):
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28.512400+01:30", builder=ColumnarTimeBuilder
+            ),
+            DatetimeRow(1981, 4, 5, 23, 21, 28, 512400, 90, TimeResolution.Seconds),
+        )
+
+
+class TestColumns(unittest.TestCase):
+    def test_columns(self):
+        columns = DatetimeColumns()
+
+        self.assertEqual(len(columns), 0)
+
+        row = DatetimeRow(1981, 4, 5, 23, 21, 28, 512400, -90, TimeResolution.Seconds)
+
+        columns.append(row)
+        columns.append_null()
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns[0], row)
+        self.assertEqual(
+            columns[1], DatetimeRow(0, 0, 0, 0, 0, 0, 0, NO_OFFSET, NULL_RESOLUTION)
+        )
+        self.assertEqual(list(columns), [columns[0], columns[1]])
+        self.assertFalse(columns.is_null(0))
+        self.assertTrue(columns.is_null(1))
+
+        self.assertEqual(columns.year.typecode, "H")
+        self.assertEqual(columns.microsecond.typecode, "I")
+        self.assertEqual(columns.microsecond.itemsize, 4)
+        self.assertEqual(list(columns.year), [1981, 0])
+        self.assertEqual(list(columns.microsecond), [512400, 0])
+        self.assertEqual(list(columns.offset), [-90, NO_OFFSET])
+
+        for columnstype, fields in (
+            (DateColumns, DateRow._fields),
+            (TimeColumns, TimeRow._fields),
+        ):
+            columns = columnstype()
+
+            for field in fields:
+                self.assertEqual(len(getattr(columns, field)), 0)
+
+
+class TestColumnarFunctions(unittest.TestCase):
+    def test_parse_dates_to_columns(self):
+        columns = parse_dates_to_columns(["1981-04-05", "1981-095", "19"])
+
+        self.assertIs(type(columns), DateColumns)
+        self.assertEqual(list(columns.year), [1981, 1981, 1900])
+        self.assertEqual(
+            list(columns.resolution),
+            [DateResolution.Day, DateResolution.Ordinal, DateResolution.Year],
+        )
+
+        # Appended to out
+        self.assertIs(parse_dates_to_columns(["1981-W14-7"], out=columns), columns)
+        self.assertEqual(columns[3], DateRow(1981, 4, 5, DateResolution.Weekday))
+
+    def test_parse_times_to_columns(self):
+        columns = parse_times_to_columns(["23:21:28.512400Z", "232128-0130"])
+
+        self.assertIs(type(columns), TimeColumns)
+        self.assertEqual(
+            list(columns),
+            [
+                TimeRow(23, 21, 28, 512400, 0, TimeResolution.Seconds),
+                TimeRow(23, 21, 28, 0, -90, TimeResolution.Seconds),
+            ],
+        )
+
+    def test_parse_datetimes_to_columns(self):
+        isodatetimestrs = [
+            "1981-04-05T23:21:28.512400+01:30",
+            "1981-13-05T23:21:28",
+            "1981095T23",
+            "bad",
+        ]
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            parse_datetimes_to_columns(isodatetimestrs)
+
+        columns = parse_datetimes_to_columns(isodatetimestrs, errors=ErrorPolicy.Skip)
+
+        self.assertIs(type(columns), DatetimeColumns)
+        self.assertEqual(
+            list(columns),
+            [
+                DatetimeRow(1981, 4, 5, 23, 21, 28, 512400, 90, TimeResolution.Seconds),
+                DatetimeRow(1981, 4, 5, 23, 0, 0, 0, NO_OFFSET, TimeResolution.Hours),
+            ],
+        )
+
+        columns = parse_datetimes_to_columns(isodatetimestrs, errors=ErrorPolicy.Null)
+
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(
+            [columns.is_null(index) for index in range(4)], [False, True, False, True]
+        )
+
+        columns, collected = parse_datetimes_to_columns(
+            [isodatetimestr.replace("T", " ") for isodatetimestr in isodatetimestrs],
+            delimiter=" ",
+            errors=ErrorPolicy.Collect,
+        )
+
+        self.assertEqual(len(columns), 4)
+        self.assertTrue(columns.is_null(3))
+        self.assertEqual([index for index, _ in collected], [1, 3])
+        self.assertIsInstance(collected[1][1], ISOFormatError)
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import pickle
+import unittest
+
+import aniso8601
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    RepeatingIntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+)
+from aniso8601.builders import compact as compactbuilder
+from aniso8601.builders.compact import (
+    CompactDate,
+    CompactDatetime,
+    CompactDuration,
+    CompactInterval,
+    CompactRepeatingInterval,
+    CompactTime,
+    CompactTimezone,
+    CompactTupleBuilder,
+)
+from aniso8601.builders.epoch import EpochTimeBuilder
+from aniso8601.tests.compat import mock
+from aniso8601.timezone import parse_timezone
+from aniso8601.utcoffset import UTCOffset
+
+
+class TestCompactTupleBuilder(unittest.TestCase):
+    def test_build_date(self):
+        testtuples = (
+            ({"YYYY": "2013"}, CompactDate(2013, None, None, None, None, None)),
+            ({"YYYY": "19"}, CompactDate(1900, None, None, None, None, None)),
+            ({"YYYY": "0019"}, CompactDate(19, None, None, None, None, None)),
+            (
+                {"YYYY": "1981", "MM": "04", "DD": "05"},
+                CompactDate(1981, 4, 5, None, None, None),
+            ),
+            (
+                {"YYYY": "2004", "Www": "53", "D": "6"},
+                CompactDate(2004, None, None, 53, 6, None),
+            ),
+            (
+                {"YYYY": "1981", "DDD": "095"},
+                CompactDate(1981, None, None, None, None, 95),
+            ),
+            ({"DD": "15"}, CompactDate(None, None, 15, None, None, None)),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                CompactTupleBuilder.build_date(**testtuple[0]), testtuple[1]
+            )
+
+    def test_build_time(self):
+        result = CompactTupleBuilder.build_time(
+            hh="23",
+            mm="21",
+            ss="28.512400",
+            tz=TimezoneTuple(False, None, "01", "30", "+01:30"),
+        )
+
+        self.assertEqual(
+            result,
+            CompactTime(
+                23, 21, "28.512400", CompactTimezone(False, None, 1, 30, "+01:30")
+            ),
+        )
+        self.assertEqual(result.ss, "28.512400")
+        self.assertEqual(result.tz.mm, 30)
+
+        self.assertEqual(
+            CompactTupleBuilder.build_time(hh="01.5"),
+            CompactTime("01.5", None, None, None),
+        )
+
+    def test_build_datetime(self):
+        result = CompactTupleBuilder.build_datetime(
+            DateTuple("1981", "04", "05", None, None, None),
+            TimeTuple("23", "21", None, None),
+        )
+
+        self.assertEqual(
+            result,
+            CompactDatetime(
+                CompactDate(1981, 4, 5, None, None, None),
+                CompactTime(23, 21, None, None),
+            ),
+        )
+
+        # Records are kept as is
+        self.assertEqual(
+            CompactTupleBuilder.build_datetime(result.date, result.time), result
+        )
+
+    def test_build_duration(self):
+        self.assertEqual(
+            CompactTupleBuilder.build_duration(
+                PnY="1", PnM="2", PnD="3", TnH="4", TnM="54", TnS="6.5"
+            ),
+            CompactDuration(1, 2, None, 3, 4, 54, "6.5"),
+        )
+
+    def test_build_interval(self):
+        self.assertEqual(
+            CompactTupleBuilder.build_interval(
+                start=DateTuple("1981", "04", "05", None, None, None),
+                duration=DurationTuple(None, "1", None, None, None, None, None),
+            ),
+            CompactInterval(
+                CompactDate(1981, 4, 5, None, None, None),
+                None,
+                CompactDuration(None, 1, None, None, None, None, None),
+            ),
+        )
+
+    def test_build_repeating_interval(self):
+        interval = IntervalTuple(
+            None,
+            DateTuple("1981", "04", "05", None, None, None),
+            DurationTuple(None, None, None, "1", None, None, None),
+        )
+
+        self.assertEqual(
+            CompactTupleBuilder.build_repeating_interval(
+                R=False, Rnn="3", interval=interval
+            ),
+            CompactRepeatingInterval(
+                False,
+                3,
+                CompactInterval(
+                    None,
+                    CompactDate(1981, 4, 5, None, None, None),
+                    CompactDuration(None, None, None, 1, None, None, None),
+                ),
+            ),
+        )
+
+    def test_build_timezone(self):
+        result = CompactTupleBuilder.build_timezone(
+            negative=True, hh="08", mm="00", name="-08:00"
+        )
+
+        self.assertEqual(result, CompactTimezone(True, None, 8, 0, "-08:00"))
+
+        # Equal timezones are shared
+        self.assertIs(
+            CompactTupleBuilder.build_timezone(
+                negative=True, hh="08", mm="00", name="-08:00"
+            ),
+            result,
+        )
+        self.assertIs(
+            aniso8601.parse_time("01:00-08:00", builder=CompactTupleBuilder).tz,
+            result,
+        )
+
+    def test_build_timezone_bounded(self):
+        tzstrs = ["+01", "+02", "+03"]
+
+        with mock.patch.object(
+            compactbuilder, "TIMEZONE_CACHE_SIZE", 2
+        ), mock.patch.dict(CompactTupleBuilder._timezones, clear=True):
+            for tzstr in tzstrs:
+                parse_timezone(tzstr, builder=CompactTupleBuilder)
+
+            self.assertEqual(
+                [key[-1] for key in CompactTupleBuilder._timezones], tzstrs[1:]
+            )
+
+    def test_parse(self):
+        testtuples = (
+            (aniso8601.parse_date, "1981-W14-7"),
+            (aniso8601.parse_time, "23:21:28,5124Z"),
+            (aniso8601.parse_datetime, "1981-095T23:21:28.512400-05:30"),
+            (aniso8601.parse_duration, "P1Y2M3DT4H54M6.5S"),
+            (aniso8601.parse_interval, "2007-12-14T13:30/15:30"),
+        )
+
+        for testtuple in testtuples:
+            result = testtuple[0](testtuple[1], builder=CompactTupleBuilder)
+
+            self.assertEqual(result.build(), testtuple[0](testtuple[1]))
+
+        result = aniso8601.parse_repeating_interval(
+            "R3/PT1H2M/1980-03-05T01:01:00", builder=CompactTupleBuilder
+        )
+
+        self.assertEqual(
+            list(result.build()),
+            list(aniso8601.parse_repeating_interval("R3/PT1H2M/1980-03-05T01:01:00")),
+        )
+
+
+class TestCompactRecord(unittest.TestCase):
+    def test_to_tuple(self):
+        record = aniso8601.parse_repeating_interval(
+            "R3/1981-W14-7T01:02:03,5+05:30/P1Y2.5M", builder=CompactTupleBuilder
+        )
+
+        self.assertEqual(
+            record.to_tuple(),
+            RepeatingIntervalTuple(
+                False,
+                "3",
+                IntervalTuple(
+                    DatetimeTuple(
+                        DateTuple("1981", None, None, "14", "7", None),
+                        TimeTuple(
+                            "1",
+                            "2",
+                            "03.5",
+                            TimezoneTuple(False, None, "5", "30", "+05:30"),
+                        ),
+                    ),
+                    None,
+                    DurationTuple("1", "2.5", None, None, None, None, None),
+                ),
+            ),
+        )
+
+        # Truncated years are kept expanded
+        self.assertEqual(
+            CompactDate(19, None, None, None, None, None).to_tuple().YYYY, "0019"
+        )
+        self.assertEqual(
+            aniso8601.parse_date("19", builder=CompactTupleBuilder).to_tuple().YYYY,
+            "1900",
+        )
+        self.assertIsNone(CompactDate(None, None, 15, None, None, None).to_tuple().YYYY)
+
+    def test_build(self):
+        record = aniso8601.parse_datetime(
+            "1979-06-05T08:00:00.5-08:00", builder=CompactTupleBuilder
+        )
+
+        self.assertEqual(
+            record.build(),
+            datetime.datetime(
+                1979, 6, 5, 8, 0, 0, 500000, tzinfo=UTCOffset("-08:00", -480)
+            ),
+        )
+        self.assertEqual(
+            record.build(builder=EpochTimeBuilder),
+            aniso8601.parse_datetime(
+                "1979-06-05T08:00:00.5-08:00", builder=EpochTimeBuilder
+            ),
+        )
+        self.assertEqual(
+            record.time.build(),
+            datetime.time(8, 0, 0, 500000, tzinfo=UTCOffset("-08:00", -480)),
+        )
+
+    def test_record(self):
+        record = CompactTime(1, 2, None, None)
+
+        self.assertEqual(list(record), [1, 2, None, None])
+        self.assertEqual(repr(record), "CompactTime(hh=1, mm=2, ss=None, tz=None)")
+
+        self.assertEqual(record, CompactTime(1, 2, None, None))
+        self.assertNotEqual(record, CompactTime(1, 3, None, None))
+        self.assertNotEqual(record, TimeTuple(1, 2, None, None))
+        self.assertEqual(hash(record), hash(CompactTime(1, 2, None, None)))
+
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+        with self.assertRaises(AttributeError):
+            record.hh = 3
+
+        with self.assertRaises(AttributeError):
+            record.extra = 3
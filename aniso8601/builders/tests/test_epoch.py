@@ -0,0 +1,505 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+)
+from aniso8601.builders.epoch import EpochTimeBuilder
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    MidnightBoundsError,
+    MonthOutOfBoundsError,
+    YearOutOfBoundsError,
+)
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _to_microseconds(value):
+    # The expected result, from a naive UTC datetime or a timedelta
+    if isinstance(value, datetime.datetime) is True:
+        value = value - EPOCH
+
+    return value.days * 86400000000 + value.seconds * 1000000 + value.microseconds
+
+
+class TestEpochTimeBuilder(unittest.TestCase):
+    def test_with_unit(self):
+        self.assertIs(EpochTimeBuilder.with_unit("us"), EpochTimeBuilder)
+
+        for unit in ("s", "ms", "ns"):
+            builder = EpochTimeBuilder.with_unit(unit)
+
+            self.assertEqual(builder.UNIT, unit)
+            self.assertTrue(issubclass(builder, EpochTimeBuilder))
+            self.assertIs(EpochTimeBuilder.with_unit(unit), builder)
+            self.assertIs(builder.with_unit(unit), builder)
+
+            # Subclasses get their own builders
+            subclass = type("Subclass", (EpochTimeBuilder,), {})
+
+            self.assertTrue(issubclass(subclass.with_unit(unit), subclass))
+
+        for unit in ("D", "ps", None):
+            with self.assertRaises(ValueError):
+                EpochTimeBuilder.with_unit(unit)
+
+    def test_build_date(self):
+        testtuples = (
+            ({"YYYY": "1970", "MM": "01", "DD": "01"}, datetime.datetime(1970, 1, 1)),
+            ({"YYYY": "1981", "MM": "04", "DD": "05"}, datetime.datetime(1981, 4, 5)),
+            ({"YYYY": "19"}, datetime.datetime(1900, 1, 1)),
+            ({"YYYY": "1981", "MM": "04"}, datetime.datetime(1981, 4, 1)),
+            ({"YYYY": "2004", "Www": "53", "D": "6"}, datetime.datetime(2005, 1, 1)),
+            ({"YYYY": "1981", "DDD": "095"}, datetime.datetime(1981, 4, 5)),
+            ({"YYYY": "0001", "MM": "01", "DD": "01"}, datetime.datetime(1, 1, 1)),
+            (
+                {"YYYY": "9999", "MM": "12", "DD": "31"},
+                datetime.datetime(9999, 12, 31),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = EpochTimeBuilder.build_date(**testtuple[0])
+
+            self.assertIs(type(result), int)
+            self.assertEqual(result, _to_microseconds(testtuple[1]))
+
+        self.assertEqual(
+            EpochTimeBuilder.with_unit("s").build_date(YYYY="1981", DDD="095"),
+            355276800,
+        )
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            EpochTimeBuilder.build_date(YYYY="1981", MM="13")
+
+        with self.assertRaises(YearOutOfBoundsError):
+            EpochTimeBuilder.build_date(YYYY="9999", Www="53")
+
+    def test_build_time(self):
+        testtuples = (
+            ({"hh": "01"}, 3600000000),
+            ({"hh": "23", "mm": "21", "ss": "28.512400"}, 84088512400),
+            ({"hh": "24"}, 0),
+            (
+                {"hh": "01", "tz": TimezoneTuple(False, True, None, None, "Z")},
+                3600000000,
+            ),
+            (
+                {"hh": "01", "tz": TimezoneTuple(False, None, "01", "30", "+01:30")},
+                -1800000000,
+            ),
+            (
+                {"hh": "23", "tz": TimezoneTuple(True, None, "05", None, "-05")},
+                100800000000,
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(EpochTimeBuilder.build_time(**testtuple[0]), testtuple[1])
+
+        self.assertEqual(
+            EpochTimeBuilder.with_unit("ms").build_time(hh="00", ss=None, mm="0.5"),
+            30000,
+        )
+
+        nanosecondbuilder = EpochTimeBuilder.with_unit("ns")
+
+        self.assertEqual(
+            nanosecondbuilder.build_time(hh="00", mm="00", ss="01.123456789"),
+            1123456789,
+        )
+        self.assertEqual(nanosecondbuilder.build_time(hh="00", mm="0.00000001"), 600)
+        self.assertEqual(nanosecondbuilder.build_time(hh="0.000000000001"), 3)
+
+        with self.assertRaises(MidnightBoundsError):
+            EpochTimeBuilder.build_time(hh="24", mm="01")
+
+    def test_build_datetime(self):
+        testtuples = (
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple("23", "21", "28.512400", None),
+                datetime.datetime(1981, 4, 5, 23, 21, 28, 512400),
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23", "21", "28", TimezoneTuple(False, True, None, None, "Z")
+                ),
+                datetime.datetime(1981, 4, 5, 23, 21, 28),
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23", "21", None, TimezoneTuple(False, None, "01", "30", "+01:30")
+                ),
+                datetime.datetime(1981, 4, 5, 21, 51),
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23", "21", None, TimezoneTuple(True, None, "05", None, "-05")
+                ),
+                datetime.datetime(1981, 4, 6, 4, 21),
+            ),
+            (
+                DateTuple("1969", "12", "31", None, None, None),
+                TimeTuple("23", "59", "59.999999", None),
+                datetime.datetime(1969, 12, 31, 23, 59, 59, 999999),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = EpochTimeBuilder.build_datetime(testtuple[0], testtuple[1])
+
+            self.assertEqual(result, _to_microseconds(testtuple[2]))
+
+            # A time added to a date gives the datetime
+            self.assertEqual(
+                result,
+                EpochTimeBuilder._build_object(testtuple[0])
+                + EpochTimeBuilder._build_object(testtuple[1]),
+            )
+
+        # Smaller units are floored
+        for unit, expected in (
+            ("s", -1),
+            ("ms", -1),
+            ("us", -1),
+            ("ns", -100),
+        ):
+            self.assertEqual(
+                EpochTimeBuilder.with_unit(unit).build_datetime(
+                    DateTuple("1969", "12", "31", None, None, None),
+                    TimeTuple("23", "59", "59.9999999", None),
+                ),
+                expected,
+            )
+
+    def test_build_duration(self):
+        testtuples = (
+            ({"PnY": "1"}, datetime.timedelta(days=365)),
+            ({"PnM": "1"}, datetime.timedelta(days=30)),
+            ({"PnW": "2"}, datetime.timedelta(days=14)),
+            (
+                {"PnD": "1", "TnH": "2", "TnM": "3", "TnS": "4.5"},
+                datetime.timedelta(days=1, hours=2, minutes=3, seconds=4.5),
+            ),
+            ({"TnS": "0.000001"}, datetime.timedelta(microseconds=1)),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                EpochTimeBuilder.build_duration(**testtuple[0]),
+                _to_microseconds(testtuple[1]),
+            )
+
+        testtuples = (
+            ({"TnS": "0.5"}, 500000000),
+            ({"TnS": "1.123456789"}, 1123456789),
+            ({"TnS": "0.1234567891"}, 123456789),
+            ({"TnM": "0.000000001"}, 60),
+            ({"TnH": "0.0000000001"}, 360),
+            ({"PnD": "1.0000000000001"}, 86400000000008),
+            ({"PnW": "0.000000000001"}, 604),
+            ({"PnM": "0.000000000001"}, 2592),
+            ({"PnY": "0.000000000001"}, 31536),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                EpochTimeBuilder.with_unit("ns").build_duration(**testtuple[0]),
+                testtuple[1],
+            )
+
+        # Digits below the unit are floored
+        self.assertEqual(
+            EpochTimeBuilder.with_unit("ms").build_duration(TnS="1.123456789"), 1123
+        )
+
+        with self.assertRaises(DayOutOfBoundsError):
+            EpochTimeBuilder.build_duration(PnD="999999999", TnH="24")
+
+    def test_build_interval(self):
+        date = DateTuple("1981", "04", "05", None, None, None)
+        datetimeaware = DatetimeTuple(
+            date,
+            TimeTuple("01", "01", None, TimezoneTuple(False, None, "01", None, "+01")),
+        )
+        onemonth = DurationTuple(None, "1", None, None, None, None, None)
+        onehour = DurationTuple(None, None, None, None, "1", None, None)
+
+        testtuples = (
+            (
+                {"start": date, "end": DateTuple("1981", "05", "05", None, None, None)},
+                (datetime.datetime(1981, 4, 5), datetime.datetime(1981, 5, 5)),
+            ),
+            (
+                {"start": datetimeaware, "end": TimeTuple("02", None, None, None)},
+                (datetime.datetime(1981, 4, 5, 0, 1), datetime.datetime(1981, 4, 5, 1)),
+            ),
+            (
+                {"start": date, "duration": onehour},
+                (datetime.datetime(1981, 4, 5), datetime.datetime(1981, 4, 5, 1)),
+            ),
+            (
+                {"end": date, "duration": onehour},
+                (datetime.datetime(1981, 4, 5), datetime.datetime(1981, 4, 4, 23)),
+            ),
+            (
+                {"end": datetimeaware, "duration": onemonth},
+                (
+                    datetime.datetime(1981, 4, 5, 0, 1),
+                    datetime.datetime(1981, 3, 6, 0, 1),
+                ),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                EpochTimeBuilder.build_interval(**testtuple[0]),
+                (
+                    _to_microseconds(testtuple[1][0]),
+                    _to_microseconds(testtuple[1][1]),
+                ),
+            )
+
+        # Fractional durations are applied before flooring to the unit
+        seconds = _to_microseconds(datetime.datetime(1981, 4, 5)) // 1000000
+
+        testtuples = (
+            ("PT7909,25S/0190-059", "s", (-56166307200, -56166315110)),
+            ("1981-04-05T00:00:00.5/PT0.5S", "s", (seconds, seconds + 1)),
+            ("PT0.5S/1981-04-05T00:00:00.25", "s", (seconds, seconds - 1)),
+            ("1981-04-04T23:59:59.9999995/PT0.0000005S", "s", (seconds - 1, seconds)),
+            (
+                "1981-04-04T23:59:59.9999995/PT0.0000005S",
+                "ms",
+                (seconds * 1000 - 1, seconds * 1000),
+            ),
+            (
+                "1981-04-05T00:00:00.0000005/PT0.0000005S",
+                "ns",
+                (seconds * 10**9 + 500, seconds * 10**9 + 1000),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                aniso8601.parse_interval(
+                    testtuple[0], builder=EpochTimeBuilder.with_unit(testtuple[1])
+                ),
+                testtuple[2],
+            )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            EpochTimeBuilder.build_interval(
+                start=DateTuple("9999", "12", "31", None, None, None),
+                duration=DurationTuple(None, None, None, "1", None, None, None),
+            )
+
+    def test_build_repeating_interval(self):
+        start = DateTuple("1981", "04", "05", None, None, None)
+        end = DateTuple("1981", "04", "07", None, None, None)
+        oneday = DurationTuple(None, None, None, "1", None, None, None)
+
+        expected = [
+            _to_microseconds(datetime.datetime(1981, 4, day)) for day in (5, 6, 7, 9)
+        ]
+
+        testtuples = (
+            (
+                {
+                    "R": False,
+                    "Rnn": "3",
+                    "interval": IntervalTuple(start, None, oneday),
+                },
+                expected[0:3],
+            ),
+            (
+                {"R": False, "Rnn": "2", "interval": IntervalTuple(None, end, oneday)},
+                [expected[2], expected[1]],
+            ),
+            (
+                {"R": False, "Rnn": "3", "interval": IntervalTuple(start, end, None)},
+                [expected[0], expected[2], expected[3]],
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                list(EpochTimeBuilder.build_repeating_interval(**testtuple[0])),
+                testtuple[1],
+            )
+
+        resultgenerator = EpochTimeBuilder.build_repeating_interval(
+            R=True, interval=IntervalTuple(None, end, oneday)
+        )
+
+        for value in (expected[2], expected[1], expected[0]):
+            self.assertEqual(next(resultgenerator), value)
+
+        # Fractional steps are accumulated before flooring to the unit
+        seconds = _to_microseconds(datetime.datetime(1981, 4, 5)) // 1000000
+
+        testtuples = (
+            ("R3/1981-04-05T00:00:00/PT0.6S", [seconds, seconds, seconds + 1]),
+            ("R2/PT0.5S/1981-04-05T00:00:00", [seconds, seconds - 1]),
+            (
+                "R3/1981-04-05T00:00:00/1981-04-05T00:00:00.6",
+                [seconds, seconds, seconds + 1],
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                list(
+                    aniso8601.parse_repeating_interval(
+                        testtuple[0], builder=EpochTimeBuilder.with_unit("s")
+                    )
+                ),
+                testtuple[1],
+            )
+
+        with self.assertRaises(TypeError):
+            EpochTimeBuilder.build_repeating_interval(
+                R=False,
+                Rnn="2",
+                interval=IntervalTuple(
+                    start, DatetimeTuple(end, TimeTuple("01", None, None, None)), None
+                ),
+            )
+
+    def test_build_timezone(self):
+        testtuples = (
+            ({"Z": True, "name": "Z"}, 0),
+            ({"negative": False, "hh": "01", "name": "+01"}, 3600000000),
+            (
+                {"negative": True, "hh": "12", "mm": "34", "name": "-12:34"},
+                -45240000000,
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                EpochTimeBuilder.build_timezone(**testtuple[0]), testtuple[1]
+            )
+
+        self.assertEqual(
+            EpochTimeBuilder.with_unit("s").build_timezone(
+                negative=True, hh="01", name="-01"
+            ),
+            -3600,
+        )
+
+    def test_build_datetime_fields(self):
+        testtuples = (
+            (
+                (1981, 4, 5, 23, 21, 28, 512400, 6, None),
+                datetime.datetime(1981, 4, 5, 23, 21, 28, 512400),
+            ),
+            (
+                (
+                    1981,
+                    4,
+                    5,
+                    23,
+                    21,
+                    28,
+                    5,
+                    1,
+                    TimezoneTuple(False, None, "01", "30", "+01:30"),
+                ),
+                datetime.datetime(1981, 4, 5, 21, 51, 28, 500000),
+            ),
+            (
+                (1969, 12, 31, 23, 59, 59, 9999999, 7, None),
+                datetime.datetime(1969, 12, 31, 23, 59, 59, 999999),
+            ),
+            # Midnight is handled as by build_datetime
+            (
+                (1981, 4, 5, 24, 0, 0, 0, 0, None),
+                datetime.datetime(1981, 4, 5),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                EpochTimeBuilder.build_datetime_fields(*testtuple[0]),
+                _to_microseconds(testtuple[1]),
+            )
+            self.assertEqual(
+                EpochTimeBuilder.with_unit("s").build_datetime_fields(*testtuple[0]),
+                _to_microseconds(testtuple[1]) // 1000000,
+            )
+
+        nanosecondbuilder = EpochTimeBuilder.with_unit("ns")
+
+        self.assertEqual(
+            nanosecondbuilder.build_datetime_fields(
+                1970, 1, 1, 0, 0, 0, 123456789, 9, None
+            ),
+            123456789,
+        )
+        self.assertEqual(
+            nanosecondbuilder.build_datetime_fields(
+                1969,
+                12,
+                31,
+                23,
+                59,
+                59,
+                9999999999,
+                10,
+                TimezoneTuple(True, None, "00", "01", "-00:01"),
+            ),
+            59999999999,
+        )
+
+        with self.assertRaises(DayOutOfBoundsError):
+            EpochTimeBuilder.build_datetime_fields(1981, 2, 29, 0, 0, 0, 0, 0, None)
+
+    def test_parse(self):
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28.512400+01:30", builder=EpochTimeBuilder
+            ),
+            _to_microseconds(datetime.datetime(1981, 4, 5, 21, 51, 28, 512400)),
+        )
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28Z", builder=EpochTimeBuilder.with_unit("s")
+            ),
+            355360888,
+        )
+        self.assertEqual(
+            aniso8601.parse_duration("PT1M", builder=EpochTimeBuilder), 60000000
+        )
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1970-01-01T00:00:00,123456789-00:01",
+                builder=EpochTimeBuilder.with_unit("ns"),
+            ),
+            60123456789,
+        )
+        self.assertEqual(
+            aniso8601.parse_interval(
+                "2007-12-14T13:30Z/15:30", builder=EpochTimeBuilder.with_unit("s")
+            ),
+            (1197639000, 1197646200),
+        )
@@ -96,6 +96,22 @@ class TestBaseTimeBuilder(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             BaseTimeBuilder.build_timezone()
 
+    def test_build_datetime_fields(self):
+        tz = TimezoneTuple(False, True, None, None, "Z")
+
+        with mock.patch.object(BaseTimeBuilder, "build_datetime") as mockBuildDatetime:
+            mockBuildDatetime.return_value = 1
+
+            result = BaseTimeBuilder.build_datetime_fields(
+                1981, 4, 5, 23, 21, 28, 512400, 6, tz
+            )
+
+        self.assertEqual(result, 1)
+        mockBuildDatetime.assert_called_once_with(
+            DateTuple("1981", "04", "05", None, None, None),
+            TimeTuple("23", "21", "28.512400", tz),
+        )
+
     def test_range_check_date(self):
         # Check the calendar for day ranges
         with self.assertRaises(DayOutOfBoundsError):
@@ -836,3 +852,26 @@ class TestTupleBuilder(unittest.TestCase):
         for testtuple in testtuples:
             result = TupleBuilder.build_timezone(**testtuple[0])
             self.assertEqual(result, testtuple[1])
+
+    def test_build_datetime_fields(self):
+        testtuples = (
+            (
+                (1, 4, 5, 3, 2, 1, 0, 0, None),
+                DatetimeTuple(
+                    DateTuple("0001", "04", "05", None, None, None),
+                    TimeTuple("03", "02", "01", None),
+                ),
+            ),
+            (
+                (1981, 12, 31, 23, 59, 9, 5, 3, None),
+                DatetimeTuple(
+                    DateTuple("1981", "12", "31", None, None, None),
+                    TimeTuple("23", "59", "09.005", None),
+                ),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                TupleBuilder.build_datetime_fields(*testtuple[0]), testtuple[1]
+            )
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import copy
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.builders import DateTuple, TimezoneTuple, TupleBuilder
+from aniso8601.builders.epoch import EpochTimeBuilder
+from aniso8601.builders.lazy import LazyBuilder, LazyResult
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.exceptions import DayOutOfBoundsError, HoursOutOfBoundsError
+from aniso8601.tests.compat import mock
+
+
+class TestLazyBuilder(unittest.TestCase):
+    def test_build(self):
+        testtuples = (
+            (aniso8601.parse_date, "1981-W14-7"),
+            (aniso8601.parse_time, "23:21:28,5124Z"),
+            (aniso8601.parse_datetime, "1981-095T23:21:28.512400-05:30"),
+            (aniso8601.parse_duration, "P1Y2M3DT4H54M6.5S"),
+            (aniso8601.parse_interval, "2007-12-14T13:30/15:30"),
+        )
+
+        for testtuple in testtuples:
+            result = testtuple[0](testtuple[1], builder=LazyBuilder)
+
+            self.assertIs(type(result), LazyResult)
+            self.assertIs(result.builder, PythonTimeBuilder)
+            self.assertEqual(
+                result.parsetuple, testtuple[0](testtuple[1], builder=TupleBuilder)
+            )
+            self.assertEqual(result.value, testtuple[0](testtuple[1]))
+
+        result = aniso8601.parse_repeating_interval(
+            "R2/1981-04-05/P1D", builder=LazyBuilder
+        )
+
+        self.assertEqual(
+            list(result), [datetime.date(1981, 4, 5), datetime.date(1981, 4, 6)]
+        )
+
+        result = LazyBuilder.build_timezone(negative=True, hh="05", name="-05")
+
+        self.assertEqual(
+            result.parsetuple, TimezoneTuple(True, None, "05", None, "-05")
+        )
+        self.assertEqual(result.utcoffset(None), -datetime.timedelta(hours=5))
+
+    def test_build_deferred(self):
+        with mock.patch.object(
+            PythonTimeBuilder, "build_date", wraps=PythonTimeBuilder.build_date
+        ) as mockBuildDate:
+            result = aniso8601.parse_date("1981-04-05", builder=LazyBuilder)
+
+            self.assertFalse(result.is_built)
+            mockBuildDate.assert_not_called()
+
+            self.assertEqual(result.year, 1981)
+            self.assertTrue(result.is_built)
+            self.assertEqual(result.month, 4)
+            self.assertEqual(str(result), "1981-04-05")
+
+            mockBuildDate.assert_called_once()
+
+    def test_with_builder(self):
+        self.assertIs(LazyBuilder.with_builder(PythonTimeBuilder), LazyBuilder)
+
+        epochbuilder = LazyBuilder.with_builder(EpochTimeBuilder)
+
+        self.assertIs(epochbuilder.BUILDER, EpochTimeBuilder)
+        self.assertIs(LazyBuilder.with_builder(EpochTimeBuilder), epochbuilder)
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28Z", builder=epochbuilder
+            ).value,
+            aniso8601.parse_datetime("1981-04-05T23:21:28Z", builder=EpochTimeBuilder),
+        )
+
+
+class TestLazyResult(unittest.TestCase):
+    def test_is_valid(self):
+        result = aniso8601.parse_date("1981-02-29", builder=LazyBuilder)
+
+        self.assertFalse(result.is_valid())
+        self.assertFalse(result.is_built)
+
+        with self.assertRaises(DayOutOfBoundsError):
+            result.value
+
+        self.assertFalse(aniso8601.parse_time("25:00", builder=LazyBuilder).is_valid())
+
+        with self.assertRaises(HoursOutOfBoundsError):
+            aniso8601.parse_time("25:00", builder=LazyBuilder).hour
+
+        result = aniso8601.parse_date("1984-02-29", builder=LazyBuilder)
+
+        self.assertTrue(result.is_valid())
+        self.assertFalse(result.is_built)
+
+        result.value
+
+        self.assertTrue(result.is_valid())
+
+        # Other builders are checked by building the value
+        result = aniso8601.parse_date(
+            "1981-02-29", builder=LazyBuilder.with_builder(TupleBuilder)
+        )
+
+        self.assertTrue(result.is_valid())
+        self.assertTrue(result.is_built)
+        self.assertEqual(result.value, DateTuple("1981", "02", "29", None, None, None))
+
+        result = aniso8601.parse_date(
+            "1981-02-29", builder=LazyBuilder.with_builder(EpochTimeBuilder)
+        )
+
+        self.assertFalse(result.is_valid())
+        self.assertFalse(result.is_built)
+
+    def test_compare(self):
+        first = aniso8601.parse_datetime("1981-04-05T23:21:28Z", builder=LazyBuilder)
+        second = aniso8601.parse_datetime(
+            "1981-04-06T00:51:28+01:30", builder=LazyBuilder
+        )
+        third = aniso8601.parse_datetime("1981-04-05T23:21:29Z", builder=LazyBuilder)
+
+        self.assertTrue(first == second)
+        self.assertFalse(first != second)
+        self.assertTrue(first < third)
+        self.assertTrue(first <= second)
+        self.assertTrue(third > first)
+        self.assertTrue(third >= first)
+        self.assertEqual(hash(first), hash(second))
+
+        self.assertEqual(first, aniso8601.parse_datetime("1981-04-05T23:21:28Z"))
+        self.assertEqual(sorted([third, first]), [first, third])
+
+    def test_copy(self):
+        result = aniso8601.parse_date("1981-04-05", builder=LazyBuilder)
+
+        self.assertEqual(result.year, 1981)
+
+        resultcopy = copy.copy(result)
+
+        self.assertFalse(resultcopy.is_built)
+        self.assertEqual(resultcopy, result)
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(
+                LazyResult(
+                    PythonTimeBuilder, DateTuple("1981", None, None, None, None, None)
+                )
+            ),
+            "LazyResult(Date(YYYY='1981', MM=None, DD=None, Www=None, D=None, DDD=None))",
+        )
@@ -0,0 +1,594 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.batch import ErrorPolicy
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+)
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    ISOFormatError,
+    MonthOutOfBoundsError,
+    YearOutOfBoundsError,
+)
+
+try:
+    import numpy
+
+    from aniso8601.builders.numpy import NumpyTimeBuilder, parse_datetimes_to_array
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed.")
+class TestNumpyTimeBuilder(unittest.TestCase):
+    def test_with_unit(self):
+        self.assertIs(NumpyTimeBuilder.with_unit("us"), NumpyTimeBuilder)
+
+        for unit in ("s", "ms", "ns"):
+            builder = NumpyTimeBuilder.with_unit(unit)
+
+            self.assertEqual(builder.UNIT, unit)
+            self.assertTrue(issubclass(builder, NumpyTimeBuilder))
+            self.assertIs(NumpyTimeBuilder.with_unit(unit), builder)
+
+        for unit in ("D", "ps", None):
+            with self.assertRaises(ValueError):
+                NumpyTimeBuilder.with_unit(unit)
+
+    def test_build_date(self):
+        testtuples = (
+            ({"YYYY": "1981", "MM": "04", "DD": "05"}, "1981-04-05"),
+            ({"YYYY": "19"}, "1900-01-01"),
+            ({"YYYY": "1981", "MM": "04"}, "1981-04-01"),
+            ({"YYYY": "2004", "Www": "53"}, "2004-12-27"),
+            ({"YYYY": "2004", "Www": "53", "D": "6"}, "2005-01-01"),
+            ({"YYYY": "1981", "DDD": "095"}, "1981-04-05"),
+            ({"YYYY": "0001", "MM": "01", "DD": "01"}, "0001-01-01"),
+            ({"YYYY": "9999", "MM": "12", "DD": "31"}, "9999-12-31"),
+        )
+
+        for testtuple in testtuples:
+            result = NumpyTimeBuilder.build_date(**testtuple[0])
+
+            self.assertEqual(result, numpy.datetime64(testtuple[1], "us"))
+            self.assertEqual(result.dtype, numpy.dtype("datetime64[us]"))
+
+        self.assertEqual(
+            NumpyTimeBuilder.with_unit("s").build_date(YYYY="1981", DDD="095").dtype,
+            numpy.dtype("datetime64[s]"),
+        )
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            NumpyTimeBuilder.build_date(YYYY="1981", MM="13")
+
+        with self.assertRaises(YearOutOfBoundsError):
+            NumpyTimeBuilder.build_date(YYYY="9999", Www="53")
+
+        with self.assertRaises(YearOutOfBoundsError):
+            NumpyTimeBuilder.with_unit("ns").build_date(YYYY="1677")
+
+    def test_build_time(self):
+        self.assertEqual(
+            NumpyTimeBuilder.build_time(hh="23", mm="21", ss="28.512400"),
+            datetime.time(23, 21, 28, 512400),
+        )
+
+        result = NumpyTimeBuilder.build_time(
+            hh="23", tz=TimezoneTuple(False, None, "01", "30", "+01:30")
+        )
+
+        self.assertEqual(result.utcoffset(), datetime.timedelta(hours=1, minutes=30))
+
+    def test_build_datetime(self):
+        testtuples = (
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple("23", "21", "28.512400", None),
+                "1981-04-05T23:21:28.512400",
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23",
+                    "21",
+                    "28.512400",
+                    TimezoneTuple(False, True, None, None, "Z"),
+                ),
+                "1981-04-05T23:21:28.512400",
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23", "21", None, TimezoneTuple(False, None, "01", "30", "+01:30")
+                ),
+                "1981-04-05T21:51",
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23", "21", None, TimezoneTuple(True, None, "05", None, "-05")
+                ),
+                "1981-04-06T04:21",
+            ),
+            (
+                DateTuple("1969", "12", "31", None, None, None),
+                TimeTuple("24", None, None, None),
+                "1969-12-31T00:00",
+            ),
+            (
+                DateTuple("1969", "12", "31", None, None, None),
+                TimeTuple("23", "58.5", None, None),
+                "1969-12-31T23:58:30",
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                NumpyTimeBuilder.build_datetime(testtuple[0], testtuple[1]),
+                numpy.datetime64(testtuple[2], "us"),
+            )
+
+        # Smaller units are truncated to the earlier value
+        for unit, expected in (
+            ("s", "1969-12-31T23:59:59"),
+            ("ms", "1969-12-31T23:59:59.999"),
+            ("us", "1969-12-31T23:59:59.999999"),
+            ("ns", "1969-12-31T23:59:59.999999900"),
+        ):
+            result = NumpyTimeBuilder.with_unit(unit).build_datetime(
+                DateTuple("1969", "12", "31", None, None, None),
+                TimeTuple("23", "59", "59.9999999", None),
+            )
+
+            self.assertEqual(result, numpy.datetime64(expected, unit))
+            self.assertEqual(result.dtype, numpy.dtype("datetime64[{0}]".format(unit)))
+
+    def test_build_duration(self):
+        testtuples = (
+            ({"PnY": "1"}, numpy.timedelta64(365, "D")),
+            ({"PnM": "1"}, numpy.timedelta64(30, "D")),
+            ({"PnW": "2"}, numpy.timedelta64(14, "D")),
+            (
+                {"PnD": "1", "TnH": "2", "TnM": "3", "TnS": "4.5"},
+                numpy.timedelta64(93784500, "ms"),
+            ),
+            ({"TnS": "0.000001"}, numpy.timedelta64(1, "us")),
+        )
+
+        for testtuple in testtuples:
+            result = NumpyTimeBuilder.build_duration(**testtuple[0])
+
+            self.assertEqual(result, testtuple[1])
+            self.assertEqual(result.dtype, numpy.dtype("timedelta64[us]"))
+
+        self.assertEqual(
+            NumpyTimeBuilder.with_unit("ns").build_duration(TnS="0.5"),
+            numpy.timedelta64(500000000, "ns"),
+        )
+        self.assertEqual(
+            NumpyTimeBuilder.with_unit("ns").build_duration(TnS="0.123456789"),
+            numpy.timedelta64(123456789, "ns"),
+        )
+
+        # Within a Python timedelta, not a timedelta64[us]
+        with self.assertRaises(DayOutOfBoundsError):
+            NumpyTimeBuilder.build_duration(PnD="999999999")
+
+        with self.assertRaises(DayOutOfBoundsError):
+            NumpyTimeBuilder.build_duration(PnD="999999999", TnH="24")
+
+    def test_build_interval(self):
+        date = DateTuple("1981", "04", "05", None, None, None)
+        datetimeaware = DatetimeTuple(
+            date,
+            TimeTuple("01", "01", None, TimezoneTuple(False, None, "01", None, "+01")),
+        )
+        onemonth = DurationTuple(None, "1", None, None, None, None, None)
+        onehour = DurationTuple(None, None, None, None, "1", None, None)
+
+        testtuples = (
+            (
+                {"start": date, "end": DateTuple("1981", "05", "05", None, None, None)},
+                ("1981-04-05", "1981-05-05"),
+            ),
+            (
+                {"start": datetimeaware, "end": TimeTuple("02", None, None, None)},
+                ("1981-04-05T00:01", "1981-04-05T01:00"),
+            ),
+            ({"start": date, "duration": onemonth}, ("1981-04-05", "1981-05-05")),
+            ({"start": date, "duration": onehour}, ("1981-04-05", "1981-04-05T01")),
+            ({"end": date, "duration": onehour}, ("1981-04-05", "1981-04-04T23")),
+            (
+                {"end": datetimeaware, "duration": onemonth},
+                ("1981-04-05T00:01", "1981-03-06T00:01"),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = NumpyTimeBuilder.build_interval(**testtuple[0])
+
+            self.assertEqual(
+                result,
+                (
+                    numpy.datetime64(testtuple[1][0], "us"),
+                    numpy.datetime64(testtuple[1][1], "us"),
+                ),
+            )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            NumpyTimeBuilder.build_interval(
+                start=DateTuple("9999", "12", "31", None, None, None),
+                duration=DurationTuple(None, None, None, "1", None, None, None),
+            )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            NumpyTimeBuilder.with_unit("ns").build_interval(
+                start=DateTuple("2262", "04", "01", None, None, None),
+                duration=onemonth,
+            )
+
+    def test_build_repeating_interval(self):
+        start = DateTuple("1981", "04", "05", None, None, None)
+        end = DateTuple("1981", "04", "07", None, None, None)
+        oneday = DurationTuple(None, None, None, "1", None, None, None)
+
+        testtuples = (
+            (
+                {
+                    "R": False,
+                    "Rnn": "3",
+                    "interval": IntervalTuple(start, None, oneday),
+                },
+                ["1981-04-05", "1981-04-06", "1981-04-07"],
+            ),
+            (
+                {"R": False, "Rnn": "2", "interval": IntervalTuple(None, end, oneday)},
+                ["1981-04-07", "1981-04-06"],
+            ),
+            (
+                {"R": False, "Rnn": "3", "interval": IntervalTuple(start, end, None)},
+                ["1981-04-05", "1981-04-07", "1981-04-09"],
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                list(NumpyTimeBuilder.build_repeating_interval(**testtuple[0])),
+                [numpy.datetime64(value, "us") for value in testtuple[1]],
+            )
+
+        for interval, expected in (
+            (IntervalTuple(start, None, oneday), ["1981-04-05", "1981-04-06"]),
+            (IntervalTuple(None, end, oneday), ["1981-04-07", "1981-04-06"]),
+        ):
+            resultgenerator = NumpyTimeBuilder.build_repeating_interval(
+                R=True, interval=interval
+            )
+
+            for value in expected:
+                self.assertEqual(next(resultgenerator), numpy.datetime64(value, "us"))
+
+        # Unbounded intervals stop at the end of the datetime64 range
+        resultgenerator = NumpyTimeBuilder.with_unit("ns").build_repeating_interval(
+            R=True,
+            interval=IntervalTuple(
+                DateTuple("2262", "04", "10", None, None, None), None, oneday
+            ),
+        )
+
+        self.assertEqual(
+            next(resultgenerator), numpy.datetime64("2262-04-10T00:00", "ns")
+        )
+        self.assertEqual(
+            next(resultgenerator), numpy.datetime64("2262-04-11T00:00", "ns")
+        )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            next(resultgenerator)
+
+        # Naive and aware datetimes can't be subtracted
+        with self.assertRaises(TypeError):
+            NumpyTimeBuilder.build_repeating_interval(
+                R=False,
+                Rnn="2",
+                interval=IntervalTuple(
+                    DatetimeTuple(start, TimeTuple("01", None, None, None)),
+                    DatetimeTuple(
+                        end,
+                        TimeTuple(
+                            "01",
+                            None,
+                            None,
+                            TimezoneTuple(False, True, None, None, "Z"),
+                        ),
+                    ),
+                    None,
+                ),
+            )
+
+    def test_build_timezone(self):
+        testtuples = (
+            ({"Z": True, "name": "Z"}, 0),
+            ({"negative": False, "hh": "01", "name": "+01"}, 60),
+            ({"negative": True, "hh": "12", "mm": "34", "name": "-12:34"}, -754),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                NumpyTimeBuilder.build_timezone(**testtuple[0]),
+                numpy.timedelta64(testtuple[1], "m"),
+            )
+
+    def test_parse(self):
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28.512400+01:30", builder=NumpyTimeBuilder
+            ),
+            numpy.datetime64("1981-04-05T21:51:28.512400", "us"),
+        )
+        self.assertEqual(
+            aniso8601.parse_date("1981-095", builder=NumpyTimeBuilder),
+            numpy.datetime64("1981-04-05", "us"),
+        )
+        self.assertEqual(
+            aniso8601.parse_duration("PT1M", builder=NumpyTimeBuilder),
+            numpy.timedelta64(1, "m"),
+        )
+        self.assertEqual(
+            aniso8601.parse_interval(
+                "2007-12-14T13:30Z/15:30", builder=NumpyTimeBuilder.with_unit("s")
+            ),
+            (
+                numpy.datetime64("2007-12-14T13:30", "s"),
+                numpy.datetime64("2007-12-14T15:30", "s"),
+            ),
+        )
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed.")
+class TestNumpyFunctions(unittest.TestCase):
+    def test_parse_datetimes_to_array(self):
+        isodatetimestrs = [
+            "1981-04-05T23:21:28.512400+01:30",
+            "1981-04-05 23:21:28.512400",
+            "19810405T232128Z",
+            "2004-W53-6T12",
+        ]
+
+        expected = numpy.array(
+            [
+                "1981-04-05T21:51:28.512400",
+                "1981-04-05T23:21:28.512400",
+                "1981-04-05T23:21:28",
+                "2005-01-01T12:00",
+            ],
+            dtype="datetime64[us]",
+        )
+
+        result = parse_datetimes_to_array(
+            [isodatetimestr.replace(" ", "T") for isodatetimestr in isodatetimestrs]
+        )
+
+        self.assertEqual(result.dtype, numpy.dtype("datetime64[us]"))
+        self.assertTrue(numpy.array_equal(result, expected))
+
+        result = parse_datetimes_to_array(
+            (isodatetimestr.replace("T", " ") for isodatetimestr in isodatetimestrs),
+            unit="ms",
+            delimiter=" ",
+        )
+
+        self.assertEqual(result.dtype, numpy.dtype("datetime64[ms]"))
+        self.assertTrue(numpy.array_equal(result, expected.astype("datetime64[ms]")))
+
+        with self.assertRaises(ValueError):
+            parse_datetimes_to_array(isodatetimestrs, unit="D")
+
+    def test_parse_datetimes_to_array_out(self):
+        out = numpy.zeros(3, dtype="datetime64[ns]")
+
+        result = parse_datetimes_to_array(
+            ["1981-04-05T23:21:28Z", "1981-04-05T23:21:28.5-01:00"], out=out
+        )
+
+        self.assertIs(result, out)
+        self.assertTrue(
+            numpy.array_equal(
+                out,
+                numpy.array(
+                    [
+                        "1981-04-05T23:21:28",
+                        "1981-04-06T00:21:28.5",
+                        "1970-01-01T00:00",
+                    ],
+                    dtype="datetime64[ns]",
+                ),
+            )
+        )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            parse_datetimes_to_array(["2263-01-01T00:00"], out=out)
+
+        for testtuple in (numpy.zeros(1, dtype="int64"), numpy.zeros(1, "m8[s]")):
+            with self.assertRaises(ValueError):
+                parse_datetimes_to_array(["1981-04-05T23:21:28Z"], out=testtuple)
+
+        with self.assertRaises(ValueError):
+            parse_datetimes_to_array(
+                ["1981-04-05T23:21:28Z"], out=numpy.zeros(1, dtype="datetime64[D]")
+            )
+
+    def test_parse_datetimes_to_array_errors(self):
+        isodatetimestrs = ["1981-04-05T23:21:28", "1981-13-05T23:21:28", "bad"]
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            parse_datetimes_to_array(isodatetimestrs)
+
+        result = parse_datetimes_to_array(isodatetimestrs, errors=ErrorPolicy.Null)
+
+        self.assertEqual(result[0], numpy.datetime64("1981-04-05T23:21:28", "us"))
+        self.assertTrue(numpy.isnat(result[1]))
+        self.assertTrue(numpy.isnat(result[2]))
+
+        result = parse_datetimes_to_array(isodatetimestrs, errors=ErrorPolicy.Skip)
+
+        self.assertEqual(len(result), 1)
+
+        result, collected = parse_datetimes_to_array(
+            isodatetimestrs, errors=ErrorPolicy.Collect
+        )
+
+        self.assertEqual(len(result), 3)
+        self.assertTrue(numpy.isnat(result[2]))
+        self.assertEqual([index for index, _ in collected], [1, 2])
+        self.assertIsInstance(collected[1][1], ISOFormatError)
+
+        out = numpy.zeros(3, dtype="datetime64[s]")
+
+        parse_datetimes_to_array(isodatetimestrs, errors=ErrorPolicy.Skip, out=out)
+
+        self.assertEqual(out[0], numpy.datetime64("1981-04-05T23:21:28", "s"))
+        self.assertEqual(out[1], numpy.datetime64(0, "s"))
+
+    def test_parse_datetimes_to_array_column(self):
+        isodatetimestrs = [
+            "1981-04-05T23:21:28",
+            "1981-04-05T23:21:28Z",
+            "1981-04-05T23:21:28.5",
+            "1981-04-05T23:21:28,512400Z",
+            "1981-04-05T23:21:28.51240099+01:30",
+            "1981-04-05T23:21:28-05:00",
+            "2004-02-29T24:00:00+00:00",
+            "0001-01-01T00:00:00",
+            "9999-12-31T23:59:59.999999",
+            "1981-04-05T23:21:28.123456789Z",
+            "1981-04-05T23:21:28.12345678-01:00",
+            "1981-04-05T23:21:28.1234567891",
+            # Left to parse_datetime
+            "19810405T232128Z",
+            "1981-095T23:21",
+            "1981-04-05T23:21:28+0130",
+            "2004-02-29T24:00:00.0",
+        ]
+
+        for unit in ("s", "ms", "us", "ns"):
+            # Compared to the result for a list
+            expected = parse_datetimes_to_array(
+                isodatetimestrs, unit=unit, errors=ErrorPolicy.Null
+            )
+
+            for column in (
+                numpy.array(isodatetimestrs),
+                numpy.array(isodatetimestrs, dtype="S"),
+            ):
+                result = parse_datetimes_to_array(
+                    column, unit=unit, errors=ErrorPolicy.Null
+                )
+
+                self.assertEqual(result.dtype, expected.dtype)
+                self.assertTrue(numpy.array_equal(result, expected, equal_nan=True))
+
+        self.assertEqual(
+            numpy.isnat(expected).tolist(),
+            [False] * 7 + [True, True] + [False] * 6 + [True],
+        )
+        self.assertEqual(
+            expected[9:12].astype("int64").tolist(),
+            [355360888123456789, 355364488123456780, 355360888123456789],
+        )
+
+        result = parse_datetimes_to_array(
+            numpy.array(["1981-04-05 23:21:28Z", "1981-04-05T23:21:28Z"]),
+            delimiter=" ",
+            errors=ErrorPolicy.Null,
+        )
+
+        self.assertEqual(result[0], numpy.datetime64("1981-04-05T23:21:28", "us"))
+        self.assertTrue(numpy.isnat(result[1]))
+
+        # Too narrow to scan
+        self.assertEqual(
+            parse_datetimes_to_array(numpy.array(["1981-04-05T23:21"]), unit="s")[0],
+            numpy.datetime64("1981-04-05T23:21", "s"),
+        )
+
+        # Not scanned
+        for delimiter in ("  ", "é"):
+            self.assertEqual(
+                parse_datetimes_to_array(
+                    numpy.array(["1981-04-05" + delimiter + "23:21"]),
+                    delimiter=delimiter,
+                )[0],
+                numpy.datetime64("1981-04-05T23:21", "us"),
+            )
+
+        # Leaves the range check to _range_check_datetime64
+        with self.assertRaises(YearOutOfBoundsError):
+            parse_datetimes_to_array(
+                numpy.array(["2263-01-01T00:00:00Z"], dtype="S"), unit="ns"
+            )
+
+    def test_parse_datetimes_to_array_column_errors(self):
+        column = numpy.array(
+            [
+                "1981-04-05T23:21:28",
+                "1981-13-05T23:21:28",
+                "bad",
+                "1981-04-05T23:21:28-00:00",
+            ]
+        )
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            parse_datetimes_to_array(column)
+
+        with self.assertRaises(ValueError):
+            parse_datetimes_to_array(column, errors=-1)
+
+        result = parse_datetimes_to_array(column, errors=ErrorPolicy.Null)
+
+        self.assertEqual(result[0], numpy.datetime64("1981-04-05T23:21:28", "us"))
+        self.assertTrue(numpy.isnat(result[1:]).all())
+
+        result = parse_datetimes_to_array(column, errors=ErrorPolicy.Skip)
+
+        self.assertEqual(result.tolist(), [datetime.datetime(1981, 4, 5, 23, 21, 28)])
+
+        result, collected = parse_datetimes_to_array(column, errors=ErrorPolicy.Collect)
+
+        self.assertEqual(len(result), 4)
+        self.assertEqual([index for index, _ in collected], [1, 2, 3])
+        self.assertIsInstance(collected[0][1], MonthOutOfBoundsError)
+        self.assertIsInstance(collected[2][1], ISOFormatError)
+
+        self.assertEqual(
+            parse_datetimes_to_array(column[0:1], errors=ErrorPolicy.Skip).tolist(),
+            [datetime.datetime(1981, 4, 5, 23, 21, 28)],
+        )
+
+        out = numpy.zeros(3, dtype="datetime64[s]")
+
+        self.assertIs(parse_datetimes_to_array(column[0:1], out=out), out)
+        self.assertEqual(out[0], numpy.datetime64("1981-04-05T23:21:28", "s"))
+
+        out = numpy.zeros(3, dtype="datetime64[s]")
+
+        result = parse_datetimes_to_array(column[::2], errors=ErrorPolicy.Skip, out=out)
+
+        self.assertIs(result, out)
+        self.assertEqual(out[0], numpy.datetime64("1981-04-05T23:21:28", "s"))
+        self.assertEqual(out[1], numpy.datetime64(0, "s"))
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.builders import DateTuple, DurationTuple, IntervalTuple, TimeTuple
+from aniso8601.builders.ordinal import OrdinalDateBuilder
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    ISOFormatError,
+    MonthOutOfBoundsError,
+    WeekOutOfBoundsError,
+    YearOutOfBoundsError,
+)
+from aniso8601.timezone import parse_timezone
+from aniso8601.utcoffset import UTCOffset
+
+
+class TestOrdinalDateBuilder(unittest.TestCase):
+    def test_build_date(self):
+        testtuples = (
+            {"YYYY": "0001", "MM": "01", "DD": "01"},
+            {"YYYY": "9999", "MM": "12", "DD": "31"},
+            {"YYYY": "1981", "MM": "04", "DD": "05"},
+            {"YYYY": "1984", "MM": "02", "DD": "29"},
+            {"YYYY": "1984", "MM": "03", "DD": "01"},
+            {"YYYY": "2000", "MM": "12", "DD": "31"},
+            {"YYYY": "1981", "MM": "04"},
+            {"YYYY": "1981"},
+            {"YYYY": "19"},
+            {"YYYY": "19", "MM": "01", "DD": "01"},
+            {"YYYY": "2004", "Www": "53"},
+            {"YYYY": "2004", "Www": "53", "D": "6"},
+            {"YYYY": "2009", "Www": "01", "D": "1"},
+            {"YYYY": "1981", "DDD": "095"},
+            {"YYYY": "1984", "DDD": "366"},
+        )
+
+        for testtuple in testtuples:
+            result = OrdinalDateBuilder.build_date(**testtuple)
+
+            self.assertIs(type(result), int)
+            self.assertEqual(
+                result, PythonTimeBuilder.build_date(**testtuple).toordinal()
+            )
+
+    def test_build_date_bounds(self):
+        testtuples = (
+            ({"YYYY": "0000", "MM": "01", "DD": "01"}, YearOutOfBoundsError),
+            ({"YYYY": "1981", "MM": "13", "DD": "01"}, MonthOutOfBoundsError),
+            ({"YYYY": "1981", "MM": "02", "DD": "29"}, DayOutOfBoundsError),
+            ({"YYYY": "1981", "MM": "04", "DD": "0²"}, ISOFormatError),
+            ({"YYYY": "1981", "Www": "54"}, WeekOutOfBoundsError),
+            ({"YYYY": "9999", "Www": "52", "D": "7"}, YearOutOfBoundsError),
+            ({"YYYY": "1981", "DDD": "366"}, DayOutOfBoundsError),
+        )
+
+        for testtuple in testtuples:
+            with self.assertRaises(testtuple[1]):
+                OrdinalDateBuilder.build_date(**testtuple[0])
+
+    def test_build_datetime(self):
+        self.assertEqual(
+            OrdinalDateBuilder.build_datetime(
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple("23", "21", "28.512400", None),
+            ),
+            datetime.datetime(1981, 4, 5, 23, 21, 28, 512400),
+        )
+
+    def test_build_interval(self):
+        duration = DurationTuple(None, "1", None, "1", None, None, None)
+
+        self.assertEqual(
+            OrdinalDateBuilder.build_interval(
+                start=DateTuple("1981", "04", "05", None, None, None),
+                duration=duration,
+            ),
+            (
+                datetime.date(1981, 4, 5).toordinal(),
+                datetime.date(1981, 5, 6).toordinal(),
+            ),
+        )
+
+        # Datetimes are kept as datetimes
+        self.assertEqual(
+            OrdinalDateBuilder.build_interval(
+                start=DateTuple("1981", "04", "05", None, None, None),
+                duration=DurationTuple(None, None, None, None, "1", None, None),
+            ),
+            (datetime.date(1981, 4, 5).toordinal(), datetime.datetime(1981, 4, 5, 1)),
+        )
+
+    def test_build_repeating_interval(self):
+        interval = IntervalTuple(
+            None,
+            DateTuple("1981", "04", "05", None, None, None),
+            DurationTuple(None, None, None, "1", None, None, None),
+        )
+
+        self.assertEqual(
+            list(
+                OrdinalDateBuilder.build_repeating_interval(
+                    R=False, Rnn="3", interval=interval
+                )
+            ),
+            [
+                datetime.date(1981, 4, 5).toordinal(),
+                datetime.date(1981, 4, 4).toordinal(),
+                datetime.date(1981, 4, 3).toordinal(),
+            ],
+        )
+
+    def test_parse(self):
+        self.assertEqual(
+            aniso8601.parse_date("1981-W14-7", builder=OrdinalDateBuilder),
+            datetime.date(1981, 4, 5).toordinal(),
+        )
+        self.assertEqual(
+            aniso8601.parse_time("23:21:28+01:30", builder=OrdinalDateBuilder),
+            datetime.time(23, 21, 28, tzinfo=UTCOffset("+01:30", 90)),
+        )
+        self.assertEqual(
+            aniso8601.parse_datetime("1981-04-05T23:21:28", builder=OrdinalDateBuilder),
+            datetime.datetime(1981, 4, 5, 23, 21, 28),
+        )
+        self.assertEqual(
+            aniso8601.parse_duration("P1DT1H", builder=OrdinalDateBuilder),
+            datetime.timedelta(days=1, hours=1),
+        )
+        self.assertEqual(
+            aniso8601.parse_interval(
+                "1981-04-05/1981-04-06", builder=OrdinalDateBuilder
+            ),
+            (723275, 723276),
+        )
+        self.assertEqual(
+            parse_timezone("-05", builder=OrdinalDateBuilder).utcoffset(None),
+            -datetime.timedelta(hours=5),
+        )
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import io
+import itertools
+import unittest
+
+import aniso8601
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    TimeTuple,
+    TimezoneTuple,
+    TupleBuilder,
+)
+from aniso8601.builders.columnar import ColumnarTimeBuilder
+from aniso8601.builders.epoch import EpochTimeBuilder
+from aniso8601.builders.packed import (
+    RECORD_STRUCTS,
+    RecordKind,
+    iter_unpack,
+    pack,
+    pack_many,
+    unpack,
+)
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.tests.compat import mock
+from aniso8601.timezone import parse_timezone
+
+TESTSTRS = (
+    (aniso8601.parse_date, "19"),
+    (aniso8601.parse_date, "1981"),
+    (aniso8601.parse_date, "1981-04"),
+    (aniso8601.parse_date, "19810405"),
+    (aniso8601.parse_date, "1981-W14"),
+    (aniso8601.parse_date, "1981W147"),
+    (aniso8601.parse_date, "1981-095"),
+    (aniso8601.parse_time, "23"),
+    (aniso8601.parse_time, "23.5"),
+    (aniso8601.parse_time, "2321,25"),
+    (aniso8601.parse_time, "23:21:28.5124Z"),
+    (aniso8601.parse_time, "232128.000000001+0130"),
+    (aniso8601.parse_time, "23:21-05"),
+    (aniso8601.parse_time, "24:00"),
+    (aniso8601.parse_datetime, "1981-04-05T23:21:28.5124-05:30"),
+    (aniso8601.parse_datetime, "19810405T232128Z"),
+    (aniso8601.parse_datetime, "1981-04-05T24:00:00"),
+    (aniso8601.parse_datetime, "1981-W14-7T00Z"),
+    (aniso8601.parse_duration, "P1Y2M3DT4H54M6.5S"),
+    (aniso8601.parse_duration, "P0,5W"),
+    (aniso8601.parse_duration, "PT36H"),
+    (aniso8601.parse_interval, "2007-12-14T13:30/15:30"),
+    (aniso8601.parse_interval, "2007-12-14/16"),
+    (aniso8601.parse_interval, "2007-12-14T13:30/P1D"),
+    (aniso8601.parse_interval, "P1M/1981-04-05T01:01:00+01"),
+    (aniso8601.parse_repeating_interval, "R/1981-04-05T01:00/P1D"),
+    (aniso8601.parse_repeating_interval, "R3/PT1H/1981-04-05"),
+    (parse_timezone, "Z"),
+    (parse_timezone, "+00"),
+    (parse_timezone, "+0530"),
+    (parse_timezone, "-05:30"),
+)
+
+
+class TestPack(unittest.TestCase):
+    def test_pack(self):
+        for testtuple in TESTSTRS:
+            parsetuple = testtuple[0](testtuple[1], builder=TupleBuilder)
+            record = pack(parsetuple)
+
+            self.assertEqual(
+                len(record), RECORD_STRUCTS[bytearray(record)[0]].size, testtuple[1]
+            )
+            self.assertEqual(unpack(record), parsetuple, testtuple[1])
+
+    def test_pack_truncated_year(self):
+        # The number of digits of the year is kept
+        for YYYY in ("1", "19", "198", "1981", "0198"):
+            for parsetuple in (
+                DateTuple(YYYY, None, None, None, None, None),
+                DateTuple(YYYY, "04", "05", None, None, None),
+                DatetimeTuple(
+                    DateTuple(YYYY, "04", "05", None, None, None),
+                    TimeTuple("23", "21", "28", None),
+                ),
+            ):
+                self.assertEqual(unpack(pack(parsetuple)), parsetuple, YYYY)
+
+    def test_pack_kind(self):
+        self.assertEqual(
+            bytearray(pack(DateTuple("1981", None, None, None, None, None)))[0],
+            RecordKind.Date,
+        )
+        self.assertEqual(
+            bytearray(
+                pack(aniso8601.parse_datetime("1981-04-05T01:02", builder=TupleBuilder))
+            )[0],
+            RecordKind.Datetime,
+        )
+        self.assertEqual(
+            len(pack(TimezoneTuple(False, True, None, None, "Z"))),
+            RECORD_STRUCTS[RecordKind.Timezone].size,
+        )
+
+    def test_pack_lossy(self):
+        # Duration components are kept as integers
+        self.assertEqual(
+            unpack(
+                pack(
+                    aniso8601.parse_duration(
+                        "P0001-02-03T04:05:06", builder=TupleBuilder
+                    )
+                )
+            ),
+            DurationTuple("1", "2", None, "3", "4", "5", "6"),
+        )
+
+        # Fractions are cut to 18 digits
+        self.assertEqual(
+            unpack(pack(TimeTuple("01", "02", "03.1234567890123456789012", None))).ss,
+            "03.123456789012345678",
+        )
+
+    def test_pack_badtype(self):
+        with self.assertRaises(ValueError):
+            pack(("1981", "04", "05"))
+
+        with self.assertRaises(ValueError):
+            pack(aniso8601.parse_date("1981-04-05"))
+
+    def test_pack_range(self):
+        with self.assertRaises(ValueError):
+            pack(DateTuple("1981", "256", None, None, None, None))
+
+        with self.assertRaises(ValueError):
+            pack(DurationTuple("4294967296", None, None, None, None, None, None))
+
+    def test_pack_timezone_name(self):
+        with self.assertRaises(ValueError):
+            pack(TimezoneTuple(False, None, "01", "30", "UTC+1:30"))
+
+        with self.assertRaises(ValueError):
+            pack(
+                TimeTuple(
+                    "01", None, None, TimezoneTuple(False, None, None, None, "UTC")
+                )
+            )
+
+    def test_pack_many(self):
+        parsetuples = [
+            testtuple[0](testtuple[1], builder=TupleBuilder) for testtuple in TESTSTRS
+        ]
+
+        records = pack_many(parsetuples)
+
+        self.assertIsInstance(records, bytearray)
+        self.assertEqual(list(iter_unpack(records)), parsetuples)
+        self.assertEqual(list(iter_unpack(bytes(records))), parsetuples)
+        self.assertEqual(list(iter_unpack(memoryview(records))), parsetuples)
+
+        out = bytearray(b"\x01")
+
+        self.assertIs(pack_many(parsetuples[1:2], out=out), out)
+        self.assertEqual(out[1:], pack(parsetuples[1]))
+
+    def test_pack_many_file(self):
+        parsetuples = [
+            testtuple[0](testtuple[1], builder=TupleBuilder) for testtuple in TESTSTRS
+        ]
+
+        packedfile = io.BytesIO()
+
+        self.assertIs(pack_many(parsetuples, out=packedfile), packedfile)
+
+        packedfile.seek(0)
+
+        self.assertEqual(list(iter_unpack(packedfile)), parsetuples)
+
+
+class TestUnpack(unittest.TestCase):
+    def test_unpack_offset(self):
+        records = pack_many(
+            [
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple("01", "02", "03", None),
+            ]
+        )
+
+        self.assertEqual(
+            unpack(records, offset=RECORD_STRUCTS[RecordKind.Date].size),
+            TimeTuple("01", "02", "03", None),
+        )
+
+    def test_unpack_builder(self):
+        for builder in (PythonTimeBuilder, EpochTimeBuilder):
+            for testtuple in TESTSTRS:
+                result = unpack(
+                    pack(testtuple[0](testtuple[1], builder=TupleBuilder)),
+                    builder=builder,
+                )
+                expected = testtuple[0](testtuple[1], builder=builder)
+
+                if testtuple[0] is aniso8601.parse_repeating_interval:
+                    # Compare the first dates of the generators
+                    result = list(itertools.islice(result, 3))
+                    expected = list(itertools.islice(expected, 3))
+                elif isinstance(expected, datetime.tzinfo):
+                    result = result.utcoffset(None)
+                    expected = expected.utcoffset(None)
+
+                self.assertEqual(result, expected, testtuple[1])
+
+        records = pack_many(
+            aniso8601.parse_datetime(isostr, builder=TupleBuilder)
+            for isostr in ("1981-04-05T23:21:28.5124-05:30", "1981-095T23:21")
+        )
+
+        self.assertEqual(
+            list(iter_unpack(records, builder=ColumnarTimeBuilder)),
+            [
+                aniso8601.parse_datetime(
+                    "1981-04-05T23:21:28.5124-05:30", builder=ColumnarTimeBuilder
+                ),
+                aniso8601.parse_datetime("1981-095T23:21", builder=ColumnarTimeBuilder),
+            ],
+        )
+
+    def test_unpack_datetime_fields(self):
+        record = pack(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28.5124-05:30", builder=TupleBuilder
+            )
+        )
+
+        with mock.patch.object(
+            EpochTimeBuilder,
+            "build_datetime_fields",
+            wraps=EpochTimeBuilder.build_datetime_fields,
+        ) as mockBuildDatetimeFields:
+            unpack(record, builder=EpochTimeBuilder)
+
+            mockBuildDatetimeFields.assert_called_once_with(
+                1981,
+                4,
+                5,
+                23,
+                21,
+                28,
+                5124,
+                4,
+                TimezoneTuple(True, None, "05", "30", "-05:30"),
+            )
+
+        # Only for builders setting INTEGER_FIELDS
+        with mock.patch.object(
+            PythonTimeBuilder, "build_datetime", wraps=PythonTimeBuilder.build_datetime
+        ) as mockBuildDatetime:
+            unpack(record, builder=PythonTimeBuilder)
+
+            mockBuildDatetime.assert_called_once_with(
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23",
+                    "21",
+                    "28.5124",
+                    TimezoneTuple(True, None, "05", "30", "-05:30"),
+                ),
+            )
+
+    def test_unpack_badkind(self):
+        with self.assertRaises(ValueError):
+            unpack(b"\x00\x00")
+
+        with self.assertRaises(ValueError):
+            list(iter_unpack(b"\x08"))
+
+    def test_unpack_truncated(self):
+        record = pack(DateTuple("1981", "04", "05", None, None, None))
+
+        with self.assertRaises(ValueError):
+            list(iter_unpack(record + record[:-1]))
+
+        with self.assertRaises(ValueError):
+            list(iter_unpack(io.BytesIO(record + record[:-1])))
+
+    def test_unpack_shared_timezone(self):
+        records = pack_many(
+            aniso8601.parse_time(isostr, builder=TupleBuilder)
+            for isostr in ("01:00-08:00", "02:00-08:00")
+        )
+
+        first, second = iter_unpack(records)
+
+        self.assertIs(first.tz, second.tz)
@@ -9,6 +9,7 @@
 import datetime
 import unittest
 
+import aniso8601
 from aniso8601 import compat
 from aniso8601.builders import (
     DatetimeTuple,
@@ -19,6 +20,7 @@ from aniso8601.builders import (
     TimeTuple,
     TimezoneTuple,
 )
+from aniso8601.builders import python as pythonbuilder
 from aniso8601.builders.python import (
     FractionalComponent,
     PythonTimeBuilder,
@@ -38,6 +40,7 @@ from aniso8601.exceptions import (
     WeekOutOfBoundsError,
     YearOutOfBoundsError,
 )
+from aniso8601.tests.compat import mock
 from aniso8601.utcoffset import UTCOffset
 
 
@@ -1526,6 +1529,64 @@ class TestPythonTimeBuilder(unittest.TestCase):
             self.assertEqual(result.utcoffset(None), testtuple[1])
             self.assertEqual(result.tzname(None), testtuple[2])
 
+            # Equal timezones are shared
+            self.assertIs(PythonTimeBuilder.build_timezone(**testtuple[0]), result)
+
+        self.assertIs(
+            aniso8601.parse_datetime("1981-04-05T23:21:28Z").tzinfo,
+            aniso8601.parse_datetime("2021-01-01T00:00:00Z").tzinfo,
+        )
+
+    def test_build_time_shared_tzinfo(self):
+        class TestBuilder(PythonTimeBuilder):
+            pass
+
+        tz = TimezoneTuple(True, None, "05", "30", "-05:30")
+
+        with mock.patch.object(
+            TestBuilder, "build_timezone", wraps=TestBuilder.build_timezone
+        ) as mockBuildTimezone:
+            result = TestBuilder.build_time(hh="01", tz=tz)
+
+            self.assertEqual(result.utcoffset(), -datetime.timedelta(minutes=330))
+            self.assertIs(TestBuilder.build_time(hh="02", tz=tz).tzinfo, result.tzinfo)
+            self.assertIs(
+                TestBuilder.build_datetime(
+                    DateTuple("1981", "04", "05", None, None, None),
+                    TimeTuple("01", None, None, tz),
+                ).tzinfo,
+                result.tzinfo,
+            )
+
+            mockBuildTimezone.assert_called_once_with(
+                negative=True, Z=None, hh="05", mm="30", name="-05:30"
+            )
+
+        # Timezones failing the range checks are not kept
+        tz = TimezoneTuple(False, None, "24", None, "+24")
+
+        for _ in range(2):
+            with self.assertRaises(HoursOutOfBoundsError):
+                TestBuilder.build_time(hh="01", tz=tz)
+
+    def test_build_time_shared_tzinfo_bounded(self):
+        tzs = [
+            TimezoneTuple(False, None, "01", None, "+01"),
+            TimezoneTuple(False, None, "02", None, "+02"),
+            TimezoneTuple(False, None, "03", None, "+03"),
+        ]
+
+        with mock.patch.object(pythonbuilder, "TZINFO_CACHE_SIZE", 2), mock.patch.dict(
+            PythonTimeBuilder._tzinfos, clear=True
+        ):
+            for tz in tzs:
+                PythonTimeBuilder.build_time(hh="01", tz=tz)
+
+            self.assertEqual(
+                list(PythonTimeBuilder._tzinfos),
+                [(PythonTimeBuilder, tzs[1]), (PythonTimeBuilder, tzs[2])],
+            )
+
     def test_range_check_date(self):
         # 0 isn't a valid year for a Python builder
         with self.assertRaises(YearOutOfBoundsError):
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.builders import DateTuple, TimeTuple, TimezoneTuple, TupleBuilder
+from aniso8601.builders import stdlib as stdlibbuilder
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.builders.stdlib import (
+    NaiveUTCTimeBuilder,
+    StdlibTimezoneBuilder,
+    UTCTimeBuilder,
+    get_utc_builder,
+)
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    HoursOutOfBoundsError,
+    LeapSecondError,
+    MinutesOutOfBoundsError,
+    YearOutOfBoundsError,
+)
+from aniso8601.tests.compat import mock
+from aniso8601.timezone import parse_timezone
+
+
+@unittest.skipIf(
+    not hasattr(datetime, "timezone"), "datetime.timezone is not available."
+)
+class TestStdlibTimezoneBuilder(unittest.TestCase):
+    def test_build_timezone(self):
+        testtuples = (
+            ({"Z": True, "name": "Z"}, datetime.timedelta(hours=0), "UTC"),
+            (
+                {"negative": False, "hh": "00", "mm": "00", "name": "+00:00"},
+                datetime.timedelta(hours=0),
+                "+00:00",
+            ),
+            (
+                {"negative": False, "hh": "01", "mm": "00", "name": "+01:00"},
+                datetime.timedelta(hours=1),
+                "+01:00",
+            ),
+            (
+                {"negative": True, "hh": "01", "mm": "00", "name": "-01:00"},
+                -datetime.timedelta(hours=1),
+                "-01:00",
+            ),
+            (
+                {"negative": False, "hh": "00", "mm": "12", "name": "+00:12"},
+                datetime.timedelta(minutes=12),
+                "+00:12",
+            ),
+            (
+                {"negative": True, "hh": "05", "mm": "30", "name": "-0530"},
+                -datetime.timedelta(hours=5, minutes=30),
+                "-0530",
+            ),
+            (
+                {"negative": False, "hh": "01", "name": "+01"},
+                datetime.timedelta(hours=1),
+                "+01",
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = StdlibTimezoneBuilder.build_timezone(**testtuple[0])
+
+            self.assertIs(type(result), datetime.timezone)
+            self.assertEqual(result.utcoffset(None), testtuple[1])
+            self.assertEqual(result.tzname(None), testtuple[2])
+            self.assertIs(StdlibTimezoneBuilder.build_timezone(**testtuple[0]), result)
+
+        self.assertIs(
+            StdlibTimezoneBuilder.build_timezone(Z=True, name="Z"),
+            datetime.timezone.utc,
+        )
+
+    def test_build_timezone_uncommon(self):
+        # Timezones without a canonical name spelling their offset are
+        # built, but not kept
+        testtuples = (
+            (
+                {"negative": False, "hh": "01", "mm": "30", "name": None},
+                datetime.timedelta(hours=1, minutes=30),
+                "UTC+01:30",
+            ),
+            (
+                {"negative": False, "hh": "١٢", "mm": "٠٠", "name": "+١٢:٠٠"},
+                datetime.timedelta(hours=12),
+                "+١٢:٠٠",
+            ),
+            (
+                {"negative": True, "hh": "01", "mm": "00", "name": "+01:00"},
+                -datetime.timedelta(hours=1),
+                "+01:00",
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = StdlibTimezoneBuilder.build_timezone(**testtuple[0])
+
+            self.assertEqual(result.utcoffset(None), testtuple[1])
+            self.assertEqual(result.tzname(None), testtuple[2])
+            self.assertIsNot(
+                StdlibTimezoneBuilder.build_timezone(**testtuple[0]), result
+            )
+
+    def test_build_timezone_bounds(self):
+        with self.assertRaises(HoursOutOfBoundsError):
+            StdlibTimezoneBuilder.build_timezone(negative=False, hh="24", name="+24")
+
+        with self.assertRaises(MinutesOutOfBoundsError):
+            StdlibTimezoneBuilder.build_timezone(
+                negative=False, hh="00", mm="60", name="+00:60"
+            )
+
+    def test_build_time(self):
+        result = StdlibTimezoneBuilder.build_time(
+            hh="23",
+            mm="21",
+            ss="28.512400",
+            tz=TimezoneTuple(False, None, "11", "15", "+11:15"),
+        )
+
+        self.assertEqual(
+            result,
+            PythonTimeBuilder.build_time(
+                hh="23",
+                mm="21",
+                ss="28.512400",
+                tz=TimezoneTuple(False, None, "11", "15", "+11:15"),
+            ),
+        )
+        self.assertIs(type(result.tzinfo), datetime.timezone)
+
+    def test_parse(self):
+        testtuples = (
+            "1981-04-05T23:21:28.512400Z",
+            "1981-04-05T23:21:28.512400+00:00",
+            "1981-04-05T23:21:28-05:30",
+            "1981-095T23:21:28+0130",
+            "1981-W14-7T23:21+11",
+        )
+
+        for testtuple in testtuples:
+            result = aniso8601.parse_datetime(testtuple, builder=StdlibTimezoneBuilder)
+            expected = aniso8601.parse_datetime(testtuple)
+
+            self.assertIs(type(result.tzinfo), datetime.timezone)
+            self.assertEqual(result, expected)
+            self.assertEqual(result.utcoffset(), expected.utcoffset())
+            self.assertEqual(result.tzname(), expected.tzname())
+
+        first = aniso8601.parse_datetime(
+            "1981-04-05T23:21:28Z", builder=StdlibTimezoneBuilder
+        )
+        second = aniso8601.parse_datetime(
+            "1981-04-06T00:51:28+01:30", builder=StdlibTimezoneBuilder
+        )
+
+        self.assertIs(first.tzinfo, datetime.timezone.utc)
+        self.assertEqual(second - first, datetime.timedelta(0))
+        self.assertIs(
+            aniso8601.parse_time("01:00+01:30", builder=StdlibTimezoneBuilder).tzinfo,
+            second.tzinfo,
+        )
+
+        self.assertEqual(
+            aniso8601.parse_interval(
+                "2007-12-14T13:30Z/15:30", builder=StdlibTimezoneBuilder
+            ),
+            (
+                datetime.datetime(2007, 12, 14, 13, 30, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2007, 12, 14, 15, 30, tzinfo=datetime.timezone.utc),
+            ),
+        )
+        self.assertIs(
+            parse_timezone("Z", builder=StdlibTimezoneBuilder), datetime.timezone.utc
+        )
+
+
+@unittest.skipIf(
+    not hasattr(datetime, "timezone"), "datetime.timezone is not available."
+)
+class TestUTCTimeBuilder(unittest.TestCase):
+    def test_build_datetime(self):
+        testtuples = (
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23", "21", "28.512400", TimezoneTuple(False, True, None, None, "Z")
+                ),
+                datetime.datetime(1981, 4, 5, 23, 21, 28, 512400),
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "23",
+                    "21",
+                    "28.512400",
+                    TimezoneTuple(True, None, "05", "30", "-05:30"),
+                ),
+                datetime.datetime(1981, 4, 6, 4, 51, 28, 512400),
+            ),
+            (
+                DateTuple("1981", None, None, None, None, "095"),
+                TimeTuple(
+                    "23.5", None, None, TimezoneTuple(False, None, "01", None, "+01")
+                ),
+                datetime.datetime(1981, 4, 5, 22, 30),
+            ),
+            (
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple(
+                    "24", "00", None, TimezoneTuple(False, None, "01", None, "+01")
+                ),
+                datetime.datetime(1981, 4, 4, 23, 0),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = UTCTimeBuilder.build_datetime(testtuple[0], testtuple[1])
+
+            self.assertEqual(result, testtuple[2].replace(tzinfo=datetime.timezone.utc))
+            self.assertIs(result.tzinfo, datetime.timezone.utc)
+            self.assertEqual(
+                NaiveUTCTimeBuilder.build_datetime(testtuple[0], testtuple[1]),
+                testtuple[2],
+            )
+
+        # Naive datetimes are built as is, by the parent builder
+        with mock.patch.object(
+            StdlibTimezoneBuilder,
+            "build_datetime",
+            wraps=PythonTimeBuilder.build_datetime,
+        ) as mockBuildDatetime:
+            self.assertEqual(
+                UTCTimeBuilder.build_datetime(
+                    DateTuple("1981", "04", "05", None, None, None),
+                    TimeTuple("23", "21", "28", None),
+                ),
+                datetime.datetime(1981, 4, 5, 23, 21, 28),
+            )
+
+            mockBuildDatetime.assert_called_once()
+
+    def test_build_datetime_offsets_bounded(self):
+        date = DateTuple("1981", "04", "05", None, None, None)
+        tzs = [
+            TimezoneTuple(False, None, "01", None, "+01"),
+            TimezoneTuple(False, None, "02", None, "+02"),
+            TimezoneTuple(False, None, "03", None, "+03"),
+        ]
+
+        with mock.patch.object(stdlibbuilder, "TZINFO_CACHE_SIZE", 2), mock.patch.dict(
+            UTCTimeBuilder._offsets, clear=True
+        ):
+            for tz in tzs:
+                UTCTimeBuilder.build_datetime(date, TimeTuple("01", None, None, tz))
+
+            self.assertEqual(
+                list(UTCTimeBuilder._offsets),
+                [(UTCTimeBuilder, tzs[1]), (UTCTimeBuilder, tzs[2])],
+            )
+
+    def test_build_datetime_bounds(self):
+        with self.assertRaises(YearOutOfBoundsError):
+            UTCTimeBuilder.build_datetime(
+                DateTuple("0001", "01", "01", None, None, None),
+                TimeTuple(
+                    "00", "00", None, TimezoneTuple(False, None, "01", None, "+01")
+                ),
+            )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            UTCTimeBuilder.build_datetime(
+                DateTuple("9999", None, None, None, None, "365"),
+                TimeTuple(
+                    "23", "30", None, TimezoneTuple(True, None, "01", None, "-01")
+                ),
+            )
+
+    def test_build_datetime_fields(self):
+        testtuples = (
+            (
+                1981,
+                4,
+                5,
+                23,
+                21,
+                28,
+                5124,
+                4,
+                TimezoneTuple(False, True, None, None, "Z"),
+            ),
+            (
+                1981,
+                4,
+                5,
+                23,
+                21,
+                28,
+                5124,
+                4,
+                TimezoneTuple(True, None, "05", "30", "-05:30"),
+            ),
+            (
+                1981,
+                4,
+                5,
+                23,
+                21,
+                28,
+                123456789,
+                9,
+                TimezoneTuple(False, None, "01", None, "+01"),
+            ),
+            (1981, 4, 5, 24, 0, 0, 0, 0, TimezoneTuple(False, None, "01", None, "+01")),
+            (1981, 4, 5, 23, 21, 28, 0, 0, None),
+        )
+
+        for testtuple in testtuples:
+            expected = UTCTimeBuilder.build_datetime(
+                *TupleBuilder.build_datetime_fields(*testtuple)
+            )
+
+            self.assertEqual(UTCTimeBuilder.build_datetime_fields(*testtuple), expected)
+            self.assertEqual(
+                NaiveUTCTimeBuilder.build_datetime_fields(*testtuple),
+                expected.replace(tzinfo=None),
+            )
+
+        with mock.patch.object(
+            UTCTimeBuilder, "build_datetime", wraps=UTCTimeBuilder.build_datetime
+        ) as mockBuildDatetime:
+            UTCTimeBuilder.build_datetime_fields(
+                1981,
+                4,
+                5,
+                23,
+                21,
+                28,
+                0,
+                0,
+                TimezoneTuple(False, True, None, None, "Z"),
+            )
+
+            mockBuildDatetime.assert_not_called()
+
+    def test_build_datetime_fields_bounds(self):
+        testtuples = (
+            ((1981, 2, 29, 0, 0, 0, 0, 0), DayOutOfBoundsError),
+            ((1981, 4, 5, 23, 59, 60, 0, 0), LeapSecondError),
+            ((1981, 4, 5, 23, 60, 0, 0, 0), MinutesOutOfBoundsError),
+            ((1, 1, 1, 0, 0, 0, 0, 0), YearOutOfBoundsError),
+        )
+
+        for testtuple in testtuples:
+            with self.assertRaises(testtuple[1]):
+                UTCTimeBuilder.build_datetime_fields(
+                    *testtuple[0] + (TimezoneTuple(False, None, "01", None, "+01"),)
+                )
+
+        with self.assertRaises(HoursOutOfBoundsError):
+            UTCTimeBuilder.build_datetime_fields(
+                1981, 4, 5, 0, 0, 0, 0, 0, TimezoneTuple(False, None, "24", None, "+24")
+            )
+
+    def test_build_interval(self):
+        self.assertEqual(
+            UTCTimeBuilder.build_interval(
+                start=TupleBuilder.build_datetime_fields(
+                    2007,
+                    12,
+                    14,
+                    23,
+                    30,
+                    0,
+                    0,
+                    0,
+                    TimezoneTuple(True, None, "01", None, "-01"),
+                ),
+                duration=TupleBuilder.build_duration(PnD="1"),
+            ),
+            (
+                datetime.datetime(2007, 12, 15, 0, 30, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2007, 12, 16, 0, 30, tzinfo=datetime.timezone.utc),
+            ),
+        )
+        self.assertEqual(
+            NaiveUTCTimeBuilder.build_interval(
+                duration=TupleBuilder.build_duration(TnH="1"),
+                end=TupleBuilder.build_datetime_fields(
+                    2007,
+                    12,
+                    14,
+                    13,
+                    30,
+                    0,
+                    0,
+                    0,
+                    TimezoneTuple(True, None, "05", None, "-05"),
+                ),
+            ),
+            (
+                datetime.datetime(2007, 12, 14, 18, 30),
+                datetime.datetime(2007, 12, 14, 17, 30),
+            ),
+        )
+
+    def test_parse(self):
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28+01:30", builder=NaiveUTCTimeBuilder
+            ),
+            datetime.datetime(1981, 4, 5, 21, 51, 28),
+        )
+        self.assertEqual(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28+01:30", builder=NaiveUTCTimeBuilder, to_utc=True
+            ),
+            datetime.datetime(1981, 4, 5, 21, 51, 28),
+        )
+
+        # Times are not converted
+        self.assertEqual(
+            aniso8601.parse_time("23:21:28+01:30", builder=UTCTimeBuilder).utcoffset(),
+            datetime.timedelta(hours=1, minutes=30),
+        )
+
+    def test_get_utc_builder(self):
+        testtuples = (
+            (PythonTimeBuilder, UTCTimeBuilder),
+            (StdlibTimezoneBuilder, UTCTimeBuilder),
+            (UTCTimeBuilder, UTCTimeBuilder),
+            (NaiveUTCTimeBuilder, NaiveUTCTimeBuilder),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(get_utc_builder(testtuple[0]), testtuple[1])
+
+        for builder in (TupleBuilder, None, mock.Mock()):
+            with self.assertRaises(ValueError):
+                get_utc_builder(builder)
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    DurationTuple,
+    IntervalTuple,
+    TimeTuple,
+    TimezoneTuple,
+    TupleBuilder,
+)
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.builders.validating import (
+    MAX_DATETIME_MICROSECONDS,
+    MAX_ORDINAL,
+    MAX_TIMEDELTA_MICROSECONDS,
+    MIN_DATETIME_MICROSECONDS,
+    ValidatingBuilder,
+)
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    LeapSecondError,
+    MidnightBoundsError,
+    MonthOutOfBoundsError,
+    YearOutOfBoundsError,
+)
+
+
+def timedelta_microseconds(timedeltaobject):
+    # timedelta // timedelta is Python 3 only
+    return (
+        timedeltaobject.days * 86400 + timedeltaobject.seconds
+    ) * 1000000 + timedeltaobject.microseconds
+
+
+class TestValidatingBuilder(unittest.TestCase):
+    def assertSameAcceptance(self, method, testtuples):
+        # Each call must return True where the PythonTimeBuilder builds an
+        # object, and raise where the PythonTimeBuilder raises
+        for testtuple in testtuples:
+            try:
+                getattr(PythonTimeBuilder, method)(**testtuple)
+            except (ValueError, OverflowError, TypeError):
+                with self.assertRaises((ValueError, TypeError)):
+                    getattr(ValidatingBuilder, method)(**testtuple)
+            else:
+                self.assertIs(getattr(ValidatingBuilder, method)(**testtuple), True)
+
+    def test_limits(self):
+        self.assertEqual(MAX_ORDINAL, datetime.date.max.toordinal())
+        self.assertEqual(
+            MAX_DATETIME_MICROSECONDS - MIN_DATETIME_MICROSECONDS,
+            timedelta_microseconds(datetime.datetime.max - datetime.datetime.min),
+        )
+        self.assertEqual(
+            MAX_TIMEDELTA_MICROSECONDS,
+            timedelta_microseconds(datetime.timedelta.max),
+        )
+
+    def test_build_date(self):
+        testtuples = (
+            {"YYYY": "1981", "MM": "04", "DD": "05"},
+            {"YYYY": "19"},
+            {"YYYY": "1981", "MM": "04"},
+            {"YYYY": "2000", "MM": "02", "DD": "29"},
+            {"YYYY": "1900", "MM": "02", "DD": "29"},
+            {"YYYY": "1981", "MM": "13"},
+            {"YYYY": "0000"},
+            {"YYYY": "9999", "MM": "12", "DD": "31"},
+            {"YYYY": "2004", "Www": "53"},
+            {"YYYY": "2004", "Www": "53", "D": "7"},
+            {"YYYY": "0001", "Www": "01", "D": "1"},
+            {"YYYY": "9999", "Www": "51", "D": "7"},
+            {"YYYY": "9999", "Www": "52", "D": "5"},
+            {"YYYY": "9999", "Www": "52", "D": "6"},
+            {"YYYY": "9999", "Www": "53"},
+            {"YYYY": "2000", "DDD": "366"},
+            {"YYYY": "1981", "DDD": "366"},
+            {"YYYY": "9999", "DDD": "365"},
+        )
+
+        self.assertSameAcceptance("build_date", testtuples)
+
+        for year in (1, 1582, 1900, 2000, 2004, 2020, 9998):
+            for week in (1, 52, 53):
+                self.assertEqual(
+                    ValidatingBuilder._date_ordinal(
+                        str(year).zfill(4), None, None, str(week), "3", None
+                    ),
+                    PythonTimeBuilder._build_week_date(
+                        year, week, isoday=3
+                    ).toordinal(),
+                )
+
+            for month in (1, 2, 3, 12):
+                self.assertEqual(
+                    ValidatingBuilder._date_ordinal(
+                        str(year).zfill(4), str(month).zfill(2), "28", None, None, None
+                    ),
+                    datetime.date(year, month, 28).toordinal(),
+                )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            ValidatingBuilder.build_date(YYYY="9999", Www="53")
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            ValidatingBuilder.build_date(YYYY="1981", MM="13")
+
+    def test_build_time(self):
+        testtuples = (
+            {"hh": "23", "mm": "21", "ss": "28.512400"},
+            {"hh": "24"},
+            {"hh": "24", "mm": "00", "ss": "00.0"},
+            {"hh": "24", "mm": "01"},
+            {"hh": "24.5"},
+            {"hh": "23", "mm": "59", "ss": "60"},
+            {"hh": "11", "mm": "59.9999999"},
+            {"hh": "12", "tz": TimezoneTuple(False, True, None, None, "Z")},
+            {"hh": "12", "tz": TimezoneTuple(True, None, "24", "00", "-24:00")},
+            {"hh": "12", "tz": TimezoneTuple(False, None, "05", "30", "+05:30")},
+        )
+
+        self.assertSameAcceptance("build_time", testtuples)
+
+        with self.assertRaises(MidnightBoundsError):
+            ValidatingBuilder.build_time(hh="24", mm="01")
+
+        with self.assertRaises(LeapSecondError):
+            ValidatingBuilder.build_time(hh="23", mm="59", ss="60")
+
+    def test_build_datetime(self):
+        testtuples = (
+            {
+                "date": DateTuple("1981", "04", "05", None, None, None),
+                "time": TimeTuple("23", "21", "28.512400", None),
+            },
+            {
+                "date": DateTuple("1981", "02", "29", None, None, None),
+                "time": TimeTuple("23", "21", "28.512400", None),
+            },
+            {
+                "date": DateTuple("9999", None, None, "52", "7", None),
+                "time": TimeTuple("00", None, None, None),
+            },
+            {
+                "date": DateTuple("1981", "04", "05", None, None, None),
+                "time": TimeTuple("24", "00", "01", None),
+            },
+        )
+
+        self.assertSameAcceptance("build_datetime", testtuples)
+
+    def test_build_duration(self):
+        testtuples = (
+            {"PnY": "1", "PnM": "2", "PnD": "3", "TnH": "4", "TnM": "54", "TnS": "6.5"},
+            {"PnW": "142857142"},
+            {"PnW": "142857143"},
+            {"PnD": "999999999"},
+            {"PnD": "999999999", "TnH": "23", "TnM": "59", "TnS": "59.999999"},
+            {"PnD": "999999999", "TnH": "23", "TnM": "1439"},
+            {"PnD": "999999999", "TnS": "86399.999999"},
+            {"PnD": "999999999", "TnS": "86399.9999999"},
+            {"PnD": "999999999", "TnS": "86400"},
+            {"PnY": "2739726"},
+            {"PnY": "2739727"},
+            {"TnS": "0.0000001"},
+        )
+
+        self.assertSameAcceptance("build_duration", testtuples)
+
+        self.assertEqual(
+            ValidatingBuilder._duration_microseconds(
+                "1", "2", "3", "4", "5", "6", "7.8"
+            ),
+            timedelta_microseconds(
+                PythonTimeBuilder.build_duration(
+                    PnY="1", PnM="2", PnW="3", PnD="4", TnH="5", TnM="6", TnS="7.8"
+                )
+            ),
+        )
+
+        with self.assertRaises(DayOutOfBoundsError):
+            ValidatingBuilder.build_duration(PnD="999999999", TnH="23", TnM="1439")
+
+    def test_build_interval(self):
+        date = DateTuple("1981", "04", "05", None, None, None)
+        mindate = DateTuple("0001", "01", "01", None, None, None)
+        maxdate = DateTuple("9999", "12", "31", None, None, None)
+        maxdatetime = DatetimeTuple(maxdate, TimeTuple("23", "59", "59", None))
+        maxdatetimetz = DatetimeTuple(
+            maxdate,
+            TimeTuple("23", "59", "58", TimezoneTuple(False, True, None, None, "Z")),
+        )
+        onesecond = DurationTuple(None, None, None, None, None, None, "1")
+        oneday = DurationTuple(None, None, None, "1", None, None, None)
+
+        testtuples = (
+            {"start": date, "end": DateTuple("1982", "04", "05", None, None, None)},
+            {"start": date, "end": DateTuple(None, None, "30", None, None, None)},
+            {"start": date, "end": DateTuple("1981", "04", "31", None, None, None)},
+            {"start": date, "duration": oneday},
+            {"start": maxdate, "duration": oneday},
+            {"start": maxdate, "duration": onesecond},
+            {"start": maxdatetime, "duration": onesecond},
+            {"start": maxdatetimetz, "duration": onesecond},
+            {"end": mindate, "duration": oneday},
+            {
+                "end": DatetimeTuple(mindate, TimeTuple("00", "00", "01", None)),
+                "duration": onesecond,
+            },
+            {
+                "end": DatetimeTuple(mindate, TimeTuple("00", "00", "00.5", None)),
+                "duration": onesecond,
+            },
+            {
+                "end": DateTuple("0001", "01", "02", None, None, None),
+                "duration": oneday,
+            },
+        )
+
+        self.assertSameAcceptance("build_interval", testtuples)
+
+    def test_build_repeating_interval(self):
+        date = DateTuple("1981", "04", "05", None, None, None)
+        datetimenaive = DatetimeTuple(date, TimeTuple("01", "00", "00", None))
+        datetimeaware = DatetimeTuple(
+            date,
+            TimeTuple("01", "00", "00", TimezoneTuple(False, True, None, None, "Z")),
+        )
+        maxduration = DurationTuple(None, None, None, "999999999", None, None, None)
+        overduration = DurationTuple(None, None, None, "999999999", "1", None, None)
+
+        testtuples = (
+            {
+                "R": False,
+                "Rnn": "2",
+                "interval": IntervalTuple(date, None, maxduration),
+            },
+            {"R": True, "interval": IntervalTuple(None, date, maxduration)},
+            {"R": True, "interval": IntervalTuple(None, date, overduration)},
+            {"R": True, "interval": IntervalTuple(date, None, overduration)},
+            {"R": False, "Rnn": "2", "interval": IntervalTuple(date, date, None)},
+            {
+                "R": False,
+                "Rnn": "2",
+                "interval": IntervalTuple(datetimeaware, datetimeaware, None),
+            },
+            {
+                "R": False,
+                "Rnn": "2",
+                "interval": IntervalTuple(datetimenaive, datetimeaware, None),
+            },
+            {
+                "R": False,
+                "Rnn": "2",
+                "interval": IntervalTuple(date, datetimenaive, None),
+            },
+            {
+                "R": False,
+                "Rnn": "2",
+                "interval": IntervalTuple(
+                    date, TimeTuple("01", None, None, None), None
+                ),
+            },
+        )
+
+        self.assertSameAcceptance("build_repeating_interval", testtuples)
+
+    def test_build_timezone(self):
+        testtuples = (
+            {"Z": True, "name": "Z"},
+            {"negative": True, "hh": "12", "mm": "34", "name": "-12:34"},
+            {"negative": False, "hh": "24", "name": "+24"},
+            {"negative": False, "hh": "23", "mm": "60", "name": "+23:60"},
+        )
+
+        self.assertSameAcceptance("build_timezone", testtuples)
+
+    def test_build_datetime_fields(self):
+        # Fields outside the plain ranges get the same checks as the tuples
+        utc = TimezoneTuple(False, True, None, None, "Z")
+
+        testtuples = (
+            (1981, 4, 5, 23, 21, 28, 512400, 6, utc),
+            (1984, 2, 29, 0, 0, 0, 0, 0, None),
+            (1984, 3, 1, 0, 0, 0, 0, 0, None),
+            (9999, 12, 31, 23, 59, 59, 999999999, 9, None),
+            (1, 1, 1, 0, 0, 0, 0, 0, TimezoneTuple(True, None, "01", None, "-01")),
+            (1981, 4, 5, 24, 0, 0, 0, 0, None),
+            (1981, 4, 5, 24, 0, 1, 0, 0, None),
+            (1981, 12, 31, 23, 59, 60, 0, 0, None),
+            (1981, 4, 5, 23, 21, 60, 5, 1, None),
+            (1981, 2, 29, 0, 0, 0, 0, 0, None),
+            (1981, 4, 31, 0, 0, 0, 0, 0, None),
+            (1981, 13, 1, 0, 0, 0, 0, 0, None),
+            (1981, 0, 1, 0, 0, 0, 0, 0, None),
+            (1981, 1, 0, 0, 0, 0, 0, 0, None),
+            (0, 1, 1, 0, 0, 0, 0, 0, None),
+            (1981, 4, 5, 25, 0, 0, 0, 0, None),
+            (1981, 4, 5, 0, 60, 0, 0, 0, None),
+            (1981, 4, 5, 0, 0, 0, 0, 0, TimezoneTuple(False, None, "24", None, "+24")),
+        )
+
+        for testtuple in testtuples:
+            datetimetuple = TupleBuilder.build_datetime_fields(*testtuple)
+
+            try:
+                ValidatingBuilder.build_datetime(*datetimetuple)
+            except ValueError as e:
+                with self.assertRaises(type(e)):
+                    ValidatingBuilder.build_datetime_fields(*testtuple)
+            else:
+                self.assertIs(ValidatingBuilder.build_datetime_fields(*testtuple), True)
+
+            microseconds = ValidatingBuilder._fields_microseconds(*testtuple[0:8])
+
+            if microseconds is not None:
+                self.assertEqual(
+                    microseconds,
+                    ValidatingBuilder._datetime_microseconds(
+                        DatetimeTuple(
+                            datetimetuple.date, datetimetuple.time._replace(tz=None)
+                        )
+                    ),
+                )
+
+        self.assertIsNone(
+            ValidatingBuilder._fields_microseconds(1981, 4, 5, 24, 0, 0, 0, 0)
+        )
+        self.assertIsNone(
+            ValidatingBuilder._fields_microseconds(1900, 2, 29, 0, 0, 0, 0, 0)
+        )
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.batch import ErrorPolicy
+from aniso8601.builders import TimezoneTuple
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    LeapSecondError,
+    YearOutOfBoundsError,
+)
+from aniso8601.tests.compat import mock
+
+try:
+    import zoneinfo
+
+    zoneinfo.ZoneInfo("Europe/Paris")
+
+    from aniso8601.builders import zoneinfo as zoneinfobuilder
+    from aniso8601.builders.zoneinfo import (
+        ZoneInfoBuilder,
+        get_zone,
+        parse_datetimes_in_zones,
+    )
+except (ImportError, KeyError):
+    zoneinfo = None
+
+
+@unittest.skipIf(zoneinfo is None, "zoneinfo or the time zone database is missing.")
+class TestZoneInfoBuilder(unittest.TestCase):
+    def test_with_zone(self):
+        self.assertIs(ZoneInfoBuilder.with_zone("UTC"), ZoneInfoBuilder)
+
+        parisbuilder = ZoneInfoBuilder.with_zone("Europe/Paris")
+
+        self.assertEqual(parisbuilder.ZONE, "Europe/Paris")
+        self.assertIs(ZoneInfoBuilder.with_zone("Europe/Paris"), parisbuilder)
+        self.assertIs(parisbuilder.with_zone("Europe/Paris"), parisbuilder)
+
+        with self.assertRaises(ValueError):
+            ZoneInfoBuilder.with_zone("Not/A_Zone")
+
+    def test_with_zone_bounded(self):
+        with mock.patch.object(zoneinfobuilder, "ZONE_CACHE_SIZE", 2), mock.patch.dict(
+            ZoneInfoBuilder._zone_builders, clear=True
+        ):
+            parisbuilder = ZoneInfoBuilder.with_zone("Europe/Paris")
+            ZoneInfoBuilder.with_zone("America/New_York")
+
+            self.assertIs(ZoneInfoBuilder.with_zone("Europe/Paris"), parisbuilder)
+
+            ZoneInfoBuilder.with_zone("Asia/Tokyo")
+
+            self.assertEqual(
+                list(ZoneInfoBuilder._zone_builders),
+                [
+                    (ZoneInfoBuilder, "Europe/Paris"),
+                    (ZoneInfoBuilder, "Asia/Tokyo"),
+                ],
+            )
+
+    def test_build_datetime(self):
+        parisbuilder = ZoneInfoBuilder.with_zone("Europe/Paris")
+        paris = zoneinfo.ZoneInfo("Europe/Paris")
+
+        testtuples = (
+            (
+                "1981-04-05T23:21:28.512400",
+                datetime.datetime(1981, 4, 5, 23, 21, 28, 512400, tzinfo=paris),
+            ),
+            ("1981-095T23:21", datetime.datetime(1981, 4, 5, 23, 21, tzinfo=paris)),
+            ("1981-04-05T24:00", datetime.datetime(1981, 4, 5, tzinfo=paris)),
+            (
+                "1981-04-05T23:21:28.5124Z",
+                datetime.datetime(1981, 4, 6, 1, 21, 28, 512400, tzinfo=paris),
+            ),
+            (
+                "2021-10-31T01:30:00+00:00",
+                datetime.datetime(2021, 10, 31, 2, 30, fold=1, tzinfo=paris),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = aniso8601.parse_datetime(testtuple[0], builder=parisbuilder)
+
+            self.assertEqual(result, testtuple[1])
+            self.assertIs(result.tzinfo, paris)
+            self.assertEqual(result.utcoffset(), testtuple[1].utcoffset())
+
+        self.assertEqual(
+            aniso8601.parse_datetime("2021-07-01T12:00", builder=parisbuilder).tzname(),
+            "CEST",
+        )
+        self.assertIs(
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21", builder=ZoneInfoBuilder
+            ).tzinfo,
+            zoneinfo.ZoneInfo("UTC"),
+        )
+
+    def test_build_datetime_fields(self):
+        parisbuilder = ZoneInfoBuilder.with_zone("Europe/Paris")
+
+        with mock.patch.object(
+            PythonTimeBuilder, "build_datetime", wraps=PythonTimeBuilder.build_datetime
+        ) as mockBuildDatetime:
+            parisbuilder.build_datetime_fields(1981, 4, 5, 23, 21, 28, 5124, 4, None)
+
+            mockBuildDatetime.assert_not_called()
+
+            parisbuilder.build_datetime_fields(
+                1981,
+                4,
+                5,
+                23,
+                21,
+                28,
+                0,
+                0,
+                TimezoneTuple(False, True, None, None, "Z"),
+            )
+
+            mockBuildDatetime.assert_called_once()
+
+        testtuples = (
+            ((1981, 2, 29, 0, 0, 0, 0, 0, None), DayOutOfBoundsError),
+            ((1981, 4, 5, 23, 59, 60, 0, 0, None), LeapSecondError),
+            ((10000, 1, 1, 0, 0, 0, 0, 0, None), YearOutOfBoundsError),
+        )
+
+        for testtuple in testtuples:
+            with self.assertRaises(testtuple[1]):
+                parisbuilder.build_datetime_fields(*testtuple[0])
+
+    def test_build_interval(self):
+        parisbuilder = ZoneInfoBuilder.with_zone("Europe/Paris")
+        paris = zoneinfo.ZoneInfo("Europe/Paris")
+
+        # Durations are added to the wall time
+        self.assertEqual(
+            aniso8601.parse_interval("2021-03-27T12:00/P1D", builder=parisbuilder),
+            (
+                datetime.datetime(2021, 3, 27, 12, tzinfo=paris),
+                datetime.datetime(2021, 3, 28, 12, tzinfo=paris),
+            ),
+        )
+        self.assertEqual(
+            aniso8601.parse_interval("PT1H/2021-03-28T12:00", builder=parisbuilder),
+            (
+                datetime.datetime(2021, 3, 28, 12, tzinfo=paris),
+                datetime.datetime(2021, 3, 28, 11, tzinfo=paris),
+            ),
+        )
+        self.assertEqual(
+            aniso8601.parse_interval("2021-03-27/PT1H", builder=parisbuilder),
+            (
+                datetime.date(2021, 3, 27),
+                datetime.datetime(2021, 3, 27, 1, tzinfo=paris),
+            ),
+        )
+
+        with self.assertRaises(YearOutOfBoundsError):
+            aniso8601.parse_interval("9999-12-31T23:00/PT2H", builder=parisbuilder)
+
+    def test_build_time(self):
+        # Times are built by the PythonTimeBuilder
+        self.assertEqual(
+            aniso8601.parse_time(
+                "23:21:28", builder=ZoneInfoBuilder.with_zone("Europe/Paris")
+            ),
+            datetime.time(23, 21, 28),
+        )
+
+
+@unittest.skipIf(zoneinfo is None, "zoneinfo or the time zone database is missing.")
+class TestGetZone(unittest.TestCase):
+    def test_get_zone(self):
+        zone = get_zone("America/New_York")
+
+        self.assertEqual(zone, zoneinfo.ZoneInfo("America/New_York"))
+        self.assertIs(get_zone("America/New_York"), zone)
+
+        with self.assertRaises(ValueError):
+            get_zone("Not/A_Zone")
+
+    def test_get_zone_bounded(self):
+        with mock.patch.object(zoneinfobuilder, "ZONE_CACHE_SIZE", 2), mock.patch.dict(
+            zoneinfobuilder._zones, clear=True
+        ):
+            get_zone("Europe/Paris")
+            get_zone("America/New_York")
+            get_zone("Europe/Paris")
+            get_zone("Asia/Tokyo")
+
+            self.assertEqual(
+                list(zoneinfobuilder._zones), ["Europe/Paris", "Asia/Tokyo"]
+            )
+
+
+@unittest.skipIf(zoneinfo is None, "zoneinfo or the time zone database is missing.")
+class TestParseDatetimesInZones(unittest.TestCase):
+    def test_parse_datetimes_in_zones(self):
+        isodatetimestrs = [
+            "1981-04-05T23:21:28",
+            "1981-04-05T23:21:28",
+            "1981-04-05T23:21:28Z",
+            "1981-04-05 23:21:28",
+        ]
+        zonekeys = ["Europe/Paris", "America/New_York", "Europe/Paris", "UTC"]
+
+        with mock.patch.object(
+            zoneinfo, "ZoneInfo", wraps=zoneinfo.ZoneInfo
+        ) as mockZoneInfo, mock.patch.dict(zoneinfobuilder._zones, clear=True):
+            result = parse_datetimes_in_zones(isodatetimestrs[:3], zonekeys[:3])
+
+            self.assertEqual(mockZoneInfo.call_count, 2)
+
+        self.assertEqual(
+            result,
+            [
+                datetime.datetime(
+                    1981, 4, 5, 23, 21, 28, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+                ),
+                datetime.datetime(
+                    1981, 4, 5, 23, 21, 28, tzinfo=zoneinfo.ZoneInfo("America/New_York")
+                ),
+                datetime.datetime(
+                    1981, 4, 6, 1, 21, 28, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+                ),
+            ],
+        )
+
+        self.assertEqual(
+            parse_datetimes_in_zones(isodatetimestrs[3:], zonekeys[3:], delimiter=" "),
+            [
+                datetime.datetime(
+                    1981, 4, 5, 23, 21, 28, tzinfo=zoneinfo.ZoneInfo("UTC")
+                )
+            ],
+        )
+
+    def test_parse_datetimes_in_zones_errors(self):
+        results, errors = parse_datetimes_in_zones(
+            ["1981-04-05T23:21:28", "1981-02-29T00:00", "1981-04-05T23:21:28"],
+            ["Europe/Paris", "Europe/Paris", "Not/A_Zone"],
+            errors=ErrorPolicy.Collect,
+        )
+
+        self.assertEqual(
+            results,
+            [
+                datetime.datetime(
+                    1981, 4, 5, 23, 21, 28, tzinfo=zoneinfo.ZoneInfo("Europe/Paris")
+                ),
+                None,
+                None,
+            ],
+        )
+        self.assertEqual([error[0] for error in errors], [1, 2])
+        self.assertIsInstance(errors[1][1], ValueError)
+
+        with self.assertRaises(ValueError):
+            parse_datetimes_in_zones(["1981-04-05T23:21:28"], ["Not/A_Zone"])
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import calendar
+import datetime
+
+from aniso8601.builders import DatetimeTuple, DateTuple
+from aniso8601.builders.python import (
+    DAYS_PER_WEEK,
+    MICROSECONDS_PER_DAY,
+    MICROSECONDS_PER_HOUR,
+    MICROSECONDS_PER_MINUTE,
+    MICROSECONDS_PER_SECOND,
+    TIMEDELTA_MAX_DAYS,
+    PythonTimeBuilder,
+)
+from aniso8601.exceptions import DayOutOfBoundsError, YearOutOfBoundsError
+
+# Days before the first of each month in a common year, indexed by month
+DAYS_BEFORE_MONTH = (None, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Days in each month of a common year, indexed by month
+DAYS_IN_MONTH = (None, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Proleptic Gregorian ordinals, as given by date.toordinal
+MAX_ORDINAL = datetime.date.max.toordinal()
+
+# Datetimes and timedeltas as a number of microseconds
+MIN_DATETIME_MICROSECONDS = datetime.date.min.toordinal() * MICROSECONDS_PER_DAY
+MAX_DATETIME_MICROSECONDS = (MAX_ORDINAL + 1) * MICROSECONDS_PER_DAY - 1
+MAX_TIMEDELTA_MICROSECONDS = (TIMEDELTA_MAX_DAYS + 1) * MICROSECONDS_PER_DAY - 1
+
+
+class ValidatingBuilder(PythonTimeBuilder):
+    # Runs the PythonTimeBuilder range checks, including the calendar and
+    # datetime and timedelta limits, without building any objects. Every
+    # build method returns True, or raises if the PythonTimeBuilder would.
+    # Limits the PythonTimeBuilder only finds when building an object are
+    # checked using ordinals and microseconds.
+    INTEGER_FIELDS = True
+
+    @classmethod
+    def build_date(cls, YYYY=None, MM=None, DD=None, Www=None, D=None, DDD=None):
+        cls._date_ordinal(YYYY, MM, DD, Www, D, DDD)
+
+        return True
+
+    @classmethod
+    def build_time(cls, hh=None, mm=None, ss=None, tz=None):
+        cls._time_microseconds(hh, mm, ss, tz)
+
+        return True
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        cls._build_object(date)
+        cls._build_object(time)
+
+        return True
+
+    @classmethod
+    def build_duration(
+        cls, PnY=None, PnM=None, PnW=None, PnD=None, TnH=None, TnM=None, TnS=None
+    ):
+        cls._duration_microseconds(PnY, PnM, PnW, PnD, TnH, TnM, TnS)
+
+        return True
+
+    @classmethod
+    def build_interval(cls, start=None, end=None, duration=None):
+        start, end, duration = cls.range_check_interval(start, end, duration)
+
+        if start is not None and end is not None:
+            cls._build_object(start)
+            cls._build_object(end)
+
+        return True
+
+    @classmethod
+    def build_repeating_interval(cls, R=None, Rnn=None, interval=None):
+        R, Rnn, interval = cls.range_check_repeating_interval(R, Rnn, interval)
+
+        if interval.start is not None:
+            cls._build_object(interval.start)
+
+        if interval.end is not None:
+            cls._build_object(interval.end)
+
+        if interval.duration is not None:
+            durationmicroseconds = cls._duration_microseconds(*interval.duration)
+
+            if (
+                interval.start is None
+                and durationmicroseconds > TIMEDELTA_MAX_DAYS * MICROSECONDS_PER_DAY
+            ):
+                # The duration is negated to step back from the end
+                raise DayOutOfBoundsError("Duration exceeds maximum timedelta size.")
+        elif _get_tuple_kind(interval.start) != _get_tuple_kind(interval.end):
+            # The duration is the difference between the start and end
+            raise TypeError("Interval start and end cannot be subtracted.")
+
+        return True
+
+    @classmethod
+    def build_timezone(cls, negative=None, Z=None, hh=None, mm=None, name=""):
+        cls._timezone_microseconds(negative, Z, hh, mm, name)
+
+        return True
+
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        if (
+            cls._fields_microseconds(YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits)
+            is None
+        ):
+            return super(ValidatingBuilder, cls).build_datetime_fields(
+                YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+            )
+
+        if tz is not None:
+            cls._timezone_microseconds(*tz)
+
+        return True
+
+    @classmethod
+    def range_check_interval(cls, start=None, end=None, duration=None):
+        # As PythonTimeBuilder.range_check_interval, comparing microseconds
+        # instead of datetimes
+        if start is not None and end is not None:
+            # <start>/<end>
+            # Handle concise format
+            if cls._is_interval_end_concise(end) is True:
+                end = cls._combine_concise_interval_tuples(start, end)
+
+            return (start, end, duration)
+
+        durationmicroseconds = cls._duration_microseconds(*duration)
+
+        if end is not None:
+            # <duration>/<end>
+            endmicroseconds = cls._datetime_microseconds(end)
+
+            if endmicroseconds - MIN_DATETIME_MICROSECONDS < durationmicroseconds:
+                raise YearOutOfBoundsError("Interval end less than minimium date.")
+        else:
+            # <start>/<duration>
+            startmicroseconds = cls._datetime_microseconds(start)
+
+            if MAX_DATETIME_MICROSECONDS - startmicroseconds < durationmicroseconds:
+                raise YearOutOfBoundsError("Interval end greater than maximum date.")
+
+        return (start, end, duration)
+
+    @classmethod
+    def _date_ordinal(cls, YYYY, MM, DD, Www, D, DDD):
+        # Range checks the date, and returns its ordinal
+        YYYY, MM, DD, Www, D, DDD = cls.range_check_date(YYYY, MM, DD, Www, D, DDD)
+
+        ordinal = _get_days_before_year(YYYY)
+
+        if DDD is not None:
+            return ordinal + DDD
+
+        if Www is not None:
+            # The ISO year starts on the Monday of the week containing the
+            # 4th of January, ordinal 1 is a Monday
+            fourth_jan = ordinal + 4
+            ordinal = fourth_jan - (fourth_jan - 1) % DAYS_PER_WEEK
+
+            ordinal += (Www - 1) * DAYS_PER_WEEK
+
+            if D is not None:
+                ordinal += D - 1
+
+            if ordinal > MAX_ORDINAL:
+                raise YearOutOfBoundsError("Week date exceeds maximum date.")
+
+            return ordinal
+
+        if MM is None:
+            MM = 1
+
+        if DD is None:
+            DD = 1
+
+        ordinal += DAYS_BEFORE_MONTH[MM] + DD
+
+        if MM > 2 and calendar.isleap(YYYY) is True:
+            ordinal += 1
+
+        return ordinal
+
+    @classmethod
+    def _time_microseconds(cls, hh, mm, ss, tz):
+        # Range checks the time, and returns the microseconds since midnight
+        hh, mm, ss, tz = cls.range_check_time(hh, mm, ss, tz)
+
+        hours, minutes, seconds, microseconds = PythonTimeBuilder._time_components(
+            hh, mm, ss
+        )
+
+        if tz is not None:
+            cls._timezone_microseconds(*tz)
+
+        return (
+            hours * MICROSECONDS_PER_HOUR
+            + minutes * MICROSECONDS_PER_MINUTE
+            + seconds * MICROSECONDS_PER_SECOND
+            + microseconds
+        )
+
+    @classmethod
+    def _timezone_microseconds(cls, negative, Z, hh, mm, name):
+        # Range checks the timezone, and returns its UTC offset
+        negative, Z, hh, mm, name = cls.range_check_timezone(negative, Z, hh, mm, name)
+
+        if Z is True:
+            return 0
+
+        offset = int(hh) * MICROSECONDS_PER_HOUR
+
+        if mm is not None:
+            offset += int(mm) * MICROSECONDS_PER_MINUTE
+
+        if negative is True:
+            return -offset
+
+        return offset
+
+    @classmethod
+    def _datetime_microseconds(cls, parsetuple):
+        # Range checks a date or datetime tuple, and returns its microseconds
+        # since the start of ordinal 0, dates are taken as midnight
+        if type(parsetuple) is DateTuple:
+            return cls._date_ordinal(*parsetuple) * MICROSECONDS_PER_DAY
+
+        return cls._date_ordinal(
+            *parsetuple.date
+        ) * MICROSECONDS_PER_DAY + cls._time_microseconds(*parsetuple.time)
+
+    @classmethod
+    def _fields_microseconds(cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits):
+        # The microseconds since the start of ordinal 0 for the fields given
+        # to build_datetime_fields, or None unless every field is within the
+        # calendar and hours 0..23, so midnight as hour 24, leap seconds,
+        # and all range errors are left to the range_check_* methods
+        if hh > 23 or mm > 59 or ss > 59:
+            return None
+
+        ordinal = _get_calendar_ordinal(YYYY, MM, DD)
+
+        if ordinal is None:
+            return None
+
+        return (
+            ordinal * MICROSECONDS_PER_DAY
+            + hh * MICROSECONDS_PER_HOUR
+            + mm * MICROSECONDS_PER_MINUTE
+            + ss * MICROSECONDS_PER_SECOND
+            + fraction * MICROSECONDS_PER_SECOND // 10**fractiondigits
+        )
+
+    @classmethod
+    def _duration_microseconds(cls, PnY, PnM, PnW, PnD, TnH, TnM, TnS):
+        # Range checks the duration, and returns its microseconds
+        _, _, weeks, days, hours, minutes, seconds = cls.range_check_duration(
+            PnY, PnM, PnW, PnD, TnH, TnM, TnS
+        )
+
+        durationmicroseconds = (
+            (days + weeks * DAYS_PER_WEEK) * MICROSECONDS_PER_DAY
+            + hours * MICROSECONDS_PER_HOUR
+            + minutes * MICROSECONDS_PER_MINUTE
+            + seconds.principal * MICROSECONDS_PER_SECOND
+            + seconds.microsecondremainder
+        )
+
+        # range_check_duration compares each component on its own, the total
+        # can still exceed a timedelta
+        if durationmicroseconds > MAX_TIMEDELTA_MICROSECONDS:
+            raise DayOutOfBoundsError("Duration exceeds maximum timedelta size.")
+
+        return durationmicroseconds
+
+
+def _get_calendar_ordinal(YYYY, MM, DD):
+    # The ordinal of a calendar date given as ints, or None if it is not
+    # within the calendar
+    if YYYY < 1 or MM < 1 or MM > 12 or DD < 1:
+        return None
+
+    isleap = calendar.isleap(YYYY)
+
+    if DD > DAYS_IN_MONTH[MM] and (MM != 2 or DD != 29 or isleap is False):
+        return None
+
+    ordinal = _get_days_before_year(YYYY) + DAYS_BEFORE_MONTH[MM] + DD
+
+    if MM > 2 and isleap is True:
+        ordinal += 1
+
+    return ordinal
+
+
+def _get_days_before_year(YYYY):
+    # The ordinal of the last day of the year before YYYY
+    yearsbefore = YYYY - 1
+
+    return (
+        yearsbefore * 365 + yearsbefore // 4 - yearsbefore // 100 + yearsbefore // 400
+    )
+
+
+def _get_tuple_kind(parsetuple):
+    # Only dates, naive datetimes, or aware datetimes can be subtracted
+    # from each other
+    if type(parsetuple) is DatetimeTuple:
+        return (DatetimeTuple, parsetuple.time.tz is None)
+
+    return (type(parsetuple), None)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from __future__ import absolute_import
+
+import datetime
+import zoneinfo
+from collections import OrderedDict
+
+from aniso8601.batch import ErrorPolicy, _parse_batch
+from aniso8601.builders.python import MICROSECONDS_PER_SECOND, PythonTimeBuilder
+from aniso8601.time import parse_datetime
+
+# The most zones kept by get_zone, and builders kept by
+# ZoneInfoBuilder.with_zone
+ZONE_CACHE_SIZE = 64
+
+# Least recently used zones, keyed by zone key
+_zones = OrderedDict()
+
+
+class ZoneInfoBuilder(PythonTimeBuilder):
+    # Builds datetimes in the zone with the key ZONE, looked up with
+    # get_zone. Datetimes without a timezone are taken as the wall time in
+    # the zone, datetimes with one are converted to it. Everything else,
+    # including times, which have no date to resolve the offset for, is
+    # built by the PythonTimeBuilder. Use with_zone to get a ZoneInfoBuilder
+    # for a zone.
+    INTEGER_FIELDS = True
+    ZONE = "UTC"
+
+    # Least recently used builders, keyed by builder and zone key
+    _zone_builders = OrderedDict()
+
+    @classmethod
+    def with_zone(cls, key):
+        # The last ZONE_CACHE_SIZE builders returned are kept
+        if key == cls.ZONE:
+            return cls
+
+        builderkey = (cls, key)
+
+        builder = ZoneInfoBuilder._zone_builders.pop(builderkey, None)
+
+        if builder is None:
+            # Unknown keys raise here, instead of on the first build
+            get_zone(key)
+
+            builder = type(cls)(cls.__name__, (cls,), {"ZONE": key})
+
+            if len(ZoneInfoBuilder._zone_builders) >= ZONE_CACHE_SIZE:
+                ZoneInfoBuilder._zone_builders.popitem(last=False)
+
+        ZoneInfoBuilder._zone_builders[builderkey] = builder
+
+        return builder
+
+    @classmethod
+    def build_datetime(cls, date, time):
+        return _attach_zone(
+            super(ZoneInfoBuilder, cls).build_datetime(date, time),
+            get_zone(cls.ZONE),
+        )
+
+    @classmethod
+    def build_datetime_fields(
+        cls, YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+    ):
+        if tz is None:
+            try:
+                return datetime.datetime(
+                    YYYY,
+                    MM,
+                    DD,
+                    hh,
+                    mm,
+                    ss,
+                    fraction * MICROSECONDS_PER_SECOND // 10**fractiondigits,
+                    tzinfo=get_zone(cls.ZONE),
+                )
+            except ValueError:
+                # Midnight as hour 24, leap seconds, and fields out of range,
+                # are left to build_datetime and the range_check_* methods
+                pass
+
+        return super(ZoneInfoBuilder, cls).build_datetime_fields(
+            YYYY, MM, DD, hh, mm, ss, fraction, fractiondigits, tz
+        )
+
+    @classmethod
+    def range_check_interval(cls, start=None, end=None, duration=None):
+        # The range checks compare against the naive datetime limits, so
+        # are run on the datetimes built without a zone
+        return PythonTimeBuilder.range_check_interval(
+            start=start, end=end, duration=duration
+        )
+
+
+def get_zone(key):
+    # Returns the ZoneInfo for the key, from the system time zone database,
+    # or the tzdata package if it isn't available. The last ZONE_CACHE_SIZE
+    # zones used are kept, unknown keys raise a ValueError.
+    zone = _zones.pop(key, None)
+
+    if zone is None:
+        try:
+            zone = zoneinfo.ZoneInfo(key)
+        except zoneinfo.ZoneInfoNotFoundError:
+            raise ValueError('Unknown time zone "{0}".'.format(key))
+
+        if len(_zones) >= ZONE_CACHE_SIZE:
+            _zones.popitem(last=False)
+
+    _zones[key] = zone
+
+    return zone
+
+
+def parse_datetimes_in_zones(
+    isodatetimestrs, zonekeys, delimiter="T", errors=ErrorPolicy.Raise, out=None
+):
+    # parse_datetime over an iterable of strings, each built in the zone
+    # with the key at the same position of zonekeys, as by the
+    # ZoneInfoBuilder. The builder for each zone is looked up once for the
+    # batch, see _parse_batch for errors and out
+    builders = {}
+
+    def parse(row):
+        isodatetimestr, zonekey = row
+
+        builder = builders.get(zonekey)
+
+        if builder is None:
+            builder = builders[zonekey] = ZoneInfoBuilder.with_zone(zonekey)
+
+        return parse_datetime(isodatetimestr, delimiter=delimiter, builder=builder)
+
+    return _parse_batch(parse, zip(isodatetimestrs, zonekeys), errors, out)
+
+
+def _attach_zone(datetimeobject, zone):
+    if datetimeobject.tzinfo is None:
+        return datetimeobject.replace(tzinfo=zone)
+
+    return datetimeobject.astimezone(zone)
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+from collections import OrderedDict, namedtuple
+
+from aniso8601.builders import TupleBuilder
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.compat import decode_ascii, is_bytes, is_string
+from aniso8601.date import parse_date
+from aniso8601.duration import parse_duration
+from aniso8601.interval import parse_interval, parse_repeating_interval
+from aniso8601.time import parse_datetime, parse_time
+
+# Built values of these types are stored as is, anything else is stored as
+# its parse tuple and built again on every hit
+IMMUTABLE_TYPES = frozenset(
+    [
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        bool,
+        int,
+        float,
+        str,
+        type(None),
+    ]
+)
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+_default_cache = None
+
+
+class ParseCache(object):
+    # Least recently used cache of parse results, keyed on the string, the
+    # delimiters, and the builder. Only immutable results are stored, so
+    # a hit can return the same object as the parse that stored it. Other
+    # results, like the generators built for repeating intervals, are
+    # stored as their TupleBuilder parse and built again on each hit.
+    # Strings which fail to parse are not stored.
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+
+    def parse_date(self, isodatestr, builder=PythonTimeBuilder):
+        return self._parse(parse_date, builder, isodatestr)
+
+    def parse_time(self, isotimestr, builder=PythonTimeBuilder):
+        return self._parse(parse_time, builder, isotimestr)
+
+    def parse_datetime(self, isodatetimestr, delimiter="T", builder=PythonTimeBuilder):
+        return self._parse(parse_datetime, builder, isodatetimestr, delimiter)
+
+    def parse_duration(self, isodurationstr, builder=PythonTimeBuilder):
+        return self._parse(parse_duration, builder, isodurationstr)
+
+    def parse_interval(
+        self,
+        isointervalstr,
+        intervaldelimiter="/",
+        datetimedelimiter="T",
+        builder=PythonTimeBuilder,
+    ):
+        return self._parse(
+            parse_interval,
+            builder,
+            isointervalstr,
+            intervaldelimiter,
+            datetimedelimiter,
+        )
+
+    def parse_repeating_interval(
+        self,
+        isointervalstr,
+        intervaldelimiter="/",
+        datetimedelimiter="T",
+        builder=PythonTimeBuilder,
+    ):
+        return self._parse(
+            parse_repeating_interval,
+            builder,
+            isointervalstr,
+            intervaldelimiter,
+            datetimedelimiter,
+        )
+
+    def cache_info(self):
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries.clear()
+
+    def _parse(self, parse, builder, isostr, *args):
+        # parse is called as parse(isostr, *args, builder=builder)
+        if is_string(isostr) is False:
+            if is_bytes(isostr) is False:
+                # Not a key, let parse raise the error
+                return parse(isostr, *args, builder=builder)
+
+            isostr = decode_ascii(isostr)
+
+        key = (parse, isostr, args, builder)
+
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self.hits += 1
+            self._entries[key] = entry
+
+            built, value = entry
+
+            if built is True:
+                return value
+
+            return builder._build_object(value)
+
+        self.misses += 1
+
+        parsetuple = parse(isostr, *args, builder=TupleBuilder)
+        value = builder._build_object(parsetuple)
+
+        if len(self._entries) == self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        if _is_immutable(value) is True:
+            self._entries[key] = (True, value)
+        else:
+            self._entries[key] = (False, parsetuple)
+
+        return value
+
+
+def enable_cache(maxsize=1024):
+    # Replaces the cache used by the cached_parse functions when none is
+    # given, and returns it. The parse functions never use the cache, it is
+    # opt in for each call site by calling the cached_parse functions
+    global _default_cache
+
+    _default_cache = ParseCache(maxsize=maxsize)
+
+    return _default_cache
+
+
+def disable_cache():
+    global _default_cache
+
+    _default_cache = None
+
+
+def get_cache():
+    # Returns the cache set by enable_cache, None if caching is disabled
+    return _default_cache
+
+
+def cached_parse_date(isodatestr, builder=PythonTimeBuilder, cache=None):
+    # As parse_date, see _get_cache for cache
+    cache = _get_cache(cache)
+
+    if cache is None:
+        return parse_date(isodatestr, builder=builder)
+
+    return cache.parse_date(isodatestr, builder=builder)
+
+
+def cached_parse_time(isotimestr, builder=PythonTimeBuilder, cache=None):
+    # As parse_time, see _get_cache for cache
+    cache = _get_cache(cache)
+
+    if cache is None:
+        return parse_time(isotimestr, builder=builder)
+
+    return cache.parse_time(isotimestr, builder=builder)
+
+
+def cached_parse_datetime(
+    isodatetimestr, delimiter="T", builder=PythonTimeBuilder, cache=None
+):
+    # As parse_datetime, see _get_cache for cache
+    cache = _get_cache(cache)
+
+    if cache is None:
+        return parse_datetime(isodatetimestr, delimiter=delimiter, builder=builder)
+
+    return cache.parse_datetime(isodatetimestr, delimiter=delimiter, builder=builder)
+
+
+def cached_parse_duration(isodurationstr, builder=PythonTimeBuilder, cache=None):
+    # As parse_duration, see _get_cache for cache
+    cache = _get_cache(cache)
+
+    if cache is None:
+        return parse_duration(isodurationstr, builder=builder)
+
+    return cache.parse_duration(isodurationstr, builder=builder)
+
+
+def cached_parse_interval(
+    isointervalstr,
+    intervaldelimiter="/",
+    datetimedelimiter="T",
+    builder=PythonTimeBuilder,
+    cache=None,
+):
+    # As parse_interval, see _get_cache for cache
+    cache = _get_cache(cache)
+
+    if cache is None:
+        return parse_interval(
+            isointervalstr,
+            intervaldelimiter=intervaldelimiter,
+            datetimedelimiter=datetimedelimiter,
+            builder=builder,
+        )
+
+    return cache.parse_interval(
+        isointervalstr,
+        intervaldelimiter=intervaldelimiter,
+        datetimedelimiter=datetimedelimiter,
+        builder=builder,
+    )
+
+
+def cached_parse_repeating_interval(
+    isointervalstr,
+    intervaldelimiter="/",
+    datetimedelimiter="T",
+    builder=PythonTimeBuilder,
+    cache=None,
+):
+    # As parse_repeating_interval, see _get_cache for cache
+    cache = _get_cache(cache)
+
+    if cache is None:
+        return parse_repeating_interval(
+            isointervalstr,
+            intervaldelimiter=intervaldelimiter,
+            datetimedelimiter=datetimedelimiter,
+            builder=builder,
+        )
+
+    return cache.parse_repeating_interval(
+        isointervalstr,
+        intervaldelimiter=intervaldelimiter,
+        datetimedelimiter=datetimedelimiter,
+        builder=builder,
+    )
+
+
+def _get_cache(cache):
+    # cache is a ParseCache to use for the call, None to use the cache set
+    # by enable_cache, if any, or False to parse without caching
+    if cache is None:
+        return _default_cache
+
+    if cache is False:
+        return None
+
+    return cache
+
+
+def _is_immutable(value):
+    if isinstance(value, tuple) is True:
+        # Includes the TupleBuilder named tuples
+        for item in value:
+            if _is_immutable(item) is False:
+                return False
+
+        return True
+
+    return type(value) in IMMUTABLE_TYPES
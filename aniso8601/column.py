@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from collections import namedtuple
+
+from aniso8601 import compat
+from aniso8601.builders import DatetimeTuple, DateTuple, TupleBuilder
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.compat import is_string
+from aniso8601.compiler import compile_format
+from aniso8601.date import parse_date
+from aniso8601.duration import parse_duration
+from aniso8601.exceptions import ISOFormatError
+from aniso8601.interval import parse_interval, parse_repeating_interval
+from aniso8601.time import parse_datetime
+
+TIMEZONE_PATTERNS = {3: "±hh", 5: "±hhmm", 6: "±hh:mm"}
+
+ColumnShape = namedtuple("ColumnShape", ["kind", "pattern"])
+
+
+class ColumnKind(object):
+    Date, Datetime, Duration, Interval, RepeatingInterval = list(compat.range(5))
+
+
+class ColumnParser(object):
+    # Parses a column of ISO 8601 strings which are expected to mostly share
+    # a single shape. The first samplesize values are parsed with the general
+    # parsers and the most common shape is found. Later values are parsed
+    # with a parser specialized for that shape, compiled with compile_format
+    # for dates and datetimes, falling back to the general parsers for
+    # values that don't match. If more than half of a window of samplesize
+    # values don't match, the shape is inferred again.
+    def __init__(
+        self,
+        builder=PythonTimeBuilder,
+        samplesize=100,
+        intervaldelimiter="/",
+        datetimedelimiter="T",
+    ):
+        if samplesize < 1:
+            raise ValueError("Sample size must be at least 1.")
+
+        self.builder = builder
+        self.samplesize = samplesize
+        self.intervaldelimiter = intervaldelimiter
+        self.datetimedelimiter = datetimedelimiter
+
+        self.shape = None
+
+        self._specialized = None
+        self._samples = {}
+        self._samplecount = 0
+        self._windowcount = 0
+        self._windowmisses = 0
+
+    def parse(self, isostr):
+        if self._specialized is None:
+            return self._parse_sample(isostr)
+
+        self._windowcount += 1
+
+        try:
+            return self._specialized(isostr)
+        except ISOFormatError:
+            self._windowmisses += 1
+
+            return self._parse_general(isostr)
+        finally:
+            if self._windowcount == self.samplesize:
+                self._end_window()
+
+    def parse_column(self, isostrs):
+        parse = self.parse
+
+        return [parse(isostr) for isostr in isostrs]
+
+    def _parse_sample(self, isostr):
+        kind, parsetuple = self._parse_tuple(isostr)
+
+        shape = ColumnShape(kind, self._infer_pattern(isostr, parsetuple))
+
+        self._samples[shape] = self._samples.get(shape, 0) + 1
+        self._samplecount += 1
+
+        if self._samplecount == self.samplesize:
+            self._specialize()
+
+        return self.builder._build_object(parsetuple)
+
+    def _parse_general(self, isostr):
+        return self.builder._build_object(self._parse_tuple(isostr)[1])
+
+    def _parse_tuple(self, isostr):
+        # Returns the kind of ISO 8601 string and its TupleBuilder parse
+        if is_string(isostr) is False:
+            raise ValueError("Value must be string.")
+
+        if isostr[0:1] == "R":
+            return (
+                ColumnKind.RepeatingInterval,
+                parse_repeating_interval(
+                    isostr,
+                    intervaldelimiter=self.intervaldelimiter,
+                    datetimedelimiter=self.datetimedelimiter,
+                    builder=TupleBuilder,
+                ),
+            )
+
+        if self.intervaldelimiter in isostr:
+            return (
+                ColumnKind.Interval,
+                parse_interval(
+                    isostr,
+                    intervaldelimiter=self.intervaldelimiter,
+                    datetimedelimiter=self.datetimedelimiter,
+                    builder=TupleBuilder,
+                ),
+            )
+
+        if isostr[0:1] == "P":
+            return (ColumnKind.Duration, parse_duration(isostr, builder=TupleBuilder))
+
+        if self.datetimedelimiter in isostr:
+            return (
+                ColumnKind.Datetime,
+                parse_datetime(
+                    isostr, delimiter=self.datetimedelimiter, builder=TupleBuilder
+                ),
+            )
+
+        return (ColumnKind.Date, parse_date(isostr, builder=TupleBuilder))
+
+    def _infer_pattern(self, isostr, parsetuple):
+        # Returns the compile_format pattern for a date or datetime string,
+        # None for anything else
+        if type(parsetuple) is DateTuple:
+            return _infer_date_pattern(isostr, parsetuple)
+
+        if type(parsetuple) is DatetimeTuple:
+            delimiteridx = isostr.find(self.datetimedelimiter)
+
+            datepattern = _infer_date_pattern(isostr[0:delimiteridx], parsetuple.date)
+
+            if datepattern is None:
+                return None
+
+            return (
+                datepattern
+                + self.datetimedelimiter
+                + _infer_time_pattern(
+                    isostr[delimiteridx + len(self.datetimedelimiter) :],
+                    parsetuple.time,
+                )
+            )
+
+        return None
+
+    def _specialize(self):
+        shape = max(self._samples, key=self._samples.get)
+
+        self.shape = shape
+        self._specialized = None
+
+        if shape.pattern is not None:
+            try:
+                self._specialized = compile_format(shape.pattern, builder=self.builder)
+            except ValueError:
+                # Not a layout compile_format supports
+                pass
+
+        if self._specialized is None:
+            self._specialized = self._get_kind_parser(shape.kind)
+
+        self._samples = {}
+        self._samplecount = 0
+
+    def _end_window(self):
+        if self._windowmisses * 2 > self.samplesize:
+            # The column has drifted to a different shape
+            self.shape = None
+            self._specialized = None
+
+        self._windowcount = 0
+        self._windowmisses = 0
+
+    def _get_kind_parser(self, kind):
+        # Parsers which skip working out what kind of string is being parsed
+        builder = self.builder
+        intervaldelimiter = self.intervaldelimiter
+        datetimedelimiter = self.datetimedelimiter
+
+        if kind == ColumnKind.Date:
+            return lambda isostr: parse_date(isostr, builder=builder)
+
+        if kind == ColumnKind.Datetime:
+            return lambda isostr: parse_datetime(
+                isostr, delimiter=datetimedelimiter, builder=builder
+            )
+
+        if kind == ColumnKind.Duration:
+            return lambda isostr: parse_duration(isostr, builder=builder)
+
+        if kind == ColumnKind.Interval:
+            return lambda isostr: parse_interval(
+                isostr,
+                intervaldelimiter=intervaldelimiter,
+                datetimedelimiter=datetimedelimiter,
+                builder=builder,
+            )
+
+        return lambda isostr: parse_repeating_interval(
+            isostr,
+            intervaldelimiter=intervaldelimiter,
+            datetimedelimiter=datetimedelimiter,
+            builder=builder,
+        )
+
+
+def _infer_date_pattern(datestr, datetuple):
+    if "-" in datestr:
+        separator = "-"
+    else:
+        separator = ""
+
+    if datetuple.DDD is not None:
+        return "YYYY" + separator + "DDD"
+
+    if datetuple.D is not None:
+        return "YYYY" + separator + "Www" + separator + "D"
+
+    if datetuple.Www is not None:
+        return "YYYY" + separator + "Www"
+
+    if datetuple.DD is not None:
+        return "YYYY" + separator + "MM" + separator + "DD"
+
+    if datetuple.MM is not None:
+        return "YYYY-MM"
+
+    if len(datetuple.YYYY) == 4:
+        return "YYYY"
+
+    # Truncated years have no pattern
+    return None
+
+
+def _infer_time_pattern(timestr, timetuple):
+    pattern = "hh"
+    position = 2
+    loweststr = timetuple.hh
+
+    for componentstr, name in ((timetuple.mm, "mm"), (timetuple.ss, "ss")):
+        if componentstr is not None:
+            if timestr[position] == ":":
+                pattern += ":"
+                position += 1
+
+            pattern += name
+            position += 2
+            loweststr = componentstr
+
+    if "." in loweststr:
+        # Keep the decimal sign as given, TimeTuples always use "."
+        pattern += timestr[position] + "f" * (len(loweststr) - loweststr.index(".") - 1)
+
+    if timetuple.tz is not None:
+        if timetuple.tz.Z is True:
+            pattern += "Z"
+        else:
+            pattern += TIMEZONE_PATTERNS[len(timetuple.tz.name)]
+
+    return pattern
@@ -22,3 +22,28 @@ def is_string(tocheck):
         return isinstance(tocheck, str) or isinstance(tocheck, unicode)
 
     return isinstance(tocheck, str)
+
+
+def is_bytes(tocheck):
+    return isinstance(tocheck, (bytes, bytearray, memoryview))
+
+
+def decode_utf8(tocheck):
+    # Native strings are bytes on Python 2, decode them so each non-ASCII
+    # character is a single character
+    if PY2:  # pragma: no cover
+        if isinstance(tocheck, str):
+            return tocheck.decode("utf-8")
+
+    return tocheck
+
+
+def decode_ascii(tocheck):
+    # Decodes bytes-like values directly from their buffer, memoryview
+    # slices are not copied to bytes first. Non-ASCII values raise a
+    # UnicodeDecodeError, which is a ValueError
+    if PY2:  # pragma: no cover
+        # bytes of a memoryview is its repr on Python 2
+        return bytearray(tocheck).decode("ascii")
+
+    return str(tocheck, "ascii")
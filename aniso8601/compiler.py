@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from collections import namedtuple
+from operator import itemgetter
+
+from aniso8601.builders import DateTuple, TimeTuple, TupleBuilder
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.compat import decode_utf8, is_string
+from aniso8601.date import parse_date
+from aniso8601.exceptions import ISOFormatError
+from aniso8601.time import parse_datetime, parse_time
+from aniso8601.timezone import TIMEZONE_TUPLES, UTC_TIMEZONE_TUPLE, parse_timezone_tuple
+
+DATE_COMPONENTS = ("YYYY", "MM", "DD", "Www", "D", "DDD")
+TIME_COMPONENTS = ("hh", "mm", "ss")
+
+# Pattern tokens, in the order they are tried, with the number of digits
+# they consume, a "W" prefix is matched as a literal
+PATTERN_TOKENS = (
+    ("YYYY", 4),
+    ("DDD", 3),
+    ("Www", 2),
+    ("MM", 2),
+    ("DD", 2),
+    ("D", 1),
+    ("hh", 2),
+    ("mm", 2),
+    ("ss", 2),
+)
+
+# Decoded, so they compare with the decoded pattern on Python 2
+TIMEZONE_SIGN = decode_utf8("±")
+TIMEZONE_TOKENS = tuple(decode_utf8(token) for token in ("±hh:mm", "±hhmm", "±hh"))
+
+Layout = namedtuple(
+    "Layout",
+    [
+        "length",
+        "components",
+        "literals",
+        "fraction",
+        "timezone",
+        "date",
+        "time",
+        "delimiter",
+    ],
+)
+
+
+def compile_format(pattern, builder=PythonTimeBuilder, fallback=False):
+    # Given a pattern describing a single date, time, or datetime layout,
+    # for example YYYY-MM-DDThh:mm:ss.ffffffZ, return a function that parses
+    # strings in only that layout with fixed slices. Range checking is still
+    # done by the builder. Strings that do not match the layout raise an
+    # ISOFormatError, or are parsed with the general parse_date, parse_time,
+    # or parse_datetime if fallback is True.
+    #
+    # Pattern tokens are:
+    #
+    # YYYY, MM, DD, Www, D, DDD
+    # hh, mm, ss
+    # .f... or ,f... for a fixed width decimal fraction of the lowest order
+    # time component, one f per digit
+    # Z, ±hh:mm, ±hhmm, ±hh for the time zone, ± matching + or -
+    #
+    # Any other character must appear literally.
+    if is_string(pattern) is False:
+        raise ValueError("Format must be string.")
+
+    layout = _compile_layout(pattern)
+
+    if len(layout.date) != 0 and len(layout.time) != 0:
+
+        def generalparse(isostr):
+            return parse_datetime(isostr, delimiter=layout.delimiter, builder=builder)
+
+    elif len(layout.date) != 0:
+
+        def generalparse(isostr):
+            return parse_date(isostr, builder=builder)
+
+    else:
+
+        def generalparse(isostr):
+            return parse_time(isostr, builder=builder)
+
+    # Only layouts the general parsers accept, and slice the same way,
+    # can be compiled
+    tupleparse = _make_parser(pattern, layout, TupleBuilder, None)
+    sample = _make_sample(pattern, layout)
+
+    try:
+        supported = tupleparse(sample) == _parse_general_tuple(layout, sample)
+    except (ValueError, NotImplementedError):
+        supported = False
+
+    if supported is False:
+        raise ValueError('"{0}" is not a supported ISO 8601 format.'.format(pattern))
+
+    if fallback is True:
+        return _make_parser(pattern, layout, builder, generalparse)
+
+    return _make_parser(pattern, layout, builder, None)
+
+
+def _compile_layout(pattern):
+    # Splits the pattern into the slices for each component, and the
+    # positions of the literal characters, which are positions in the
+    # decoded pattern
+    text = decode_utf8(pattern)
+
+    components = {}
+    literals = []
+    fraction = None
+    timezone = None
+
+    index = 0
+
+    while index < len(text):
+        token = None
+
+        for name, width in PATTERN_TOKENS:
+            if text.startswith(name, index) is True:
+                token = name
+                break
+
+        if token is not None:
+            if token in components:
+                raise ValueError(
+                    '"{0}" is not a supported ISO 8601 format.'.format(pattern)
+                )
+
+            start = index
+
+            if token == "Www":
+                literals.append((index, "W"))
+                start += 1
+
+            components[token] = slice(start, start + width)
+            index += len(token)
+        elif text[index] in ".," and text.startswith("f", index + 1):
+            # Decimal fraction
+            end = index + 1
+
+            while end < len(text) and text[end] == "f":
+                end += 1
+
+            literals.append((index, text[index]))
+            fraction = slice(index + 1, end)
+            index = end
+        elif text[index] == "Z":
+            literals.append((index, "Z"))
+            timezone = (index, index + 1, None, None)
+            index += 1
+        elif text[index] == TIMEZONE_SIGN:
+            for name in TIMEZONE_TOKENS:
+                if text.startswith(name, index) is True:
+                    break
+            else:
+                raise ValueError(
+                    '"{0}" is not a supported ISO 8601 format.'.format(pattern)
+                )
+
+            hourslice = slice(index + 1, index + 3)
+            minuteslice = None
+
+            if name == TIMEZONE_TOKENS[0]:
+                literals.append((index + 3, ":"))
+                minuteslice = slice(index + 4, index + 6)
+            elif name == TIMEZONE_TOKENS[1]:
+                minuteslice = slice(index + 3, index + 5)
+
+            timezone = (index, index + len(name), hourslice, minuteslice)
+            index += len(name)
+        else:
+            literals.append((index, text[index]))
+            index += 1
+
+        if timezone is not None and index < len(text):
+            # Nothing may follow the time zone
+            raise ValueError(
+                '"{0}" is not a supported ISO 8601 format.'.format(pattern)
+            )
+
+    date = [name for name in DATE_COMPONENTS if name in components]
+    time = [name for name in TIME_COMPONENTS if name in components]
+
+    if len(date) == 0 and len(time) == 0:
+        raise ValueError('"{0}" is not a supported ISO 8601 format.'.format(pattern))
+
+    delimiter = None
+
+    if len(date) != 0 and len(time) != 0:
+        # Everything between the date and time is the delimiter
+        delimiter = text[
+            max(components[name].stop for name in date) : min(
+                components[name].start for name in time
+            )
+        ]
+
+    return Layout(
+        len(text), components, literals, fraction, timezone, date, time, delimiter
+    )
+
+
+def _make_parser(pattern, layout, builder, generalparse):
+    length = layout.length
+    components = layout.components
+    fraction = layout.fraction
+    timezone = layout.timezone
+
+    # All numeric fields are sliced at once, a trailing None stands in for
+    # any components not in the layout
+    fieldslices = [
+        components[name]
+        for name in DATE_COMPONENTS + TIME_COMPONENTS
+        if name in components
+    ]
+
+    if fraction is not None:
+        fieldslices.append(fraction)
+
+    if timezone is not None and timezone[2] is not None:
+        fieldslices.append(timezone[2])
+
+        if timezone[3] is not None:
+            fieldslices.append(timezone[3])
+
+    fieldgetter = itemgetter(*fieldslices)
+    noneindex = len(fieldslices)
+
+    def fieldindex(componentslice):
+        if componentslice is None:
+            return noneindex
+
+        return fieldslices.index(componentslice)
+
+    dategetter = itemgetter(
+        *[fieldindex(components.get(name)) for name in DATE_COMPONENTS]
+    )
+    timegetter = itemgetter(
+        *[fieldindex(components.get(name)) for name in TIME_COMPONENTS]
+    )
+
+    if len(layout.literals) != 0:
+        literalgetter = itemgetter(*[index for index, _ in layout.literals])
+        literals = literalgetter(decode_utf8(pattern))
+    else:
+        literalgetter = None
+        literals = None
+
+    if fraction is not None:
+        fractionindex = fieldindex(fraction)
+    else:
+        fractionindex = None
+
+    if timezone is not None and timezone[2] is not None:
+        signindex = timezone[0]
+        tzslice = slice(timezone[0], timezone[1])
+    else:
+        signindex = None
+
+    isdate = len(layout.date) != 0
+    istime = len(layout.time) != 0
+
+    def mismatch(isostr):
+        if generalparse is not None:
+            # The general parsers decode bytes-like values, and raise for
+            # anything else
+            return generalparse(isostr)
+
+        if is_string(isostr) is False:
+            raise ValueError("Value must be string.")
+
+        raise ISOFormatError(
+            '"{0}" does not match the format "{1}".'.format(isostr, pattern)
+        )
+
+    def parse(isostr):
+        if (
+            is_string(isostr) is False
+            or len(isostr) != length
+            or (literalgetter is not None and literalgetter(isostr) != literals)
+        ):
+            return mismatch(isostr)
+
+        fields = fieldgetter(isostr)
+
+        if noneindex == 1:
+            # A single slice is returned as is
+            fields = (fields,)
+
+        if "".join(fields).isdigit() is False:
+            return mismatch(isostr)
+
+        fields += (None,)
+
+        if isdate is True:
+            datetuple = DateTuple(*dategetter(fields))
+
+            if istime is False:
+                return builder.build_date(
+                    YYYY=datetuple.YYYY,
+                    MM=datetuple.MM,
+                    DD=datetuple.DD,
+                    Www=datetuple.Www,
+                    D=datetuple.D,
+                    DDD=datetuple.DDD,
+                )
+
+        hourstr, minutestr, secondstr = timegetter(fields)
+
+        if fractionindex is not None:
+            fractionalstr = "." + fields[fractionindex]
+
+            if secondstr is not None:
+                secondstr += fractionalstr
+            elif minutestr is not None:
+                minutestr += fractionalstr
+            else:
+                hourstr += fractionalstr
+
+        if timezone is None:
+            tz = None
+        elif signindex is None:
+            tz = UTC_TIMEZONE_TUPLE
+        else:
+            tz = TIMEZONE_TUPLES.get(isostr[tzslice])
+
+            if tz is None:
+                try:
+                    tz = parse_timezone_tuple(isostr[tzslice])
+                except ISOFormatError:
+                    # Offsets parse_timezone_tuple rejects, a sign other
+                    # than + or -, or a negative zero offset, don't match the
+                    # layout, range errors are raised by the builder
+                    return mismatch(isostr)
+
+        if isdate is True:
+            return builder.build_datetime(
+                datetuple, TimeTuple(hourstr, minutestr, secondstr, tz)
+            )
+
+        return builder.build_time(hh=hourstr, mm=minutestr, ss=secondstr, tz=tz)
+
+    return parse
+
+
+def _make_sample(pattern, layout):
+    # A string in the layout with a different digit in each position,
+    # so any difference in slicing shows up in the parse result
+    text = decode_utf8(pattern)
+    sample = list(text)
+
+    for index, character in enumerate(text):
+        if character in "YMDWwhmsf":
+            sample[index] = str(index % 9 + 1)
+
+    for index, literal in layout.literals:
+        sample[index] = literal
+
+    if layout.timezone is not None and layout.timezone[2] is not None:
+        sample[layout.timezone[0]] = "+"
+
+    return "".join(sample)
+
+
+def _parse_general_tuple(layout, isostr):
+    if len(layout.date) != 0 and len(layout.time) != 0:
+        return parse_datetime(isostr, delimiter=layout.delimiter, builder=TupleBuilder)
+
+    if len(layout.date) != 0:
+        return parse_date(isostr, builder=TupleBuilder)
+
+    return parse_time(isostr, builder=TupleBuilder)
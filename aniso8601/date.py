@@ -6,12 +6,132 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
-from aniso8601.builders import TupleBuilder
+from collections import namedtuple
+from operator import itemgetter
+
 from aniso8601.builders.python import PythonTimeBuilder
-from aniso8601.compat import is_string
+from aniso8601.builders.validating import ValidatingBuilder
+from aniso8601.compat import decode_ascii, is_bytes, is_string
 from aniso8601.exceptions import ISOFormatError
 from aniso8601.resolution import DateResolution
 
+DateShape = namedtuple("DateShape", ["plan", "build", "resolution"])
+
+
+def _build_year(builder, yearstr):
+    return builder.build_date(
+        YYYY=yearstr, MM=None, DD=None, Www=None, D=None, DDD=None
+    )
+
+
+def _build_month(builder, componentstrs):
+    yearstr, monthstr = componentstrs
+
+    return builder.build_date(
+        YYYY=yearstr, MM=monthstr, DD=None, Www=None, D=None, DDD=None
+    )
+
+
+def _build_calendar_day(builder, componentstrs):
+    yearstr, monthstr, daystr = componentstrs
+
+    return builder.build_date(
+        YYYY=yearstr, MM=monthstr, DD=daystr, Www=None, D=None, DDD=None
+    )
+
+
+def _build_week(builder, componentstrs):
+    yearstr, weekstr = componentstrs
+
+    return builder.build_date(
+        YYYY=yearstr, MM=None, DD=None, Www=weekstr, D=None, DDD=None
+    )
+
+
+def _build_weekday(builder, componentstrs):
+    yearstr, weekstr, weekdaystr = componentstrs
+
+    return builder.build_date(
+        YYYY=yearstr, MM=None, DD=None, Www=weekstr, D=weekdaystr, DDD=None
+    )
+
+
+def _build_ordinal_day(builder, componentstrs):
+    yearstr, ordinaldaystr = componentstrs
+
+    return builder.build_date(
+        YYYY=yearstr, MM=None, DD=None, Www=None, D=None, DDD=ordinaldaystr
+    )
+
+
+# Supported date formats, keyed by their shape fingerprint, the length of
+# the string and the positions of the first and last "-" and the first "W"
+# (-1 when not present). The plan slices the component strings out of the
+# date, which are then passed to build, along with the builder.
+DATE_SHAPES = {
+    # Y[YYY]
+    (1, -1, -1, -1): DateShape(
+        itemgetter(slice(0, 1)), _build_year, DateResolution.Year
+    ),
+    (2, -1, -1, -1): DateShape(
+        itemgetter(slice(0, 2)), _build_year, DateResolution.Year
+    ),
+    (3, -1, -1, -1): DateShape(
+        itemgetter(slice(0, 3)), _build_year, DateResolution.Year
+    ),
+    (4, -1, -1, -1): DateShape(
+        itemgetter(slice(0, 4)), _build_year, DateResolution.Year
+    ),
+    # YYYY-MM-DD
+    (10, 4, 7, -1): DateShape(
+        itemgetter(slice(0, 4), slice(5, 7), slice(8, 10)),
+        _build_calendar_day,
+        DateResolution.Day,
+    ),
+    # YYYYMMDD
+    (8, -1, -1, -1): DateShape(
+        itemgetter(slice(0, 4), slice(4, 6), slice(6, 8)),
+        _build_calendar_day,
+        DateResolution.Day,
+    ),
+    # YYYY-MM
+    (7, 4, 4, -1): DateShape(
+        itemgetter(slice(0, 4), slice(5, 7)), _build_month, DateResolution.Month
+    ),
+    # YYYY-Www
+    (8, 4, 4, 5): DateShape(
+        itemgetter(slice(0, 4), slice(6, 8)), _build_week, DateResolution.Week
+    ),
+    # YYYYWww
+    (7, -1, -1, 4): DateShape(
+        itemgetter(slice(0, 4), slice(5, 7)), _build_week, DateResolution.Week
+    ),
+    # YYYY-Www-D
+    (10, 4, 8, 5): DateShape(
+        itemgetter(slice(0, 4), slice(6, 8), slice(9, 10)),
+        _build_weekday,
+        DateResolution.Weekday,
+    ),
+    # YYYYWwwD
+    (8, -1, -1, 4): DateShape(
+        itemgetter(slice(0, 4), slice(5, 7), slice(7, 8)),
+        _build_weekday,
+        DateResolution.Weekday,
+    ),
+    # YYYY-DDD
+    (8, 4, 4, -1): DateShape(
+        itemgetter(slice(0, 4), slice(5, 8)),
+        _build_ordinal_day,
+        DateResolution.Ordinal,
+    ),
+    # YYYYDDD
+    (7, -1, -1, -1): DateShape(
+        itemgetter(slice(0, 4), slice(4, 7)),
+        _build_ordinal_day,
+        DateResolution.Ordinal,
+    ),
+}
+
 
 def get_date_resolution(isodatestr):
     # Valid string formats are:
@@ -26,34 +146,17 @@ def get_date_resolution(isodatestr):
     # YYYYWwwD
     # YYYY-DDD
     # YYYYDDD
-    isodatetuple = parse_date(isodatestr, builder=TupleBuilder)
-
-    if isodatetuple.DDD is not None:
-        # YYYY-DDD
-        # YYYYDDD
-        return DateResolution.Ordinal
-
-    if isodatetuple.D is not None:
-        # YYYY-Www-D
-        # YYYYWwwD
-        return DateResolution.Weekday
-
-    if isodatetuple.Www is not None:
-        # YYYY-Www
-        # YYYYWww
-        return DateResolution.Week
+    #
+    # The resolution is known from the shape, so nothing needs to be built
+    return _split_date(isodatestr)[0].resolution
 
-    if isodatetuple.DD is not None:
-        # YYYY-MM-DD
-        # YYYYMMDD
-        return DateResolution.Day
 
-    if isodatetuple.MM is not None:
-        # YYYY-MM
-        return DateResolution.Month
+def parse_date_with_resolution(isodatestr, builder=PythonTimeBuilder):
+    # As parse_date, but returns (date, resolution), the resolution is known
+    # from the shape found when splitting the date
+    dateshape, componentstrs = _split_date(isodatestr)
 
-    # Y[YYY]
-    return DateResolution.Year
+    return (dateshape.build(builder, componentstrs), dateshape.resolution)
 
 
 def parse_date(isodatestr, builder=PythonTimeBuilder):
@@ -70,93 +173,60 @@ def parse_date(isodatestr, builder=PythonTimeBuilder):
     # YYYYWwwD
     # YYYY-DDD
     # YYYYDDD
+    dateshape, componentstrs = _split_date(isodatestr)
+
+    return dateshape.build(builder, componentstrs)
+
+
+def is_valid_date(isodatestr):
+    # Returns True if parse_date would accept isodatestr with the default
+    # builder, the range checks are run but nothing is built
+    try:
+        parse_date(isodatestr, builder=ValidatingBuilder)
+    except (ValueError, NotImplementedError):
+        return False
+
+    return True
+
+
+def get_date_fingerprint(isodatestr, dateend):
+    # Returns the DATE_SHAPES key for isodatestr[0:dateend]
+    return (
+        dateend,
+        isodatestr.find("-", 0, dateend),
+        isodatestr.rfind("-", 0, dateend),
+        isodatestr.find("W", 0, dateend),
+    )
+
+
+def _split_date(isodatestr):
+    # Returns the DATE_SHAPES entry for isodatestr, and the component strings
+    # sliced out by its plan, raises the appropriate error if isodatestr is
+    # not a supported ISO 8601 date
     if is_string(isodatestr) is False:
-        raise ValueError("Date must be string.")
+        if is_bytes(isodatestr) is False:
+            raise ValueError("Date must be string.")
+
+        isodatestr = decode_ascii(isodatestr)
+
+    dateshape = DATE_SHAPES.get(
+        (
+            len(isodatestr),
+            isodatestr.find("-"),
+            isodatestr.rfind("-"),
+            isodatestr.find("W"),
+        )
+    )
+
+    if dateshape is not None:
+        componentstrs = dateshape.plan(isodatestr)
+
+        if "".join(componentstrs).isdigit() is True:
+            return (dateshape, componentstrs)
 
     if isodatestr.startswith("+") or isodatestr.startswith("-"):
         raise NotImplementedError(
             "ISO 8601 extended year representation " "not supported."
         )
 
-    if len(isodatestr) == 0 or isodatestr.count("-") > 2:
-        raise ISOFormatError('"{0}" is not a valid ISO 8601 date.'.format(isodatestr))
-
-    yearstr = None
-    monthstr = None
-    daystr = None
-    weekstr = None
-    weekdaystr = None
-    ordinaldaystr = None
-
-    if len(isodatestr) <= 4:
-        # Y[YYY]
-        yearstr = isodatestr
-    elif "W" in isodatestr:
-        if len(isodatestr) == 10:
-            # YYYY-Www-D
-            yearstr = isodatestr[0:4]
-            weekstr = isodatestr[6:8]
-            weekdaystr = isodatestr[9]
-        elif len(isodatestr) == 8:
-            if "-" in isodatestr:
-                # YYYY-Www
-                yearstr = isodatestr[0:4]
-                weekstr = isodatestr[6:]
-            else:
-                # YYYYWwwD
-                yearstr = isodatestr[0:4]
-                weekstr = isodatestr[5:7]
-                weekdaystr = isodatestr[7]
-        elif len(isodatestr) == 7:
-            # YYYYWww
-            yearstr = isodatestr[0:4]
-            weekstr = isodatestr[5:]
-    elif len(isodatestr) == 7:
-        if "-" in isodatestr:
-            # YYYY-MM
-            yearstr = isodatestr[0:4]
-            monthstr = isodatestr[5:]
-        else:
-            # YYYYDDD
-            yearstr = isodatestr[0:4]
-            ordinaldaystr = isodatestr[4:]
-    elif len(isodatestr) == 8:
-        if "-" in isodatestr:
-            # YYYY-DDD
-            yearstr = isodatestr[0:4]
-            ordinaldaystr = isodatestr[5:]
-        else:
-            # YYYYMMDD
-            yearstr = isodatestr[0:4]
-            monthstr = isodatestr[4:6]
-            daystr = isodatestr[6:]
-    elif len(isodatestr) == 10:
-        # YYYY-MM-DD
-        yearstr = isodatestr[0:4]
-        monthstr = isodatestr[5:7]
-        daystr = isodatestr[8:]
-    else:
-        raise ISOFormatError('"{0}" is not a valid ISO 8601 date.'.format(isodatestr))
-
-    hascomponent = False
-
-    for componentstr in [yearstr, monthstr, daystr, weekstr, weekdaystr, ordinaldaystr]:
-        if componentstr is not None:
-            hascomponent = True
-
-            if componentstr.isdigit() is False:
-                raise ISOFormatError(
-                    '"{0}" is not a valid ISO 8601 date.'.format(isodatestr)
-                )
-
-    if hascomponent is False:
-        raise ISOFormatError('"{0}" is not a valid ISO 8601 date.'.format(isodatestr))
-
-    return builder.build_date(
-        YYYY=yearstr,
-        MM=monthstr,
-        DD=daystr,
-        Www=weekstr,
-        D=weekdaystr,
-        DDD=ordinaldaystr,
-    )
+    raise ISOFormatError('"{0}" is not a valid ISO 8601 date.'.format(isodatestr))
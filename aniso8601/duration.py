@@ -9,6 +9,7 @@
 from aniso8601 import compat
 from aniso8601.builders import TupleBuilder
 from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.builders.validating import ValidatingBuilder
 from aniso8601.date import parse_date
 from aniso8601.decimalfraction import normalize
 from aniso8601.exceptions import ISOFormatError
@@ -24,6 +25,21 @@ def get_duration_resolution(isodurationstr):
     # P<date>T<time>
     isodurationtuple = parse_duration(isodurationstr, builder=TupleBuilder)
 
+    return _get_duration_resolution(isodurationtuple)
+
+
+def parse_duration_with_resolution(isodurationstr, builder=PythonTimeBuilder):
+    # As parse_duration, but returns (duration, resolution), the resolution
+    # is read from the same parse used to build the duration
+    isodurationtuple = parse_duration(isodurationstr, builder=TupleBuilder)
+
+    return (
+        builder._build_object(isodurationtuple),
+        _get_duration_resolution(isodurationtuple),
+    )
+
+
+def _get_duration_resolution(isodurationtuple):
     if isodurationtuple.TnS is not None:
         return DurationResolution.Seconds
 
@@ -54,7 +70,10 @@ def parse_duration(isodurationstr, builder=PythonTimeBuilder):
     # P<date>T<time>
 
     if compat.is_string(isodurationstr) is False:
-        raise ValueError("Duration must be string.")
+        if compat.is_bytes(isodurationstr) is False:
+            raise ValueError("Duration must be string.")
+
+        isodurationstr = compat.decode_ascii(isodurationstr)
 
     if len(isodurationstr) == 0:
         raise ISOFormatError(
@@ -79,6 +98,17 @@ def parse_duration(isodurationstr, builder=PythonTimeBuilder):
     )
 
 
+def is_valid_duration(isodurationstr):
+    # Returns True if parse_duration would accept isodurationstr with the
+    # default builder, the range checks are run but nothing is built
+    try:
+        parse_duration(isodurationstr, builder=ValidatingBuilder)
+    except (ValueError, NotImplementedError):
+        return False
+
+    return True
+
+
 def _parse_duration_prescribed(isodurationstr):
     # durationstr can be of the form PnYnMnDTnHnMnS or PnW
 
@@ -6,9 +6,11 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
-from aniso8601.builders import DatetimeTuple, DateTuple, TupleBuilder
+from aniso8601.builders import DatetimeTuple, DateTuple, TimeTuple, TupleBuilder
 from aniso8601.builders.python import PythonTimeBuilder
-from aniso8601.compat import is_string
+from aniso8601.builders.stdlib import get_utc_builder
+from aniso8601.builders.validating import ValidatingBuilder
+from aniso8601.compat import decode_ascii, is_bytes, is_string
 from aniso8601.date import parse_date
 from aniso8601.duration import parse_duration
 from aniso8601.exceptions import ISOFormatError
@@ -42,6 +44,49 @@ def get_repeating_interval_resolution(
     return _get_interval_resolution(repeatingintervaltuple.interval)
 
 
+def parse_interval_with_resolution(
+    isointervalstr,
+    intervaldelimiter="/",
+    datetimedelimiter="T",
+    builder=PythonTimeBuilder,
+):
+    # As parse_interval, but returns (interval, resolution), the resolution
+    # is read from the same parse used to build the interval
+    isointervaltuple = parse_interval(
+        isointervalstr,
+        intervaldelimiter=intervaldelimiter,
+        datetimedelimiter=datetimedelimiter,
+        builder=TupleBuilder,
+    )
+
+    return (
+        builder._build_object(isointervaltuple),
+        _get_interval_resolution(isointervaltuple),
+    )
+
+
+def parse_repeating_interval_with_resolution(
+    isointervalstr,
+    intervaldelimiter="/",
+    datetimedelimiter="T",
+    builder=PythonTimeBuilder,
+):
+    # As parse_repeating_interval, but returns (repeating interval,
+    # resolution), the resolution is read from the same parse used to build
+    # the repeating interval
+    repeatingintervaltuple = parse_repeating_interval(
+        isointervalstr,
+        intervaldelimiter=intervaldelimiter,
+        datetimedelimiter=datetimedelimiter,
+        builder=TupleBuilder,
+    )
+
+    return (
+        builder._build_object(repeatingintervaltuple),
+        _get_interval_resolution(repeatingintervaltuple.interval),
+    )
+
+
 def _get_interval_resolution(intervaltuple):
     if intervaltuple.start is not None and intervaltuple.end is not None:
         return max(
@@ -89,12 +134,15 @@ def _get_interval_component_resolution(componenttuple):
 
         # Y[YYY]
         return IntervalResolution.Year
-    elif type(componenttuple) is DatetimeTuple:
-        # Datetime
-        if componenttuple.time.ss is not None:
+    elif type(componenttuple) is DatetimeTuple or type(componenttuple) is TimeTuple:
+        # Datetime, or the time of a concise end
+        if type(componenttuple) is DatetimeTuple:
+            componenttuple = componenttuple.time
+
+        if componenttuple.ss is not None:
             return IntervalResolution.Seconds
 
-        if componenttuple.time.mm is not None:
+        if componenttuple.mm is not None:
             return IntervalResolution.Minutes
 
         return IntervalResolution.Hours
@@ -126,6 +174,7 @@ def parse_interval(
     intervaldelimiter="/",
     datetimedelimiter="T",
     builder=PythonTimeBuilder,
+    to_utc=False,
 ):
     # Given a string representing an ISO 8601 interval, return an
     # interval built by the given builder. Valid formats are:
@@ -143,9 +192,16 @@ def parse_interval(
     #
     # Is expressly not supported as there is no way to provide the additional
     # required context.
+    #
+    # With to_utc, datetimes are built in UTC by the UTCTimeBuilder.
+    if to_utc is True:
+        builder = get_utc_builder(builder)
 
     if is_string(isointervalstr) is False:
-        raise ValueError("Interval must be string.")
+        if is_bytes(isointervalstr) is False:
+            raise ValueError("Interval must be string.")
+
+        isointervalstr = decode_ascii(isointervalstr)
 
     if len(isointervalstr) == 0:
         raise ISOFormatError("Interval string is empty.")
@@ -174,6 +230,22 @@ def parse_interval(
     )
 
 
+def is_valid_interval(isointervalstr, intervaldelimiter="/", datetimedelimiter="T"):
+    # Returns True if parse_interval would accept isointervalstr with the
+    # default builder, the range checks are run but nothing is built
+    try:
+        parse_interval(
+            isointervalstr,
+            intervaldelimiter=intervaldelimiter,
+            datetimedelimiter=datetimedelimiter,
+            builder=ValidatingBuilder,
+        )
+    except (ValueError, NotImplementedError):
+        return False
+
+    return True
+
+
 def parse_repeating_interval(
     isointervalstr,
     intervaldelimiter="/",
@@ -186,8 +258,11 @@ def parse_repeating_interval(
     # Rnn/<interval>
     # R/<interval>
 
-    if not isinstance(isointervalstr, str):
-        raise ValueError("Interval must be string.")
+    if is_string(isointervalstr) is False:
+        if is_bytes(isointervalstr) is False:
+            raise ValueError("Interval must be string.")
+
+        isointervalstr = decode_ascii(isointervalstr)
 
     if len(isointervalstr) == 0:
         raise ISOFormatError("Repeating interval string is empty.")
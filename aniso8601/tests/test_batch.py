@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import unittest
+
+import aniso8601
+from aniso8601.batch import (
+    ErrorPolicy,
+    parse_dates,
+    parse_datetimes,
+    parse_durations,
+    parse_intervals,
+    parse_times,
+)
+from aniso8601.builders import TupleBuilder
+from aniso8601.builders.epoch import EpochTimeBuilder
+from aniso8601.exceptions import ISOFormatError, MonthOutOfBoundsError
+from aniso8601.tests.compat import mock
+
+
+class TestBatchFunctions(unittest.TestCase):
+    def test_parse_batch(self):
+        testtuples = (
+            (parse_dates, aniso8601.parse_date, ("1981-04-05", "1981095", "2004-W53")),
+            (parse_times, aniso8601.parse_time, ("23:21:28.5124", "232128Z", "23")),
+            (
+                parse_datetimes,
+                aniso8601.parse_datetime,
+                (
+                    "1981-04-05T23:21:28.512400Z",
+                    "19810405T2321+01:30",
+                    "1981-04-05T23:21:28-00:30",
+                ),
+            ),
+            (parse_durations, aniso8601.parse_duration, ("P1Y2M3D", "PT1H", "P1W")),
+            (
+                parse_intervals,
+                aniso8601.parse_interval,
+                ("1981-04-05/P1D", "P1M/1981-04-05T01:01:00", "1980-03-05/1981-04-05"),
+            ),
+        )
+
+        for testtuple in testtuples:
+            expected = [testtuple[1](isostr) for isostr in testtuple[2]]
+
+            self.assertEqual(testtuple[0](testtuple[2]), expected)
+            self.assertEqual(testtuple[0](iter(testtuple[2])), expected)
+            self.assertEqual(
+                testtuple[0](testtuple[2], builder=TupleBuilder),
+                [testtuple[1](isostr, builder=TupleBuilder) for isostr in testtuple[2]],
+            )
+
+            out = [None] * 4
+
+            self.assertIs(testtuple[0](testtuple[2], out=out), out)
+            self.assertEqual(out, expected + [None])
+
+    def test_parse_batch_delimiters(self):
+        self.assertEqual(
+            parse_datetimes(["1981-04-05 23:21:28Z", "1981-04-05 23"], delimiter=" "),
+            [
+                aniso8601.parse_datetime("1981-04-05 23:21:28Z", delimiter=" "),
+                aniso8601.parse_datetime("1981-04-05 23", delimiter=" "),
+            ],
+        )
+
+        self.assertEqual(
+            parse_intervals(
+                ["1981-04-05 01:01:00--P1D"],
+                intervaldelimiter="--",
+                datetimedelimiter=" ",
+            ),
+            [
+                aniso8601.parse_interval(
+                    "1981-04-05 01:01:00--P1D",
+                    intervaldelimiter="--",
+                    datetimedelimiter=" ",
+                )
+            ],
+        )
+
+    def test_parse_batch_mockbuilder(self):
+        mockBuilder = mock.Mock()
+        mockBuilder.build_datetime.return_value = "result"
+
+        self.assertEqual(
+            parse_datetimes(["1981-04-05T23:21:28Z"], builder=mockBuilder), ["result"]
+        )
+
+        mockBuilder.build_datetime.assert_called_once_with(
+            aniso8601.parse_date("1981-04-05", builder=TupleBuilder),
+            aniso8601.parse_time("23:21:28Z", builder=TupleBuilder),
+        )
+
+    def test_parse_datetimes_fields(self):
+        # Builders setting INTEGER_FIELDS are built as by parse_datetime
+        with mock.patch.object(
+            EpochTimeBuilder,
+            "build_datetime_fields",
+            wraps=EpochTimeBuilder.build_datetime_fields,
+        ) as mockBuildDatetimeFields:
+            self.assertEqual(
+                parse_datetimes(["1981-04-05T23:21:28Z"], builder=EpochTimeBuilder),
+                [
+                    aniso8601.parse_datetime(
+                        "1981-04-05T23:21:28Z", builder=EpochTimeBuilder
+                    )
+                ],
+            )
+
+            self.assertEqual(mockBuildDatetimeFields.call_count, 2)
+
+    def test_parse_batch_errors(self):
+        isostrs = [
+            "1981-04-05T23:21:28",
+            "badTbad",
+            "1981-13-05T23:21:28",
+            None,
+            "+1981",
+        ]
+
+        first = aniso8601.parse_datetime(isostrs[0])
+
+        with self.assertRaises(ISOFormatError):
+            parse_datetimes(isostrs)
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            parse_datetimes(isostrs[2:])
+
+        with self.assertRaises(ValueError):
+            parse_datetimes(isostrs[3:], out=[None])
+
+        self.assertEqual(parse_datetimes(isostrs, errors=ErrorPolicy.Skip), [first])
+        self.assertEqual(
+            parse_datetimes(isostrs, errors=ErrorPolicy.Null),
+            [first, None, None, None, None],
+        )
+
+        results, errors = parse_datetimes(isostrs, errors=ErrorPolicy.Collect)
+
+        self.assertEqual(results, [first, None, None, None, None])
+        self.assertEqual([index for index, _ in errors], [1, 2, 3, 4])
+        self.assertIsInstance(errors[0][1], ISOFormatError)
+        self.assertIsInstance(errors[1][1], MonthOutOfBoundsError)
+        self.assertIsInstance(errors[2][1], ValueError)
+
+        # Signed years are not supported
+        self.assertEqual(
+            parse_dates(["1981", "+1981"], errors=ErrorPolicy.Collect)[1][0][0], 1
+        )
+        self.assertIsInstance(
+            parse_dates(["1981", "+1981"], errors=ErrorPolicy.Collect)[1][0][1],
+            NotImplementedError,
+        )
+
+        out = ["unchanged"] * 5
+
+        self.assertIs(parse_datetimes(isostrs, errors=ErrorPolicy.Skip, out=out), out)
+        self.assertEqual(out, [first] + ["unchanged"] * 4)
+
+        self.assertIs(parse_datetimes(isostrs, errors=ErrorPolicy.Null, out=out), out)
+        self.assertEqual(out, [first, None, None, None, None])
+
+        results, errors = parse_datetimes(isostrs, errors=ErrorPolicy.Collect, out=out)
+
+        self.assertIs(results, out)
+        self.assertEqual(len(errors), 4)
+
+    def test_parse_batch_badpolicy(self):
+        for testtuple in (-1, 4, None, "skip"):
+            with self.assertRaises(ValueError):
+                parse_dates(["1981-04-05"], errors=testtuple)
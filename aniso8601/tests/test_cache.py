@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.builders import TupleBuilder
+from aniso8601.cache import (
+    CacheInfo,
+    ParseCache,
+    _is_immutable,
+    cached_parse_date,
+    cached_parse_datetime,
+    cached_parse_duration,
+    cached_parse_interval,
+    cached_parse_repeating_interval,
+    cached_parse_time,
+    disable_cache,
+    enable_cache,
+    get_cache,
+)
+from aniso8601.exceptions import ISOFormatError, MonthOutOfBoundsError
+from aniso8601.tests.compat import mock
+
+
+class TestParseCache(unittest.TestCase):
+    def test_parse(self):
+        cache = ParseCache()
+
+        testtuples = (
+            (cache.parse_date, aniso8601.parse_date, ("1981-04-05",)),
+            (cache.parse_time, aniso8601.parse_time, ("23:21:28.512400+01:00",)),
+            (cache.parse_datetime, aniso8601.parse_datetime, ("1981-04-05T23:21Z",)),
+            (cache.parse_datetime, aniso8601.parse_datetime, ("1981-04-05 23", " ")),
+            (cache.parse_duration, aniso8601.parse_duration, ("P1Y2M3DT4H54M6S",)),
+            (cache.parse_interval, aniso8601.parse_interval, ("1981-04-05/P1M",)),
+            (
+                cache.parse_interval,
+                aniso8601.parse_interval,
+                ("2007-12-14 13:30--15:30", "--", " "),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = testtuple[0](*testtuple[2])
+
+            self.assertEqual(result, testtuple[1](*testtuple[2]))
+            self.assertIs(testtuple[0](*testtuple[2]), result)
+
+            self.assertEqual(
+                testtuple[0](*testtuple[2], builder=TupleBuilder),
+                testtuple[1](*testtuple[2], builder=TupleBuilder),
+            )
+
+        self.assertEqual(cache.cache_info(), CacheInfo(7, 14, 0, 1024, 14))
+
+    def test_parse_repeating_interval(self):
+        cache = ParseCache()
+
+        for _ in range(2):
+            self.assertEqual(
+                list(cache.parse_repeating_interval("R3/1981-04-05/P1D")),
+                list(aniso8601.parse_repeating_interval("R3/1981-04-05/P1D")),
+            )
+
+        self.assertEqual(
+            list(cache.parse_repeating_interval("R3|1981-04-05|P1D", "|")),
+            list(cache.parse_repeating_interval("R3|1981-04-05|P1D", "|", "T")),
+        )
+
+        # The generator is built again for each hit
+        first = cache.parse_repeating_interval("R3/1981-04-05/P1D")
+        second = cache.parse_repeating_interval("R3/1981-04-05/P1D")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(next(first), datetime.date(1981, 4, 5))
+        self.assertEqual(next(second), datetime.date(1981, 4, 5))
+
+        self.assertEqual(cache.cache_info(), CacheInfo(4, 2, 0, 1024, 2))
+
+    def test_parse_key(self):
+        cache = ParseCache()
+
+        cache.parse_datetime("1981-04-05T23:21:28")
+        cache.parse_datetime("1981-04-05T23:21:28", builder=TupleBuilder)
+        cache.parse_interval("1981-04-05/P1D")
+        cache.parse_interval("1981-04-05/P1D", datetimedelimiter=" ")
+
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 4, 0, 1024, 4))
+
+        # Defaults given explicitly are the same key
+        cache.parse_datetime("1981-04-05T23:21:28", "T")
+        cache.parse_interval("1981-04-05/P1D", "/", "T")
+
+        self.assertEqual(cache.cache_info(), CacheInfo(2, 4, 0, 1024, 4))
+
+    def test_parse_bytes(self):
+        cache = ParseCache()
+
+        result = cache.parse_date("1981-04-05")
+
+        self.assertIs(cache.parse_date(b"1981-04-05"), result)
+        self.assertIs(cache.parse_date(bytearray(b"1981-04-05")), result)
+        self.assertIs(cache.parse_date(memoryview(b"1981-04-05")), result)
+
+        with self.assertRaises(ValueError):
+            cache.parse_date(bytearray(b"1981-04-05\xc3\xa9"))
+
+        self.assertEqual(cache.cache_info(), CacheInfo(3, 1, 0, 1024, 1))
+
+    def test_parse_badtype(self):
+        cache = ParseCache()
+
+        for testtuple in (None, 1, False, 1.234):
+            with self.assertRaises(ValueError):
+                cache.parse_date(testtuple)
+
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 0, 1024, 0))
+
+    def test_parse_error(self):
+        cache = ParseCache()
+
+        for _ in range(2):
+            with self.assertRaises(MonthOutOfBoundsError):
+                cache.parse_date("1981-13-05")
+
+            with self.assertRaises(ISOFormatError):
+                cache.parse_duration("P1Y2M3X")
+
+        # Errors are not stored
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 4, 0, 1024, 0))
+
+    def test_parse_mutable(self):
+        cache = ParseCache()
+
+        mockBuilder = mock.Mock()
+        mockBuilder._build_object.side_effect = lambda parsetuple: [parsetuple]
+
+        first = cache.parse_date("1981-04-05", builder=mockBuilder)
+        second = cache.parse_date("1981-04-05", builder=mockBuilder)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(mockBuilder._build_object.call_count, 2)
+        mockBuilder._build_object.assert_called_with(
+            aniso8601.parse_date("1981-04-05", builder=TupleBuilder)
+        )
+
+    def test_eviction(self):
+        cache = ParseCache(maxsize=2)
+
+        cache.parse_duration("PT1M")
+        cache.parse_duration("P1D")
+        cache.parse_duration("PT1M")
+
+        # P1D is the least recently used
+        cache.parse_duration("PT1H")
+
+        self.assertEqual(cache.cache_info(), CacheInfo(1, 3, 1, 2, 2))
+
+        cache.parse_duration("PT1M")
+        cache.parse_duration("P1D")
+
+        self.assertEqual(cache.cache_info(), CacheInfo(2, 4, 2, 2, 2))
+
+    def test_clear(self):
+        cache = ParseCache()
+
+        cache.parse_duration("PT1M")
+        cache.parse_duration("PT1M")
+
+        cache.clear()
+
+        self.assertEqual(cache.cache_info(), CacheInfo(0, 0, 0, 1024, 0))
+
+    def test_badsize(self):
+        for testtuple in (0, -1):
+            with self.assertRaises(ValueError):
+                ParseCache(maxsize=testtuple)
+
+
+class TestCacheFunctions(unittest.TestCase):
+    def tearDown(self):
+        disable_cache()
+
+    def test_enable_cache(self):
+        self.assertIsNone(get_cache())
+
+        cache = enable_cache(maxsize=10)
+
+        self.assertIs(get_cache(), cache)
+        self.assertEqual(cache.maxsize, 10)
+
+        self.assertIsNot(enable_cache(), cache)
+
+        disable_cache()
+
+        self.assertIsNone(get_cache())
+
+    def test_cached_parse(self):
+        testtuples = (
+            (cached_parse_date, aniso8601.parse_date, ("1981-04-05",), {}),
+            (cached_parse_time, aniso8601.parse_time, ("23:21:28Z",), {}),
+            (
+                cached_parse_datetime,
+                aniso8601.parse_datetime,
+                ("1981-04-05 23:21",),
+                {"delimiter": " "},
+            ),
+            (cached_parse_duration, aniso8601.parse_duration, ("PT1M",), {}),
+            (
+                cached_parse_interval,
+                aniso8601.parse_interval,
+                ("1981-04-05T23:21|P1D",),
+                {"intervaldelimiter": "|"},
+            ),
+        )
+
+        for testtuple in testtuples:
+            # Disabled
+            self.assertEqual(
+                testtuple[0](*testtuple[2], **testtuple[3]),
+                testtuple[1](*testtuple[2], **testtuple[3]),
+            )
+
+        cache = enable_cache()
+
+        for testtuple in testtuples:
+            result = testtuple[0](*testtuple[2], **testtuple[3])
+
+            self.assertEqual(result, testtuple[1](*testtuple[2], **testtuple[3]))
+            self.assertIs(testtuple[0](*testtuple[2], **testtuple[3]), result)
+
+            # Skip the cache for a single call
+            self.assertIsNot(
+                testtuple[0](*testtuple[2], cache=False, **testtuple[3]), result
+            )
+
+        self.assertEqual(cache.cache_info(), CacheInfo(5, 5, 0, 1024, 5))
+
+        # A cache given for a single call
+        othercache = ParseCache()
+
+        for testtuple in testtuples:
+            testtuple[0](*testtuple[2], cache=othercache, **testtuple[3])
+
+        self.assertEqual(othercache.cache_info(), CacheInfo(0, 5, 0, 1024, 5))
+        self.assertEqual(cache.cache_info(), CacheInfo(5, 5, 0, 1024, 5))
+
+    def test_cached_parse_repeating_interval(self):
+        expected = list(aniso8601.parse_repeating_interval("R3/1981-04-05/P1D"))
+
+        self.assertEqual(
+            list(cached_parse_repeating_interval("R3/1981-04-05/P1D")), expected
+        )
+
+        cache = enable_cache()
+
+        for _ in range(2):
+            self.assertEqual(
+                list(cached_parse_repeating_interval("R3/1981-04-05/P1D")), expected
+            )
+
+        self.assertEqual(cache.cache_info(), CacheInfo(1, 1, 0, 1024, 1))
+
+    def test_is_immutable(self):
+        testtuples = (
+            (datetime.date(1981, 4, 5), True),
+            (datetime.datetime(1981, 4, 5), True),
+            (datetime.time(1), True),
+            (datetime.timedelta(1), True),
+            ((datetime.date(1981, 4, 5), datetime.date(1981, 4, 6)), True),
+            (aniso8601.parse_interval("P1D/1981-04-05", builder=TupleBuilder), True),
+            (None, True),
+            ([datetime.date(1981, 4, 5)], False),
+            ((datetime.date(1981, 4, 5), []), False),
+            (iter([]), False),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(_is_immutable(testtuple[0]), testtuple[1])
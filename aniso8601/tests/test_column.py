@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import unittest
+
+import aniso8601
+from aniso8601.builders import TupleBuilder
+from aniso8601.column import ColumnKind, ColumnParser, ColumnShape
+from aniso8601.exceptions import ISOFormatError, MonthOutOfBoundsError
+from aniso8601.tests.compat import mock
+
+
+class TestColumnParser(unittest.TestCase):
+    def test_infer_shape(self):
+        testtuples = (
+            ("1981-04-05", ColumnShape(ColumnKind.Date, "YYYY-MM-DD")),
+            ("19810405", ColumnShape(ColumnKind.Date, "YYYYMMDD")),
+            ("1981-04", ColumnShape(ColumnKind.Date, "YYYY-MM")),
+            ("1981", ColumnShape(ColumnKind.Date, "YYYY")),
+            ("19", ColumnShape(ColumnKind.Date, None)),
+            ("2004-W53", ColumnShape(ColumnKind.Date, "YYYY-Www")),
+            ("2004W536", ColumnShape(ColumnKind.Date, "YYYYWwwD")),
+            ("1981-095", ColumnShape(ColumnKind.Date, "YYYY-DDD")),
+            (
+                "1981-04-05T23:21:28.512400Z",
+                ColumnShape(ColumnKind.Datetime, "YYYY-MM-DDThh:mm:ss.ffffffZ"),
+            ),
+            (
+                "19810405T2321,5+0130",
+                ColumnShape(ColumnKind.Datetime, "YYYYMMDDThhmm,f±hhmm"),
+            ),
+            (
+                "2004-W53-6T23-12:34",
+                ColumnShape(ColumnKind.Datetime, "YYYY-Www-DThh±hh:mm"),
+            ),
+            (
+                "1981095T23:21:28+01",
+                ColumnShape(ColumnKind.Datetime, "YYYYDDDThh:mm:ss±hh"),
+            ),
+            ("19T23", ColumnShape(ColumnKind.Datetime, None)),
+            ("P1Y2M3D", ColumnShape(ColumnKind.Duration, None)),
+            ("1981-04-05/P1D", ColumnShape(ColumnKind.Interval, None)),
+            ("R3/1981-04-05/P1D", ColumnShape(ColumnKind.RepeatingInterval, None)),
+        )
+
+        for testtuple in testtuples:
+            parser = ColumnParser(builder=TupleBuilder, samplesize=1)
+
+            parser.parse(testtuple[0])
+
+            self.assertEqual(parser.shape, testtuple[1])
+
+    def test_parse_column(self):
+        testtuples = (
+            (
+                aniso8601.parse_datetime,
+                [
+                    "1981-04-{0:02}T23:21:28.5124{0:02}Z".format(day)
+                    for day in range(1, 31)
+                ],
+            ),
+            (aniso8601.parse_date, ["1981-{0:03}".format(day) for day in range(1, 31)]),
+            (aniso8601.parse_duration, ["PT{0}H".format(hour) for hour in range(30)]),
+            (
+                aniso8601.parse_interval,
+                ["1981-04-{0:02}/P1D".format(day) for day in range(1, 31)],
+            ),
+        )
+
+        for testtuple in testtuples:
+            parser = ColumnParser(samplesize=10)
+
+            self.assertEqual(
+                parser.parse_column(testtuple[1]),
+                [testtuple[0](isostr) for isostr in testtuple[1]],
+            )
+            self.assertIsNotNone(parser.shape)
+
+        parser = ColumnParser(samplesize=2)
+        isostrs = ["R2/1981-04-05/P1D", "R/PT1H/1981-04-05T01:01:00"] * 2
+
+        for result, isostr in zip(parser.parse_column(isostrs), isostrs):
+            self.assertEqual(
+                next(result), next(aniso8601.parse_repeating_interval(isostr))
+            )
+
+    def test_parse_specialized(self):
+        parser = ColumnParser(builder=TupleBuilder, samplesize=3)
+
+        isostrs = ["1981-04-05T23:21:28Z", "1981-04-06T23:21:28Z", "1981-04-07T23:21"]
+
+        with mock.patch.object(
+            aniso8601.column, "compile_format", wraps=aniso8601.column.compile_format
+        ) as mockCompileFormat:
+            parser.parse_column(isostrs)
+
+            mockCompileFormat.assert_called_once_with(
+                "YYYY-MM-DDThh:mm:ssZ", builder=TupleBuilder
+            )
+
+        self.assertEqual(
+            parser.shape, ColumnShape(ColumnKind.Datetime, "YYYY-MM-DDThh:mm:ssZ")
+        )
+
+        # Values that don't match the shape are parsed by the general parsers
+        for isostr in ("1981-04-05T23:21:28+01:00", "1981-04-05", "P1D"):
+            self.assertEqual(
+                parser.parse(isostr),
+                parser._parse_tuple(isostr)[1],
+            )
+
+    def test_parse_specialized_timezone(self):
+        parser = ColumnParser(samplesize=3)
+
+        parser.parse_column(["1981-04-05T23:21:28Z"] * 5)
+
+        self.assertEqual(
+            parser.shape, ColumnShape(ColumnKind.Datetime, "YYYY-MM-DDThh:mm:ssZ")
+        )
+
+        # Other characters in place of Z are not taken as UTC
+        with self.assertRaises(ISOFormatError):
+            parser.parse("1981-04-05T23:21:28X")
+
+    def test_parse_specialized_uncompiled(self):
+        parser = ColumnParser(builder=TupleBuilder, samplesize=1)
+
+        with mock.patch.object(aniso8601.column, "compile_format") as mockCompileFormat:
+            mockCompileFormat.side_effect = ValueError
+
+            parser.parse("1981-04-05")
+
+        self.assertEqual(parser.shape, ColumnShape(ColumnKind.Date, "YYYY-MM-DD"))
+        self.assertEqual(
+            parser.parse("1981-04-06"),
+            aniso8601.parse_date("1981-04-06", builder=TupleBuilder),
+        )
+
+    def test_parse_drift(self):
+        parser = ColumnParser(samplesize=4)
+
+        parser.parse_column(["1981-04-05"] * 4)
+
+        self.assertEqual(parser.shape, ColumnShape(ColumnKind.Date, "YYYY-MM-DD"))
+
+        # A minority of mismatches keeps the shape
+        parser.parse_column(["1981-04-05", "P1D", "1981-04-05", "1981-04-05"])
+
+        self.assertEqual(parser.shape, ColumnShape(ColumnKind.Date, "YYYY-MM-DD"))
+
+        # A majority starts inferring the shape again
+        self.assertEqual(
+            parser.parse_column(["P1D", "P2D", "P3D", "1981-04-05"]),
+            [
+                aniso8601.parse_duration("P1D"),
+                aniso8601.parse_duration("P2D"),
+                aniso8601.parse_duration("P3D"),
+                aniso8601.parse_date("1981-04-05"),
+            ],
+        )
+
+        self.assertIsNone(parser.shape)
+
+        parser.parse_column(["P1D", "P2D", "P3D", "P4D"])
+
+        self.assertEqual(parser.shape, ColumnShape(ColumnKind.Duration, None))
+
+    def test_parse_errors(self):
+        parser = ColumnParser(samplesize=1)
+
+        for testtuple in (None, 1, False, 1.234):
+            with self.assertRaises(ValueError):
+                parser.parse(testtuple)
+
+        with self.assertRaises(ISOFormatError):
+            parser.parse("bad")
+
+        parser.parse("1981-04-05")
+
+        with self.assertRaises(ISOFormatError):
+            parser.parse("1981-04-0a")
+
+        with self.assertRaises(MonthOutOfBoundsError):
+            parser.parse("1981-13-05")
+
+        for testtuple in (None, 1, False, 1.234):
+            with self.assertRaises(ValueError):
+                parser.parse(testtuple)
+
+    def test_samplesize(self):
+        with self.assertRaises(ValueError):
+            ColumnParser(samplesize=0)
@@ -8,7 +8,7 @@
 
 import unittest
 
-from aniso8601.compat import PY2, is_string
+from aniso8601.compat import PY2, decode_ascii, is_bytes, is_string
 
 
 class TestCompatFunctions(unittest.TestCase):
@@ -25,3 +25,24 @@ class TestCompatFunctions(unittest.TestCase):
         self.assertFalse(is_string(4.56))
         self.assertFalse(is_string([]))
         self.assertFalse(is_string({}))
+
+    def test_is_bytes(self):
+        self.assertTrue(is_bytes(b"asdf"))
+        self.assertTrue(is_bytes(bytearray(b"asdf")))
+        self.assertTrue(is_bytes(memoryview(b"asdf")))
+
+        self.assertFalse(is_bytes(None))
+        self.assertFalse(is_bytes(123))
+        self.assertFalse(is_bytes([]))
+
+        if PY2 is False:
+            self.assertFalse(is_bytes("asdf"))
+
+    def test_decode_ascii(self):
+        self.assertEqual(decode_ascii(b"asdf"), "asdf")
+        self.assertEqual(decode_ascii(bytearray(b"asdf")), "asdf")
+        self.assertEqual(decode_ascii(memoryview(b"xasdfx")[1:-1]), "asdf")
+        self.assertEqual(decode_ascii(b""), "")
+
+        with self.assertRaises(ValueError):
+            decode_ascii(b"\xff")
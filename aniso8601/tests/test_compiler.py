@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import datetime
+import unittest
+
+import aniso8601
+from aniso8601.builders import DateTuple, TimeTuple, TimezoneTuple, TupleBuilder
+from aniso8601.compiler import compile_format
+from aniso8601.exceptions import ISOFormatError, MonthOutOfBoundsError
+from aniso8601.tests.compat import mock
+
+
+class TestCompilerFunctions(unittest.TestCase):
+    def test_compile_format_datetime(self):
+        testtuples = (
+            (
+                "YYYY-MM-DDThh:mm:ss.ffffffZ",
+                "1981-04-05T23:21:28.512400Z",
+                (
+                    DateTuple("1981", "04", "05", None, None, None),
+                    TimeTuple(
+                        "23",
+                        "21",
+                        "28.512400",
+                        TimezoneTuple(False, True, None, None, "Z"),
+                    ),
+                ),
+            ),
+            (
+                "YYYYMMDDThhmmss,fff±hhmm",
+                "19810405T232128,512-1234",
+                (
+                    DateTuple("1981", "04", "05", None, None, None),
+                    TimeTuple(
+                        "23",
+                        "21",
+                        "28.512",
+                        TimezoneTuple(True, None, "12", "34", "-1234"),
+                    ),
+                ),
+            ),
+            (
+                "YYYY-Www-D hh:mm±hh:mm",
+                "2004-W53-6 23:21+00:00",
+                (
+                    DateTuple("2004", None, None, "53", "6", None),
+                    TimeTuple(
+                        "23",
+                        "21",
+                        None,
+                        TimezoneTuple(False, None, "00", "00", "+00:00"),
+                    ),
+                ),
+            ),
+            (
+                "YYYY-DDDThh.ff±hh",
+                "1981-095T23.50-01",
+                (
+                    DateTuple("1981", None, None, None, None, "095"),
+                    TimeTuple(
+                        "23.50",
+                        None,
+                        None,
+                        TimezoneTuple(True, None, "01", None, "-01"),
+                    ),
+                ),
+            ),
+            (
+                "YYYY-MM-DDThh:mm.f",
+                "1981-04-05T23:21.5",
+                (
+                    DateTuple("1981", "04", "05", None, None, None),
+                    TimeTuple("23", "21.5", None, None),
+                ),
+            ),
+        )
+
+        for testtuple in testtuples:
+            mockBuilder = mock.Mock()
+            mockBuilder.build_datetime.return_value = testtuple[2]
+
+            parser = compile_format(testtuple[0], builder=mockBuilder)
+
+            self.assertEqual(parser(testtuple[1]), testtuple[2])
+            mockBuilder.build_datetime.assert_called_once_with(*testtuple[2])
+
+            # Same result as the general parser
+            self.assertEqual(
+                compile_format(testtuple[0], builder=TupleBuilder)(testtuple[1]),
+                aniso8601.parse_datetime(
+                    testtuple[1],
+                    delimiter=testtuple[0][testtuple[0].find("h") - 1],
+                    builder=TupleBuilder,
+                ),
+            )
+
+    def test_compile_format_date(self):
+        testtuples = (
+            ("YYYY", "1981", {"YYYY": "1981"}),
+            ("YYYY-MM", "1981-04", {"YYYY": "1981", "MM": "04"}),
+            ("YYYYMMDD", "19810405", {"YYYY": "1981", "MM": "04", "DD": "05"}),
+            ("YYYYWww", "2004W53", {"YYYY": "2004", "Www": "53"}),
+            ("YYYYDDD", "1981095", {"YYYY": "1981", "DDD": "095"}),
+        )
+
+        for testtuple in testtuples:
+            expectedargs = {
+                "YYYY": None,
+                "MM": None,
+                "DD": None,
+                "Www": None,
+                "D": None,
+                "DDD": None,
+            }
+            expectedargs.update(testtuple[2])
+
+            mockBuilder = mock.Mock()
+            mockBuilder.build_date.return_value = expectedargs
+
+            parser = compile_format(testtuple[0], builder=mockBuilder)
+
+            self.assertEqual(parser(testtuple[1]), expectedargs)
+            mockBuilder.build_date.assert_called_once_with(**expectedargs)
+
+    def test_compile_format_time(self):
+        testtuples = (
+            ("hh", "23", {"hh": "23", "mm": None, "ss": None, "tz": None}),
+            (
+                "hhmmssZ",
+                "232128Z",
+                {
+                    "hh": "23",
+                    "mm": "21",
+                    "ss": "28",
+                    "tz": TimezoneTuple(False, True, None, None, "Z"),
+                },
+            ),
+        )
+
+        for testtuple in testtuples:
+            mockBuilder = mock.Mock()
+            mockBuilder.build_time.return_value = testtuple[2]
+
+            parser = compile_format(testtuple[0], builder=mockBuilder)
+
+            self.assertEqual(parser(testtuple[1]), testtuple[2])
+            mockBuilder.build_time.assert_called_once_with(**testtuple[2])
+
+    def test_compile_format_pythontimebuilder(self):
+        parser = compile_format("YYYY-MM-DDThh:mm:ss.ffffff±hh:mm")
+
+        result = parser("1981-04-05T23:21:28.512400+01:30")
+
+        self.assertEqual(result, aniso8601.parse_datetime(result.isoformat()))
+        self.assertEqual(result.utcoffset(), datetime.timedelta(hours=1, minutes=30))
+
+        # Range checking is left to the builder
+        with self.assertRaises(MonthOutOfBoundsError):
+            parser("1981-13-05T23:21:28.512400+01:30")
+
+    def test_compile_format_mismatch(self):
+        parser = compile_format("YYYY-MM-DDThh:mm:ss±hh:mm", builder=TupleBuilder)
+
+        testtuples = (
+            "1981-04-05T23:21:28",
+            "1981-04-05 23:21:28+01:00",
+            "1981-04-05T23:21:2a+01:00",
+            "1981-04-05T23:21:28*01:00",
+            "1981-04-05T23:21:28-00:00",
+        )
+
+        for testtuple in testtuples:
+            with self.assertRaises(ISOFormatError):
+                parser(testtuple)
+
+        for testtuple in (None, 1, bytearray(b"1981-04-05T23:21:28+01:00")):
+            with self.assertRaises(ValueError):
+                parser(testtuple)
+
+        parser = compile_format("YYYYMMDDThh±hh", builder=TupleBuilder)
+
+        with self.assertRaises(ISOFormatError):
+            parser("19810405T23-00")
+
+        # Z is matched as a literal
+        for fallback in (False, True):
+            parser = compile_format(
+                "YYYY-MM-DDThh:mm:ssZ", builder=TupleBuilder, fallback=fallback
+            )
+
+            with self.assertRaises(ISOFormatError):
+                parser("1981-04-05T23:21:28X")
+
+    def test_compile_format_fallback(self):
+        parser = compile_format(
+            "YYYY-MM-DDThh:mm:ssZ", builder=TupleBuilder, fallback=True
+        )
+
+        self.assertEqual(
+            parser("1981-04-05T23:21:28.5+01:00"),
+            aniso8601.parse_datetime(
+                "1981-04-05T23:21:28.5+01:00", builder=TupleBuilder
+            ),
+        )
+
+        with self.assertRaises(ISOFormatError):
+            parser("1981-04-05T23:21:28-00:00")
+
+        parser = compile_format("YYYY-MM-DD", builder=TupleBuilder, fallback=True)
+
+        self.assertEqual(
+            parser("1981095"), aniso8601.parse_date("1981095", builder=TupleBuilder)
+        )
+
+        parser = compile_format("hh:mm", builder=TupleBuilder, fallback=True)
+
+        self.assertEqual(
+            parser("2321Z"), aniso8601.parse_time("2321Z", builder=TupleBuilder)
+        )
+
+        # Bytes-like values are decoded by the general parsers
+        parser = compile_format(
+            "YYYY-MM-DDThh:mm:ssZ", builder=TupleBuilder, fallback=True
+        )
+
+        for testtuple in (
+            b"1981-04-05T23:21:28+01:00",
+            bytearray(b"1981-04-05T23:21:28+01:00"),
+            memoryview(b"1981-04-05T23:21:28+01:00"),
+        ):
+            self.assertEqual(
+                parser(testtuple),
+                aniso8601.parse_datetime(
+                    "1981-04-05T23:21:28+01:00", builder=TupleBuilder
+                ),
+            )
+
+        for testtuple in (None, 1):
+            with self.assertRaises(ValueError):
+                parser(testtuple)
+
+        parser = compile_format("hh:mm", builder=TupleBuilder, fallback=True)
+
+        with self.assertRaises(ValueError):
+            parser(None)
+
+    def test_compile_format_badtype(self):
+        testtuples = (None, 1, False, 1.234)
+
+        for testtuple in testtuples:
+            with self.assertRaises(ValueError):
+                compile_format(testtuple)
+
+    def test_compile_format_badformat(self):
+        testtuples = (
+            "YYYY-MMDD",
+            "YYYY-YYYY",
+            "hh:mmss",
+            "YYYY-MM-DDhh",
+            "hhZ:mm",
+            "hh±h",
+            "MM-DD",
+            "T:-",
+            "",
+        )
+
+        for testtuple in testtuples:
+            with self.assertRaises(ValueError):
+                compile_format(testtuple)
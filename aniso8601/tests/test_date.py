@@ -9,7 +9,15 @@
 import unittest
 
 import aniso8601
-from aniso8601.date import get_date_resolution, parse_date
+from aniso8601.builders import TupleBuilder
+from aniso8601.date import (
+    DATE_SHAPES,
+    get_date_fingerprint,
+    get_date_resolution,
+    is_valid_date,
+    parse_date,
+    parse_date_with_resolution,
+)
 from aniso8601.exceptions import DayOutOfBoundsError, ISOFormatError
 from aniso8601.resolution import DateResolution
 from aniso8601.tests.compat import mock
@@ -78,6 +86,7 @@ class TestDateResolutionFunctions(unittest.TestCase):
             "201-01-23",
             "201401230",
             "201401",
+            "2014x01x23",
             "",
         )
 
@@ -85,6 +94,66 @@ class TestDateResolutionFunctions(unittest.TestCase):
             with self.assertRaises(ISOFormatError):
                 get_date_resolution(testtuple)
 
+    def test_get_date_resolution_mockbuilder(self):
+        # The resolution is read from the shape, nothing is built
+        with mock.patch.object(
+            aniso8601.date.PythonTimeBuilder, "build_date"
+        ) as mockBuildDate:
+            self.assertEqual(get_date_resolution("1981-04-05"), DateResolution.Day)
+
+        mockBuildDate.assert_not_called()
+
+
+class TestDateShapeFunctions(unittest.TestCase):
+    def test_get_date_fingerprint(self):
+        testtuples = (
+            ("2013", 4, (4, -1, -1, -1)),
+            ("19", 2, (2, -1, -1, -1)),
+            ("1981-04-05", 10, (10, 4, 7, -1)),
+            ("19810405", 8, (8, -1, -1, -1)),
+            ("1981-04", 7, (7, 4, 4, -1)),
+            ("2004-W53", 8, (8, 4, 4, 5)),
+            ("2004W53", 7, (7, -1, -1, 4)),
+            ("2004-W53-6", 10, (10, 4, 8, 5)),
+            ("2004W536", 8, (8, -1, -1, 4)),
+            ("1981-095", 8, (8, 4, 4, -1)),
+            ("1981095", 7, (7, -1, -1, -1)),
+            ("1981-04-05T23:21:28-12:34", 10, (10, 4, 7, -1)),
+            ("2004W536T23:21:28-12:34", 8, (8, -1, -1, 4)),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                get_date_fingerprint(testtuple[0], testtuple[1]), testtuple[2]
+            )
+
+    def test_date_shapes(self):
+        testtuples = (
+            ("2013", ("2013",), DateResolution.Year),
+            ("1981-04-05", ("1981", "04", "05"), DateResolution.Day),
+            ("19810405", ("1981", "04", "05"), DateResolution.Day),
+            ("1981-04", ("1981", "04"), DateResolution.Month),
+            ("2004-W53", ("2004", "53"), DateResolution.Week),
+            ("2004W53", ("2004", "53"), DateResolution.Week),
+            ("2004-W53-6", ("2004", "53", "6"), DateResolution.Weekday),
+            ("2004W536", ("2004", "53", "6"), DateResolution.Weekday),
+            ("1981-095", ("1981", "095"), DateResolution.Ordinal),
+            ("1981095", ("1981", "095"), DateResolution.Ordinal),
+        )
+
+        for testtuple in testtuples:
+            dateshape = DATE_SHAPES[
+                get_date_fingerprint(testtuple[0], len(testtuple[0]))
+            ]
+
+            if len(testtuple[1]) == 1:
+                # Single component plans return the component itself
+                self.assertEqual(dateshape.plan(testtuple[0]), testtuple[1][0])
+            else:
+                self.assertEqual(dateshape.plan(testtuple[0]), testtuple[1])
+
+            self.assertEqual(dateshape.resolution, testtuple[2])
+
 
 class TestDateParserFunctions(unittest.TestCase):
     def test_parse_date(self):
@@ -263,6 +332,90 @@ class TestDateParserFunctions(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_date(testtuple, builder=None)
 
+    def test_parse_date_bytes(self):
+        testtuples = ("1981-04-05", "1981095", "2004-W53-6")
+
+        for testtuple in testtuples:
+            expected = parse_date(testtuple, builder=TupleBuilder)
+            buffer = bytearray(b"<" + testtuple.encode("ascii") + b">")
+
+            for isobytes in (
+                testtuple.encode("ascii"),
+                bytearray(testtuple.encode("ascii")),
+                memoryview(buffer)[1:-1],
+            ):
+                self.assertEqual(parse_date(isobytes, builder=TupleBuilder), expected)
+
+        with self.assertRaises(ValueError):
+            parse_date("1981-04-05\u00e9".encode("utf-8"), builder=None)
+
+    def test_is_valid_date(self):
+        testtuples = (
+            ("1981-04-05", True),
+            (b"1981095", True),
+            ("2000-02-29", True),
+            ("9999-W52-5", True),
+            ("1900-02-29", False),
+            ("1981-13", False),
+            ("1981-366", False),
+            ("9999-W52-6", False),
+            ("9999-W53", False),
+            ("+1981-04-05", False),
+            ("1981-04-05T", False),
+            ("", False),
+            (None, False),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(is_valid_date(testtuple[0]), testtuple[1])
+
+            if testtuple[1] is True:
+                self.assertIsNotNone(parse_date(testtuple[0]))
+            else:
+                with self.assertRaises(
+                    (ValueError, OverflowError, NotImplementedError)
+                ):
+                    parse_date(testtuple[0])
+
+    def test_parse_date_with_resolution(self):
+        testtuples = (
+            ("19", DateResolution.Year),
+            ("1981-04", DateResolution.Month),
+            ("2004W53", DateResolution.Week),
+            (b"2004-W53-6", DateResolution.Weekday),
+            ("1981-04-05", DateResolution.Day),
+            ("1981095", DateResolution.Ordinal),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_date_with_resolution(testtuple[0]),
+                (parse_date(testtuple[0]), testtuple[1]),
+            )
+            self.assertEqual(
+                parse_date_with_resolution(testtuple[0], builder=TupleBuilder),
+                (parse_date(testtuple[0], builder=TupleBuilder), testtuple[1]),
+            )
+            self.assertEqual(get_date_resolution(testtuple[0]), testtuple[1])
+
+        with self.assertRaises(DayOutOfBoundsError):
+            parse_date_with_resolution("1981-02-29")
+
+        with self.assertRaises(ISOFormatError):
+            parse_date_with_resolution("1981-04x05")
+
+    def test_parse_date_with_resolution_mockbuilder(self):
+        mockBuilder = mock.Mock()
+        mockBuilder.build_date.return_value = mock.sentinel.date
+
+        self.assertEqual(
+            parse_date_with_resolution("1981-04-05", builder=mockBuilder),
+            (mock.sentinel.date, DateResolution.Day),
+        )
+        mockBuilder.build_date.assert_called_once_with(
+            YYYY="1981", MM="04", DD="05", Www=None, D=None, DDD=None
+        )
+
     def test_parse_date_badstr(self):
         testtuples = (
             "W53",
@@ -275,6 +428,9 @@ class TestDateParserFunctions(unittest.TestCase):
             "9999 W53",
             "20.50230",
             "198104",
+            "2014x01x23",
+            "0020140123",
+            "2004xW53x6",
             "bad",
             "",
         )
@@ -9,6 +9,7 @@
 import unittest
 
 import aniso8601
+from aniso8601.builders import TupleBuilder
 from aniso8601.duration import (
     _has_any_component,
     _parse_duration_combined,
@@ -16,7 +17,9 @@ from aniso8601.duration import (
     _parse_duration_prescribed_notime,
     _parse_duration_prescribed_time,
     get_duration_resolution,
+    is_valid_duration,
     parse_duration,
+    parse_duration_with_resolution,
 )
 from aniso8601.exceptions import ISOFormatError
 from aniso8601.resolution import DurationResolution
@@ -845,6 +848,75 @@ class TestDurationParserFunctions(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_duration(testtuple, builder=None)
 
+    def test_parse_duration_bytes(self):
+        testtuples = ("P1Y2M3DT4H54M6.5S", "P1W", "P0001-02-03T14:05:06")
+
+        for testtuple in testtuples:
+            expected = parse_duration(testtuple, builder=TupleBuilder)
+            buffer = bytearray(b"<" + testtuple.encode("ascii") + b">")
+
+            for isobytes in (
+                testtuple.encode("ascii"),
+                bytearray(testtuple.encode("ascii")),
+                memoryview(buffer)[1:-1],
+            ):
+                self.assertEqual(
+                    parse_duration(isobytes, builder=TupleBuilder), expected
+                )
+
+        with self.assertRaises(ValueError):
+            parse_duration("1981-04-05\u00e9".encode("utf-8"), builder=None)
+
+    def test_is_valid_duration(self):
+        testtuples = (
+            ("P1Y2M3DT4H54M6.5S", True),
+            (b"P1W", True),
+            ("P0003-06-04T12:30:05", True),
+            ("P999999999DT23H59M59.999999S", True),
+            ("P999999999DT23H1439M", False),
+            ("P1000000000D", False),
+            ("P0003-13-04T12:30:05", True),
+            ("P0003-06-04T12:30:05.0000001", True),
+            ("P1Y2M3X", False),
+            ("PT", False),
+            (None, False),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(is_valid_duration(testtuple[0]), testtuple[1])
+
+            if testtuple[1] is True:
+                self.assertIsNotNone(parse_duration(testtuple[0]))
+            else:
+                with self.assertRaises((ValueError, OverflowError)):
+                    parse_duration(testtuple[0])
+
+    def test_parse_duration_with_resolution(self):
+        testtuples = (
+            ("P1Y", DurationResolution.Years),
+            ("P1Y2.5M", DurationResolution.Months),
+            ("P1W", DurationResolution.Weeks),
+            (b"P1Y2M3D", DurationResolution.Days),
+            ("P1Y2M3DT4H", DurationResolution.Hours),
+            ("PT4H5M", DurationResolution.Minutes),
+            ("PT4H54M6,5S", DurationResolution.Seconds),
+            ("P0003-06-04T12:30:05", DurationResolution.Seconds),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_duration_with_resolution(testtuple[0]),
+                (parse_duration(testtuple[0]), testtuple[1]),
+            )
+            self.assertEqual(
+                parse_duration_with_resolution(testtuple[0], builder=TupleBuilder),
+                (parse_duration(testtuple[0], builder=TupleBuilder), testtuple[1]),
+            )
+            self.assertEqual(get_duration_resolution(testtuple[0]), testtuple[1])
+
+        with self.assertRaises(ISOFormatError):
+            parse_duration_with_resolution("P1Y2M3X")
+
     def test_parse_duration_nop(self):
         with self.assertRaises(ISOFormatError):
             # Duration must start with a P
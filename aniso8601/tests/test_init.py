@@ -47,3 +47,78 @@ class TestInitFunctions(unittest.TestCase):
             aniso8601.get_repeating_interval_resolution,
             aniso8601.interval.get_repeating_interval_resolution,
         )
+
+        self.assertEqual(aniso8601.compile_format, aniso8601.compiler.compile_format)
+        self.assertEqual(aniso8601.ColumnParser, aniso8601.column.ColumnParser)
+
+        self.assertEqual(aniso8601.parse_dates, aniso8601.batch.parse_dates)
+        self.assertEqual(aniso8601.parse_times, aniso8601.batch.parse_times)
+        self.assertEqual(aniso8601.parse_datetimes, aniso8601.batch.parse_datetimes)
+        self.assertEqual(aniso8601.parse_durations, aniso8601.batch.parse_durations)
+        self.assertEqual(aniso8601.parse_intervals, aniso8601.batch.parse_intervals)
+
+        self.assertEqual(aniso8601.ParseCache, aniso8601.cache.ParseCache)
+        self.assertEqual(aniso8601.cached_parse_date, aniso8601.cache.cached_parse_date)
+        self.assertEqual(aniso8601.cached_parse_time, aniso8601.cache.cached_parse_time)
+        self.assertEqual(
+            aniso8601.cached_parse_datetime, aniso8601.cache.cached_parse_datetime
+        )
+        self.assertEqual(
+            aniso8601.cached_parse_duration, aniso8601.cache.cached_parse_duration
+        )
+        self.assertEqual(
+            aniso8601.cached_parse_interval, aniso8601.cache.cached_parse_interval
+        )
+        self.assertEqual(
+            aniso8601.cached_parse_repeating_interval,
+            aniso8601.cache.cached_parse_repeating_interval,
+        )
+        self.assertEqual(aniso8601.enable_cache, aniso8601.cache.enable_cache)
+        self.assertEqual(aniso8601.disable_cache, aniso8601.cache.disable_cache)
+
+        self.assertEqual(aniso8601.try_parse_date, aniso8601.tryparse.try_parse_date)
+        self.assertEqual(aniso8601.try_parse_time, aniso8601.tryparse.try_parse_time)
+        self.assertEqual(
+            aniso8601.try_parse_datetime, aniso8601.tryparse.try_parse_datetime
+        )
+        self.assertEqual(
+            aniso8601.try_parse_duration, aniso8601.tryparse.try_parse_duration
+        )
+        self.assertEqual(
+            aniso8601.try_parse_interval, aniso8601.tryparse.try_parse_interval
+        )
+
+        self.assertEqual(aniso8601.is_valid_date, aniso8601.date.is_valid_date)
+        self.assertEqual(aniso8601.is_valid_time, aniso8601.time.is_valid_time)
+        self.assertEqual(aniso8601.is_valid_datetime, aniso8601.time.is_valid_datetime)
+        self.assertEqual(
+            aniso8601.is_valid_duration, aniso8601.duration.is_valid_duration
+        )
+        self.assertEqual(
+            aniso8601.is_valid_interval, aniso8601.interval.is_valid_interval
+        )
+
+        self.assertEqual(
+            aniso8601.parse_date_with_resolution,
+            aniso8601.date.parse_date_with_resolution,
+        )
+        self.assertEqual(
+            aniso8601.parse_time_with_resolution,
+            aniso8601.time.parse_time_with_resolution,
+        )
+        self.assertEqual(
+            aniso8601.parse_datetime_with_resolution,
+            aniso8601.time.parse_datetime_with_resolution,
+        )
+        self.assertEqual(
+            aniso8601.parse_duration_with_resolution,
+            aniso8601.duration.parse_duration_with_resolution,
+        )
+        self.assertEqual(
+            aniso8601.parse_interval_with_resolution,
+            aniso8601.interval.parse_interval_with_resolution,
+        )
+        self.assertEqual(
+            aniso8601.parse_repeating_interval_with_resolution,
+            aniso8601.interval.parse_repeating_interval_with_resolution,
+        )
@@ -6,6 +6,7 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
+import datetime
 import unittest
 
 import aniso8601
@@ -16,6 +17,7 @@ from aniso8601.builders import (
     IntervalTuple,
     TimeTuple,
     TimezoneTuple,
+    TupleBuilder,
 )
 from aniso8601.exceptions import ISOFormatError
 from aniso8601.interval import (
@@ -25,8 +27,11 @@ from aniso8601.interval import (
     _parse_interval_end,
     get_interval_resolution,
     get_repeating_interval_resolution,
+    is_valid_interval,
     parse_interval,
+    parse_interval_with_resolution,
     parse_repeating_interval,
+    parse_repeating_interval_with_resolution,
 )
 from aniso8601.resolution import IntervalResolution
 from aniso8601.tests.compat import mock
@@ -334,6 +339,19 @@ class TestIntervalParserFunctions(unittest.TestCase):
             IntervalResolution.Seconds,
         )
 
+        # Concise end
+        self.assertEqual(
+            get_interval_resolution("2007-12-14T13:30/15:30:01"),
+            IntervalResolution.Seconds,
+        )
+        self.assertEqual(
+            get_interval_resolution("2007-12-14T13:30:01/15"),
+            IntervalResolution.Seconds,
+        )
+        self.assertEqual(
+            get_interval_resolution("2007-12-14T13/15:30"), IntervalResolution.Minutes
+        )
+
     def test_get_interval_resolution_duration(self):
         self.assertEqual(
             get_interval_resolution("2014-11-12/P1Y2M3D"), IntervalResolution.Day
@@ -838,6 +856,155 @@ class TestIntervalParserFunctions(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_interval(testtuple, builder=None)
 
+    def test_parse_interval_bytes(self):
+        testtuples = (
+            "1981-04-05/P1D",
+            "P1M/1981-04-05T01:01:00",
+            "1980-03-05/1981-04-05",
+        )
+
+        for testtuple in testtuples:
+            expected = parse_interval(testtuple, builder=TupleBuilder)
+            buffer = bytearray(b"<" + testtuple.encode("ascii") + b">")
+
+            for isobytes in (
+                testtuple.encode("ascii"),
+                bytearray(testtuple.encode("ascii")),
+                memoryview(buffer)[1:-1],
+            ):
+                self.assertEqual(
+                    parse_interval(isobytes, builder=TupleBuilder), expected
+                )
+
+        with self.assertRaises(ValueError):
+            parse_interval("1981-04-05\u00e9".encode("utf-8"), builder=None)
+
+    @unittest.skipIf(
+        not hasattr(datetime, "timezone"), "datetime.timezone is not available."
+    )
+    def test_parse_interval_to_utc(self):
+        testtuples = (
+            (
+                "2007-12-14T13:30+01:00/15:30",
+                datetime.datetime(2007, 12, 14, 12, 30),
+                datetime.datetime(2007, 12, 14, 14, 30),
+            ),
+            (
+                "PT1H/2007-12-14T13:30-05",
+                datetime.datetime(2007, 12, 14, 18, 30),
+                datetime.datetime(2007, 12, 14, 17, 30),
+            ),
+            (
+                "2007-12-14T23:30-01/P1D",
+                datetime.datetime(2007, 12, 15, 0, 30),
+                datetime.datetime(2007, 12, 16, 0, 30),
+            ),
+        )
+
+        for testtuple in testtuples:
+            result = parse_interval(testtuple[0], to_utc=True)
+
+            self.assertEqual(
+                result,
+                (
+                    testtuple[1].replace(tzinfo=datetime.timezone.utc),
+                    testtuple[2].replace(tzinfo=datetime.timezone.utc),
+                ),
+            )
+            self.assertEqual(result, parse_interval(testtuple[0]))
+
+        with self.assertRaises(ValueError):
+            parse_interval("2007-12-14/P1D", builder=TupleBuilder, to_utc=True)
+
+    def test_is_valid_interval(self):
+        testtuples = (
+            ("1981-04-05T01:01:00/1981-04-05T01:01:00Z", "/", "T", True),
+            (b"P1M/1981-04-05", "/", "T", True),
+            ("2007-12-14 13:30--15:30", "--", " ", True),
+            ("1981-04-05/31", "/", "T", False),
+            ("9999-12-31/PT1S", "/", "T", True),
+            ("9999-12-31T23:59:59/PT1S", "/", "T", False),
+            ("P1D/0001-01-01", "/", "T", False),
+            ("P1D/0001-01-02", "/", "T", True),
+            ("P999999999DT23H1439M/1981-04-05", "/", "T", False),
+            ("1981-04-05", "/", "T", False),
+            (None, "/", "T", False),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(
+                is_valid_interval(
+                    testtuple[0],
+                    intervaldelimiter=testtuple[1],
+                    datetimedelimiter=testtuple[2],
+                ),
+                testtuple[3],
+            )
+
+            if testtuple[3] is True:
+                self.assertIsNotNone(
+                    parse_interval(testtuple[0], testtuple[1], testtuple[2])
+                )
+            else:
+                with self.assertRaises((ValueError, OverflowError)):
+                    parse_interval(testtuple[0], testtuple[1], testtuple[2])
+
+    def test_parse_interval_with_resolution(self):
+        testtuples = (
+            ("P1.5Y/2018", "/", "T", IntervalResolution.Year),
+            ("2018W012/P1.5Y", "/", "T", IntervalResolution.Weekday),
+            (b"P1M/1981-04-05T01:01", "/", "T", IntervalResolution.Minutes),
+            ("2014-11-12/P1Y2M3DT4H", "/", "T", IntervalResolution.Hours),
+            ("1980-03-05T01:01:00/1981-04-05", "/", "T", IntervalResolution.Seconds),
+            ("2007-12-14 13:30--15:30", "--", " ", IntervalResolution.Minutes),
+            ("2007-11-13/15", "/", "T", IntervalResolution.Day),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_interval_with_resolution(
+                    testtuple[0],
+                    intervaldelimiter=testtuple[1],
+                    datetimedelimiter=testtuple[2],
+                ),
+                (
+                    parse_interval(
+                        testtuple[0],
+                        intervaldelimiter=testtuple[1],
+                        datetimedelimiter=testtuple[2],
+                    ),
+                    testtuple[3],
+                ),
+            )
+            self.assertEqual(
+                parse_interval_with_resolution(
+                    testtuple[0],
+                    intervaldelimiter=testtuple[1],
+                    datetimedelimiter=testtuple[2],
+                    builder=TupleBuilder,
+                ),
+                (
+                    parse_interval(
+                        testtuple[0],
+                        intervaldelimiter=testtuple[1],
+                        datetimedelimiter=testtuple[2],
+                        builder=TupleBuilder,
+                    ),
+                    testtuple[3],
+                ),
+            )
+            self.assertEqual(
+                get_interval_resolution(
+                    testtuple[0],
+                    intervaldelimiter=testtuple[1],
+                    datetimedelimiter=testtuple[2],
+                ),
+                testtuple[3],
+            )
+
+        with self.assertRaises(ISOFormatError):
+            parse_interval_with_resolution("1981-04-05")
+
     def test_parse_interval_baddelimiter(self):
         testtuples = (
             "1980-03-05T01:01:00,1981-04-05T01:01:00",
@@ -1574,6 +1741,40 @@ class TestRepeatingIntervalParserFunctions(unittest.TestCase):
             self.assertEqual(result, expectedargs)
             mockBuilder.assert_called_once_with(**expectedargs)
 
+    def test_parse_repeating_interval_with_resolution(self):
+        testtuples = (
+            ("R3/1981-04-05/P1D", IntervalResolution.Day),
+            (b"R/P1Y2M3DT4H54M/2014-11-12", IntervalResolution.Minutes),
+            ("R2/1980-03-05T01:01:00/1981-04-05", IntervalResolution.Seconds),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_repeating_interval_with_resolution(
+                    testtuple[0], builder=TupleBuilder
+                ),
+                (
+                    parse_repeating_interval(testtuple[0], builder=TupleBuilder),
+                    testtuple[1],
+                ),
+            )
+            self.assertEqual(
+                get_repeating_interval_resolution(testtuple[0]), testtuple[1]
+            )
+
+        result, resolution = parse_repeating_interval_with_resolution(
+            "R3/1981-04-05/P1D"
+        )
+
+        self.assertEqual(
+            list(result),
+            list(aniso8601.parse_repeating_interval("R3/1981-04-05/P1D")),
+        )
+        self.assertEqual(resolution, IntervalResolution.Day)
+
+        with self.assertRaises(ISOFormatError):
+            parse_repeating_interval_with_resolution("1981-04-05/P1D")
+
     def test_parse_repeating_interval_mockbuilder(self):
         mockBuilder = mock.Mock()
 
@@ -1649,6 +1850,25 @@ class TestRepeatingIntervalParserFunctions(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_repeating_interval(testtuple, builder=None)
 
+    def test_parse_repeating_interval_bytes(self):
+        testtuples = ("R3/1981-04-05/P1D", "R/P1M/1981-04-05T01:01:00")
+
+        for testtuple in testtuples:
+            expected = parse_repeating_interval(testtuple, builder=TupleBuilder)
+            buffer = bytearray(b"<" + testtuple.encode("ascii") + b">")
+
+            for isobytes in (
+                testtuple.encode("ascii"),
+                bytearray(testtuple.encode("ascii")),
+                memoryview(buffer)[1:-1],
+            ):
+                self.assertEqual(
+                    parse_repeating_interval(isobytes, builder=TupleBuilder), expected
+                )
+
+        with self.assertRaises(ValueError):
+            parse_repeating_interval("1981-04-05\u00e9".encode("utf-8"), builder=None)
+
     def test_parse_repeating_interval_baddelimiter(self):
         testtuples = ("R,PT1H2M,1980-03-05T01:01:00", "R3 1981-04-05 P1D")
 
@@ -6,19 +6,32 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
+import datetime
 import unittest
 
 import aniso8601
-from aniso8601.builders import DatetimeTuple, DateTuple, TimeTuple, TimezoneTuple
+from aniso8601.builders import (
+    DatetimeTuple,
+    DateTuple,
+    TimeTuple,
+    TimezoneTuple,
+    TupleBuilder,
+)
 from aniso8601.exceptions import ISOFormatError
 from aniso8601.resolution import TimeResolution
 from aniso8601.tests.compat import mock
 from aniso8601.time import (
     _get_time_resolution,
+    _scan_datetime,
+    _scan_datetime_fields,
     get_datetime_resolution,
     get_time_resolution,
+    is_valid_datetime,
+    is_valid_time,
     parse_datetime,
+    parse_datetime_with_resolution,
     parse_time,
+    parse_time_with_resolution,
 )
 
 
@@ -315,6 +328,71 @@ class TestTimeParserFunctions(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_time(testtuple, builder=None)
 
+    def test_parse_time_bytes(self):
+        testtuples = ("23:21:28.512400", "232128Z", "23-01:30")
+
+        for testtuple in testtuples:
+            expected = parse_time(testtuple, builder=TupleBuilder)
+            buffer = bytearray(b"<" + testtuple.encode("ascii") + b">")
+
+            for isobytes in (
+                testtuple.encode("ascii"),
+                bytearray(testtuple.encode("ascii")),
+                memoryview(buffer)[1:-1],
+            ):
+                self.assertEqual(parse_time(isobytes, builder=TupleBuilder), expected)
+
+        with self.assertRaises(ValueError):
+            parse_time("1981-04-05\u00e9".encode("utf-8"), builder=None)
+
+    def test_is_valid_time(self):
+        testtuples = (
+            ("23:21:28.512400", True),
+            (b"232128Z", True),
+            ("24:00", True),
+            ("23:59:60Z", False),
+            ("24:00:01", False),
+            ("25", False),
+            ("12:00+24:00", False),
+            ("12:00+23:60", False),
+            ("12:00-00:00", False),
+            ("12:0a", False),
+            (None, False),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(is_valid_time(testtuple[0]), testtuple[1])
+
+            if testtuple[1] is True:
+                self.assertIsNotNone(parse_time(testtuple[0]))
+            else:
+                with self.assertRaises((ValueError, OverflowError)):
+                    parse_time(testtuple[0])
+
+    def test_parse_time_with_resolution(self):
+        testtuples = (
+            ("01", TimeResolution.Hours),
+            ("12,5Z", TimeResolution.Hours),
+            ("0123", TimeResolution.Minutes),
+            (b"01:23.4567+00:00", TimeResolution.Minutes),
+            ("23:21:28.512400-12:34", TimeResolution.Seconds),
+            ("240000", TimeResolution.Seconds),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_time_with_resolution(testtuple[0]),
+                (parse_time(testtuple[0]), testtuple[1]),
+            )
+            self.assertEqual(
+                parse_time_with_resolution(testtuple[0], builder=TupleBuilder),
+                (parse_time(testtuple[0], builder=TupleBuilder), testtuple[1]),
+            )
+            self.assertEqual(get_time_resolution(testtuple[0]), testtuple[1])
+
+        with self.assertRaises(ISOFormatError):
+            parse_time_with_resolution("06:14:0B")
+
     def test_parse_time_badstr(self):
         testtuples = (
             "A6:14:00.000123Z",
@@ -449,6 +527,28 @@ class TestTimeParserFunctions(unittest.TestCase):
             self.assertEqual(result, testtuple[1])
             mockBuildDateTime.assert_called_once_with(*testtuple[1])
 
+    def test_parse_datetime_general(self):
+        # Inputs not matched by the scanner go through parse_date and parse_time
+        expectedargs = (
+            DateTuple("1981", "04", "05", None, None, None),
+            TimeTuple("23", "21", "28", None),
+        )
+
+        with mock.patch.object(
+            aniso8601.time, "_scan_datetime"
+        ) as mockScanDatetime, mock.patch.object(
+            aniso8601.time.PythonTimeBuilder, "build_datetime"
+        ) as mockBuildDateTime:
+
+            mockScanDatetime.return_value = None
+            mockBuildDateTime.return_value = expectedargs
+
+            result = parse_datetime("1981-04-05T23:21:28")
+
+        self.assertEqual(result, expectedargs)
+        mockScanDatetime.assert_called_once_with("1981-04-05T23:21:28", 10, 11)
+        mockBuildDateTime.assert_called_once_with(*expectedargs)
+
     def test_parse_datetime_spacedelimited(self):
         expectedargs = (
             DateTuple("2004", None, None, "53", "6", None),
@@ -505,6 +605,129 @@ class TestTimeParserFunctions(unittest.TestCase):
             with self.assertRaises(ValueError):
                 parse_datetime(testtuple, builder=None)
 
+    def test_parse_datetime_bytes(self):
+        testtuples = (
+            "1981-04-05T23:21:28.512400Z",
+            "19810405T2321+0130",
+            "1981-04-05T23,5",
+        )
+
+        for testtuple in testtuples:
+            expected = parse_datetime(testtuple, builder=TupleBuilder)
+            buffer = bytearray(b"<" + testtuple.encode("ascii") + b">")
+
+            for isobytes in (
+                testtuple.encode("ascii"),
+                bytearray(testtuple.encode("ascii")),
+                memoryview(buffer)[1:-1],
+            ):
+                self.assertEqual(
+                    parse_datetime(isobytes, builder=TupleBuilder), expected
+                )
+
+        with self.assertRaises(ValueError):
+            parse_datetime("1981-04-05\u00e9".encode("utf-8"), builder=None)
+
+    @unittest.skipIf(
+        not hasattr(datetime, "timezone"), "datetime.timezone is not available."
+    )
+    def test_parse_datetime_to_utc(self):
+        testtuples = (
+            "1981-04-05T23:21:28.512400Z",
+            "1981-04-05T23:21:28.512400-05:30",
+            "19810405T2321+0130",
+            "1981-095T23:21:28+01",
+            "1981-04-05T24:00+01:00",
+        )
+
+        for testtuple in testtuples:
+            result = parse_datetime(testtuple, to_utc=True)
+
+            self.assertIs(result.tzinfo, datetime.timezone.utc)
+            self.assertEqual(result, parse_datetime(testtuple))
+
+        self.assertEqual(
+            parse_datetime("1981-04-05 23:21:28", delimiter=" ", to_utc=True),
+            datetime.datetime(1981, 4, 5, 23, 21, 28),
+        )
+
+        with self.assertRaises(ValueError):
+            parse_datetime("1981-04-05T23:21:28Z", builder=TupleBuilder, to_utc=True)
+
+    def test_is_valid_datetime(self):
+        testtuples = (
+            ("1981-04-05T23:21:28.512400Z", "T", True),
+            (b"1981-04-05 23:21:28", " ", True),
+            ("9999-W52-5T24:00", "T", True),
+            ("1981-02-29T23:21:28", "T", False),
+            ("1981-04-05T23:21:60", "T", False),
+            ("9999-W52-6T00:00", "T", False),
+            ("1981-04-05 23:21:28", "T", False),
+            ("+1981-04-05T23:21:28", "T", False),
+            (None, "T", False),
+        )
+
+        for testtuple in testtuples:
+            self.assertIs(
+                is_valid_datetime(testtuple[0], delimiter=testtuple[1]), testtuple[2]
+            )
+
+            if testtuple[2] is True:
+                self.assertIsNotNone(parse_datetime(testtuple[0], testtuple[1]))
+            else:
+                with self.assertRaises(
+                    (ValueError, OverflowError, NotImplementedError)
+                ):
+                    parse_datetime(testtuple[0], testtuple[1])
+
+    def test_parse_datetime_with_resolution(self):
+        testtuples = (
+            ("2019-06-05T01", "T", TimeResolution.Hours),
+            ("2019-06-05 01:03Z", " ", TimeResolution.Minutes),
+            (b"2019-06-05T01:03:11.858714", "T", TimeResolution.Seconds),
+            ("2019-W23-3T01:03:11-01:00", "T", TimeResolution.Seconds),
+            ("2019156T0103", "T", TimeResolution.Minutes),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_datetime_with_resolution(testtuple[0], delimiter=testtuple[1]),
+                (parse_datetime(testtuple[0], delimiter=testtuple[1]), testtuple[2]),
+            )
+            self.assertEqual(
+                parse_datetime_with_resolution(
+                    testtuple[0], delimiter=testtuple[1], builder=TupleBuilder
+                ),
+                (
+                    parse_datetime(
+                        testtuple[0], delimiter=testtuple[1], builder=TupleBuilder
+                    ),
+                    testtuple[2],
+                ),
+            )
+            self.assertEqual(
+                get_datetime_resolution(testtuple[0], delimiter=testtuple[1]),
+                testtuple[2],
+            )
+
+        with self.assertRaises(ISOFormatError):
+            parse_datetime_with_resolution("2019-06-05 01:03")
+
+    def test_parse_datetime_with_resolution_mockbuilder(self):
+        mockBuilder = mock.Mock()
+        mockBuilder._build_object.return_value = mock.sentinel.datetime
+
+        self.assertEqual(
+            parse_datetime_with_resolution("1981-04-05T23:21", builder=mockBuilder),
+            (mock.sentinel.datetime, TimeResolution.Minutes),
+        )
+        mockBuilder._build_object.assert_called_once_with(
+            DatetimeTuple(
+                DateTuple("1981", "04", "05", None, None, None),
+                TimeTuple("23", "21", None, None),
+            )
+        )
+
     def test_parse_datetime_badstr(self):
         testtuples = (
             "1981-04-05TA6:14:00.000123Z",
@@ -537,3 +760,259 @@ class TestTimeParserFunctions(unittest.TestCase):
 
         self.assertEqual(result, expectedargs)
         mockBuilder.build_datetime.assert_called_once_with(*expectedargs)
+
+    def test_scan_datetime(self):
+        testtuples = (
+            (
+                "2019-06-05T01:03:11,858714",
+                (
+                    DateTuple("2019", "06", "05", None, None, None),
+                    TimeTuple("01", "03", "11.858714", None),
+                ),
+            ),
+            (
+                "1981-04-05T23:21:28.512400Z",
+                (
+                    DateTuple("1981", "04", "05", None, None, None),
+                    TimeTuple(
+                        "23",
+                        "21",
+                        "28.512400",
+                        TimezoneTuple(False, True, None, None, "Z"),
+                    ),
+                ),
+            ),
+            (
+                "1981095T23:21:28.512400-12:34",
+                (
+                    DateTuple("1981", None, None, None, None, "095"),
+                    TimeTuple(
+                        "23",
+                        "21",
+                        "28.512400",
+                        TimezoneTuple(True, None, "12", "34", "-12:34"),
+                    ),
+                ),
+            ),
+            (
+                "1981-095T2321+00",
+                (
+                    DateTuple("1981", None, None, None, None, "095"),
+                    TimeTuple(
+                        "23", "21", None, TimezoneTuple(False, None, "00", None, "+00")
+                    ),
+                ),
+            ),
+            (
+                "2004-W53-6T23,5+0130",
+                (
+                    DateTuple("2004", None, None, "53", "6", None),
+                    TimeTuple(
+                        "23.5",
+                        None,
+                        None,
+                        TimezoneTuple(False, None, "01", "30", "+0130"),
+                    ),
+                ),
+            ),
+            (
+                "2004W536T232128",
+                (
+                    DateTuple("2004", None, None, "53", "6", None),
+                    TimeTuple("23", "21", "28", None),
+                ),
+            ),
+            (
+                "2004-W53T23:21.5",
+                (
+                    DateTuple("2004", None, None, "53", None, None),
+                    TimeTuple("23", "21.5", None, None),
+                ),
+            ),
+            (
+                "2004W53T23",
+                (
+                    DateTuple("2004", None, None, "53", None, None),
+                    TimeTuple("23", None, None, None),
+                ),
+            ),
+            (
+                "1981-04T23:21",
+                (
+                    DateTuple("1981", "04", None, None, None, None),
+                    TimeTuple("23", "21", None, None),
+                ),
+            ),
+            (
+                "19T23Z",
+                (
+                    DateTuple("19", None, None, None, None, None),
+                    TimeTuple(
+                        "23", None, None, TimezoneTuple(False, True, None, None, "Z")
+                    ),
+                ),
+            ),
+        )
+
+        for testtuple in testtuples:
+            delimiteridx = testtuple[0].find("T")
+
+            self.assertEqual(
+                _scan_datetime(testtuple[0], delimiteridx, delimiteridx + 1),
+                testtuple[1],
+            )
+
+    def test_scan_datetime_fallback(self):
+        # Forms not handled by the scanner are left to the general parsers
+        testtuples = (
+            "1981-04-05T23:21:28-00:00",
+            "1981-04-05T23:21:28Z+01",
+            "1981-04-05T23:21:28.5.5",
+            "1981-04-05T23:213",
+            "1981-04-05T2",
+            "+1981-04-05T23",
+            "1981-04-0T23",
+            "2004-W53-6T23:2",
+            "2014-01-230T23:21:28+00",
+            "1981-04x05T23",
+            "1981004-05T23",
+            "1981-W5x-6T23",
+            "1981-04-0xT23",
+            "1981-W5xT23",
+            "1981-0x5T23",
+            "1981W5x6T23",
+            "1981-0xT23",
+            "1981W5xT23",
+            "19810x5T23",
+            "1981-04-05T23+0x",
+            "1981-04-05T23+010x",
+            "T23",
+        )
+
+        for testtuple in testtuples:
+            delimiteridx = testtuple.find("T")
+
+            self.assertIsNone(_scan_datetime(testtuple, delimiteridx, delimiteridx + 1))
+
+    def test_parse_datetime_fields_mockbuilder(self):
+        mockBuilder = mock.Mock()
+        mockBuilder.INTEGER_FIELDS = True
+
+        expectedargs = (
+            1981,
+            4,
+            5,
+            23,
+            21,
+            28,
+            512400,
+            6,
+            TimezoneTuple(True, None, "12", "34", "-12:34"),
+        )
+
+        mockBuilder.build_datetime_fields.return_value = expectedargs
+
+        result = parse_datetime("1981-04-05T23:21:28.512400-12:34", builder=mockBuilder)
+
+        self.assertEqual(result, expectedargs)
+        mockBuilder.build_datetime_fields.assert_called_once_with(*expectedargs)
+        mockBuilder.build_datetime.assert_not_called()
+
+        # Other forms are built from tuples
+        parse_datetime("1981095T23:21:28.512400-12:34", builder=mockBuilder)
+
+        mockBuilder.build_datetime.assert_called_once_with(
+            DateTuple("1981", None, None, None, None, "095"),
+            TimeTuple(
+                "23", "21", "28.512400", TimezoneTuple(True, None, "12", "34", "-12:34")
+            ),
+        )
+
+    def test_scan_datetime_fields(self):
+        testtuples = (
+            (
+                "2019-06-05T01:03:11,858714",
+                (2019, 6, 5, 1, 3, 11, 858714, 6, None),
+            ),
+            (
+                "19810405T232128Z",
+                (
+                    1981,
+                    4,
+                    5,
+                    23,
+                    21,
+                    28,
+                    0,
+                    0,
+                    TimezoneTuple(False, True, None, None, "Z"),
+                ),
+            ),
+            (
+                "0001-01-01T00:00:00.000000000000000001+0130",
+                (
+                    1,
+                    1,
+                    1,
+                    0,
+                    0,
+                    0,
+                    1,
+                    18,
+                    TimezoneTuple(False, None, "01", "30", "+0130"),
+                ),
+            ),
+            (
+                "1981-04-05T232128.05-12",
+                (
+                    1981,
+                    4,
+                    5,
+                    23,
+                    21,
+                    28,
+                    5,
+                    2,
+                    TimezoneTuple(True, None, "12", None, "-12"),
+                ),
+            ),
+            # Range checks are left to the builder
+            ("9999-99-99T99:99:99", (9999, 99, 99, 99, 99, 99, 0, 0, None)),
+        )
+
+        for testtuple in testtuples:
+            delimiteridx = testtuple[0].find("T")
+
+            self.assertEqual(
+                _scan_datetime_fields(testtuple[0], delimiteridx, delimiteridx + 1),
+                testtuple[1],
+            )
+
+    def test_scan_datetime_fields_fallback(self):
+        # Forms not handled are left to _scan_datetime
+        testtuples = (
+            "1981095T23:21:28",
+            "1981-095T23:21:28",
+            "1981-W14-7T23:21:28",
+            "1981x04-05T23:21:28",
+            "1981-04x05T23:21:28",
+            "1981-04-05T23:21",
+            "1981-04-05T2321",
+            "1981-04-05T23:2128",
+            "1981-04-05T23:21:2x",
+            "1981-04-05T23:21:28.",
+            "1981-04-05T23:21:28/5",
+            "1981-04-05T23:21:28.5x",
+            "1981-04-05T23:21:28.5.5",
+            "1981-04-05T23:21:28.1234567890123456789",
+            "1981-04-05T23:21:28-00:00",
+            "1981-04-05T23:21:28+05:3x",
+            "1981-04-05T2",
+        )
+
+        for testtuple in testtuples:
+            delimiteridx = testtuple.find("T")
+
+            self.assertIsNone(
+                _scan_datetime_fields(testtuple, delimiteridx, delimiteridx + 1)
+            )
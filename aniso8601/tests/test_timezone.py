@@ -9,9 +9,11 @@
 import unittest
 
 import aniso8601
+from aniso8601.builders import TimezoneTuple, TupleBuilder
+from aniso8601.compat import decode_utf8
 from aniso8601.exceptions import ISOFormatError
 from aniso8601.tests.compat import mock
-from aniso8601.timezone import parse_timezone
+from aniso8601.timezone import TIMEZONE_TUPLES, parse_timezone
 
 
 class TestTimezoneParserFunctions(unittest.TestCase):
@@ -121,3 +123,47 @@ class TestTimezoneParserFunctions(unittest.TestCase):
 
         with self.assertRaises(ISOFormatError):
             parse_timezone("-00", builder=None)
+
+    def test_parse_timezone_shared(self):
+        testtuples = (
+            ("Z", TimezoneTuple(False, True, None, None, "Z")),
+            ("+01:30", TimezoneTuple(False, None, "01", "30", "+01:30")),
+            ("-0530", TimezoneTuple(True, None, "05", "30", "-0530")),
+            ("-23", TimezoneTuple(True, None, "23", None, "-23")),
+        )
+
+        for testtuple in testtuples:
+            result = parse_timezone(testtuple[0], builder=TupleBuilder)
+
+            self.assertEqual(result, testtuple[1])
+            self.assertIs(TIMEZONE_TUPLES[testtuple[0]], result)
+            self.assertIs(parse_timezone(testtuple[0], builder=TupleBuilder), result)
+            self.assertIs(
+                aniso8601.parse_time("01:02" + testtuple[0], builder=TupleBuilder).tz,
+                result,
+            )
+            self.assertIs(
+                aniso8601.parse_datetime(
+                    "1981-04-05T01:02:03" + testtuple[0], builder=TupleBuilder
+                ).time.tz,
+                result,
+            )
+
+    def test_parse_timezone_uncommon(self):
+        # Out of the default range, or not a common form, they are parsed but
+        # not kept
+        testtuples = (
+            ("+24", TimezoneTuple(False, None, "24", None, "+24")),
+            ("+01:60", TimezoneTuple(False, None, "01", "60", "+01:60")),
+            ("+01x30", TimezoneTuple(False, None, "01", "30", "+01x30")),
+            (
+                decode_utf8("+0²"),
+                TimezoneTuple(False, None, decode_utf8("0²"), None, decode_utf8("+0²")),
+            ),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(
+                parse_timezone(testtuple[0], builder=TupleBuilder), testtuple[1]
+            )
+            self.assertNotIn(testtuple[0], TIMEZONE_TUPLES)
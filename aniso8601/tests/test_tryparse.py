@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+import unittest
+
+import aniso8601
+from aniso8601.builders import TupleBuilder
+from aniso8601.exceptions import RangeCheckError
+from aniso8601.tests.compat import mock
+from aniso8601.tryparse import (
+    ErrorCode,
+    ParseError,
+    try_parse_date,
+    try_parse_datetime,
+    try_parse_duration,
+    try_parse_interval,
+    try_parse_time,
+)
+
+
+class TestTryParseFunctions(unittest.TestCase):
+    def test_try_parse(self):
+        testtuples = (
+            (try_parse_date, aniso8601.parse_date, ("1981-04-05", "1981095", b"1981")),
+            (try_parse_time, aniso8601.parse_time, ("23:21:28.5124", "232128Z", b"23")),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                (
+                    "1981-04-05T23:21:28.512400Z",
+                    "19810405T23:1:2+00",
+                    b"1981-04-05T23",
+                ),
+            ),
+            (try_parse_duration, aniso8601.parse_duration, ("P1Y2M3D", b"PT1H")),
+            (
+                try_parse_interval,
+                aniso8601.parse_interval,
+                ("1981-04-05/P1D", b"P1M/1981-04-05T01:01:00"),
+            ),
+        )
+
+        for testtuple in testtuples:
+            for isostr in testtuple[2]:
+                self.assertEqual(testtuple[0](isostr), testtuple[1](isostr))
+                self.assertEqual(
+                    testtuple[0](isostr, builder=TupleBuilder),
+                    testtuple[1](isostr, builder=TupleBuilder),
+                )
+
+        self.assertEqual(
+            try_parse_datetime("1981-04-05 23:21", delimiter=" "),
+            aniso8601.parse_datetime("1981-04-05 23:21", delimiter=" "),
+        )
+        self.assertEqual(
+            try_parse_interval(
+                "1981-04-05 01:01:00--P1D",
+                intervaldelimiter="--",
+                datetimedelimiter=" ",
+            ),
+            aniso8601.parse_interval(
+                "1981-04-05 01:01:00--P1D",
+                intervaldelimiter="--",
+                datetimedelimiter=" ",
+            ),
+        )
+
+    def test_try_parse_errors(self):
+        testtuples = (
+            (try_parse_date, aniso8601.parse_date, "1981-04x05", ErrorCode.Format, 7),
+            (try_parse_date, aniso8601.parse_date, "1981-4-05", ErrorCode.Format, None),
+            (try_parse_date, aniso8601.parse_date, "1981-0x-05", ErrorCode.Format, 6),
+            (try_parse_date, aniso8601.parse_date, "+1981", ErrorCode.Unsupported, 0),
+            (
+                try_parse_date,
+                aniso8601.parse_date,
+                "1981-13-05",
+                ErrorCode.MonthBounds,
+                None,
+            ),
+            (
+                try_parse_date,
+                aniso8601.parse_date,
+                "2004-W54",
+                ErrorCode.WeekBounds,
+                None,
+            ),
+            (
+                try_parse_date,
+                aniso8601.parse_date,
+                "1981-366",
+                ErrorCode.DayBounds,
+                None,
+            ),
+            (try_parse_date, aniso8601.parse_date, "0000", ErrorCode.YearBounds, None),
+            (try_parse_date, aniso8601.parse_date, None, ErrorCode.Type, None),
+            (try_parse_time, aniso8601.parse_time, "23:2a", ErrorCode.Format, None),
+            (try_parse_time, aniso8601.parse_time, "25", ErrorCode.HoursBounds, None),
+            (
+                try_parse_time,
+                aniso8601.parse_time,
+                "23:61",
+                ErrorCode.MinutesBounds,
+                None,
+            ),
+            (
+                try_parse_time,
+                aniso8601.parse_time,
+                "23:21:61",
+                ErrorCode.SecondsBounds,
+                None,
+            ),
+            (try_parse_time, aniso8601.parse_time, 1, ErrorCode.Type, None),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                "1981-04-05 23:21",
+                ErrorCode.Format,
+                None,
+            ),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                "1981x04-05T23",
+                ErrorCode.Format,
+                4,
+            ),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                "+1981-04-05T23",
+                ErrorCode.Unsupported,
+                0,
+            ),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                "1981-04-05T23:2a",
+                ErrorCode.Format,
+                None,
+            ),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                "1981-04-05T24:00:01",
+                ErrorCode.MidnightBounds,
+                None,
+            ),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                "1981-04-05T23:59:60",
+                ErrorCode.LeapSecond,
+                None,
+            ),
+            (
+                try_parse_datetime,
+                aniso8601.parse_datetime,
+                bytearray(b"1981-04-05T23:59:5\xff"),
+                ErrorCode.Format,
+                18,
+            ),
+            (try_parse_datetime, aniso8601.parse_datetime, 1.234, ErrorCode.Type, None),
+            (
+                try_parse_duration,
+                aniso8601.parse_duration,
+                "P1Q",
+                ErrorCode.Format,
+                None,
+            ),
+            (try_parse_duration, aniso8601.parse_duration, [], ErrorCode.Type, None),
+            (
+                try_parse_interval,
+                aniso8601.parse_interval,
+                "1981-04-05",
+                ErrorCode.Format,
+                None,
+            ),
+            (try_parse_interval, aniso8601.parse_interval, False, ErrorCode.Type, None),
+        )
+
+        for testtuple in testtuples:
+            result = testtuple[0](testtuple[2])
+
+            self.assertIsInstance(result, ParseError)
+            self.assertEqual(result.code, testtuple[3])
+            self.assertEqual(result.position, testtuple[4])
+
+            with self.assertRaises((ValueError, NotImplementedError)) as e:
+                testtuple[1](testtuple[2])
+
+            self.assertEqual(result.message, str(e.exception))
+
+    def test_try_parse_builder_errors(self):
+        testtuples = (
+            (RangeCheckError("Range."), ErrorCode.Range),
+            (ValueError("Value."), ErrorCode.Format),
+            (NotImplementedError("Unsupported."), ErrorCode.Unsupported),
+        )
+
+        for testtuple in testtuples:
+            mockBuilder = mock.Mock()
+            mockBuilder.build_datetime.side_effect = testtuple[0]
+
+            result = try_parse_datetime("1981-04-05T23:21:28Z", builder=mockBuilder)
+
+            self.assertEqual(result.code, testtuple[1])
+            self.assertEqual(result.message, str(testtuple[0]))
+
+    def test_parseerror_repr(self):
+        self.assertEqual(
+            repr(try_parse_date("1981-04x05")),
+            "ParseError(code={0}, position=7)".format(ErrorCode.Format),
+        )
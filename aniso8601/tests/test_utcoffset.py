@@ -10,7 +10,13 @@ import datetime
 import pickle
 import unittest
 
-from aniso8601.utcoffset import UTCOffset
+from aniso8601.compat import decode_utf8
+from aniso8601.utcoffset import (
+    UTCOffset,
+    _utcoffsets,
+    get_canonical_minutes,
+    intern_utcoffset,
+)
 
 
 class TestUTCOffset(unittest.TestCase):
@@ -54,3 +60,72 @@ class TestUTCOffset(unittest.TestCase):
         result = datetime.datetime.now(tzinfoobject)
         # Hacky way to make sure the tzinfo is what we'd expect
         self.assertEqual(result.tzinfo.utcoffset(None), datetime.timedelta(hours=4))
+
+    def test_eq(self):
+        testutcoffset = UTCOffset(name="+01:30", minutes=90)
+
+        self.assertTrue(testutcoffset == UTCOffset(name="+01:30", minutes=90))
+        self.assertFalse(testutcoffset != UTCOffset(name="+01:30", minutes=90))
+        self.assertEqual(
+            hash(testutcoffset), hash(UTCOffset(name="+01:30", minutes=90))
+        )
+
+        self.assertTrue(testutcoffset != UTCOffset(name="+0130", minutes=90))
+        self.assertTrue(testutcoffset != UTCOffset(name="+01:30", minutes=-90))
+        self.assertFalse(testutcoffset == "+01:30")
+        self.assertTrue(testutcoffset != "+01:30")
+
+        self.assertEqual(
+            set([testutcoffset, UTCOffset(name="+01:30", minutes=90)]),
+            set([testutcoffset]),
+        )
+
+
+class TestInternUTCOffset(unittest.TestCase):
+    def test_intern_utcoffset(self):
+        result = intern_utcoffset(name="-05:30", minutes=-330)
+
+        self.assertEqual(result, UTCOffset(name="-05:30", minutes=-330))
+        self.assertIs(intern_utcoffset(name="-05:30", minutes=-330), result)
+        self.assertIsNot(intern_utcoffset(name="-0530", minutes=-330), result)
+        self.assertIsNot(intern_utcoffset(name="-05:30", minutes=330), result)
+
+    def test_intern_utcoffset_uncommon(self):
+        # Offsets without a canonical name spelling their minutes are built,
+        # but not kept
+        testtuples = (
+            (decode_utf8("+١٢:٠٠"), 720),
+            ("+24:00", 1440),
+            ("+0530", -330),
+            ("-05:30", 330),
+            ("UTC+1", 60),
+            (None, 0),
+        )
+
+        for testtuple in testtuples:
+            result = intern_utcoffset(name=testtuple[0], minutes=testtuple[1])
+
+            self.assertEqual(result, UTCOffset(name=testtuple[0], minutes=testtuple[1]))
+            self.assertNotIn((testtuple[1], testtuple[0]), _utcoffsets)
+
+    def test_get_canonical_minutes(self):
+        testtuples = (
+            ("Z", 0),
+            ("UTC", 0),
+            ("+00", 0),
+            ("+05", 300),
+            ("-0530", -330),
+            ("+23:59", 1439),
+            ("-12:00", -720),
+            ("+24", None),
+            ("+01:60", None),
+            ("+01x30", None),
+            ("+1:30", None),
+            ("05:30", None),
+            (decode_utf8("+١٢"), None),
+            (decode_utf8("+0²"), None),
+            (None, None),
+        )
+
+        for testtuple in testtuples:
+            self.assertEqual(get_canonical_minutes(testtuple[0]), testtuple[1])
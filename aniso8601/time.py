@@ -6,17 +6,30 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
-from aniso8601.builders import TupleBuilder
+from aniso8601.builders import TimeTuple, TupleBuilder
 from aniso8601.builders.python import PythonTimeBuilder
-from aniso8601.compat import is_string
-from aniso8601.date import parse_date
+from aniso8601.builders.stdlib import get_utc_builder
+from aniso8601.builders.validating import ValidatingBuilder
+from aniso8601.compat import decode_ascii, is_bytes, is_string
+from aniso8601.date import DATE_SHAPES, get_date_fingerprint, parse_date
 from aniso8601.decimalfraction import normalize
 from aniso8601.exceptions import ISOFormatError
 from aniso8601.resolution import TimeResolution
-from aniso8601.timezone import parse_timezone
+from aniso8601.timezone import (
+    TIMEZONE_TUPLES,
+    UTC_TIMEZONE_TUPLE,
+    parse_timezone,
+    parse_timezone_tuple,
+)
 
 TIMEZONE_DELIMITERS = ["Z", "+", "-"]
 
+# Two digit strings and their values, a failed lookup is not two digits
+TWO_DIGITS = dict(("{0:02d}".format(value), value) for value in range(100))
+
+# Longer fractions are left to the string fields
+FIELDS_MAX_FRACTION_DIGITS = 18
+
 
 def get_time_resolution(isotimestr):
     # Valid time formats are:
@@ -62,6 +75,29 @@ def get_datetime_resolution(isodatetimestr, delimiter="T"):
     return _get_time_resolution(isotimetuple)
 
 
+def parse_time_with_resolution(isotimestr, builder=PythonTimeBuilder):
+    # As parse_time, but returns (time, resolution), the resolution is read
+    # from the same parse used to build the time
+    isotimetuple = parse_time(isotimestr, builder=TupleBuilder)
+
+    return (builder._build_object(isotimetuple), _get_time_resolution(isotimetuple))
+
+
+def parse_datetime_with_resolution(
+    isodatetimestr, delimiter="T", builder=PythonTimeBuilder
+):
+    # As parse_datetime, but returns (datetime, resolution), the resolution
+    # is read from the same parse used to build the datetime
+    isodatetimetuple = parse_datetime(
+        isodatetimestr, delimiter=delimiter, builder=TupleBuilder
+    )
+
+    return (
+        builder._build_object(isodatetimetuple),
+        _get_time_resolution(isodatetimetuple.time),
+    )
+
+
 def _get_time_resolution(isotimetuple):
     if isotimetuple.ss is not None:
         return TimeResolution.Seconds
@@ -103,7 +139,10 @@ def parse_time(isotimestr, builder=PythonTimeBuilder):
     # hhmm±hh
     # hh±hh
     if is_string(isotimestr) is False:
-        raise ValueError("Time must be string.")
+        if is_bytes(isotimestr) is False:
+            raise ValueError("Time must be string.")
+
+        isotimestr = decode_ascii(isotimestr)
 
     if len(isotimestr) == 0:
         raise ISOFormatError('"{0}" is not a valid ISO 8601 time.'.format(isotimestr))
@@ -179,21 +218,66 @@ def parse_time(isotimestr, builder=PythonTimeBuilder):
     return builder.build_time(hh=hourstr, mm=minutestr, ss=secondstr, tz=tz)
 
 
-def parse_datetime(isodatetimestr, delimiter="T", builder=PythonTimeBuilder):
+def is_valid_time(isotimestr):
+    # Returns True if parse_time would accept isotimestr with the default
+    # builder, the range checks are run but nothing is built
+    try:
+        parse_time(isotimestr, builder=ValidatingBuilder)
+    except (ValueError, NotImplementedError):
+        return False
+
+    return True
+
+
+def parse_datetime(
+    isodatetimestr, delimiter="T", builder=PythonTimeBuilder, to_utc=False
+):
     # Given a string in ISO 8601 date time format, return a datetime.datetime
     # object that corresponds to the given date time.
     # By default, the ISO 8601 specified T delimiter is used to split the
     # date and time (<date>T<time>). Fixed offset tzdata will be included
-    # if UTC offset is given in the input string.
+    # if UTC offset is given in the input string, or with to_utc, the
+    # datetime is built in UTC by the UTCTimeBuilder.
+    if to_utc is True:
+        builder = get_utc_builder(builder)
+
     if is_string(isodatetimestr) is False:
-        raise ValueError("Date time must be string.")
+        if is_bytes(isodatetimestr) is False:
+            raise ValueError("Date time must be string.")
+
+        isodatetimestr = decode_ascii(isodatetimestr)
+
+    return parse_datetime_string(isodatetimestr, delimiter, builder)
 
-    if delimiter not in isodatetimestr:
+
+def parse_datetime_string(isodatetimestr, delimiter, builder):
+    # parse_datetime for a string, shared with parse_datetimes which has
+    # already checked the type
+    delimiteridx = isodatetimestr.find(delimiter)
+
+    if delimiteridx == -1:
         raise ISOFormatError(
             'Delimiter "{0}" is not in combined date time '
             'string "{1}".'.format(delimiter, isodatetimestr)
         )
 
+    if getattr(builder, "INTEGER_FIELDS", False) is True:
+        fields = _scan_datetime_fields(
+            isodatetimestr, delimiteridx, delimiteridx + len(delimiter)
+        )
+
+        if fields is not None:
+            return builder.build_datetime_fields(*fields)
+
+    scanresult = _scan_datetime(
+        isodatetimestr, delimiteridx, delimiteridx + len(delimiter)
+    )
+
+    if scanresult is not None:
+        return builder.build_datetime(*scanresult)
+
+    # Not one of the common forms, use the general parsers which will
+    # also raise the appropriate error
     isodatestr, isotimestr = isodatetimestr.split(delimiter, 1)
 
     datepart = parse_date(isodatestr, builder=TupleBuilder)
@@ -201,3 +285,253 @@ def parse_datetime(isodatetimestr, delimiter="T", builder=PythonTimeBuilder):
     timepart = parse_time(isotimestr, builder=TupleBuilder)
 
     return builder.build_datetime(datepart, timepart)
+
+
+def is_valid_datetime(isodatetimestr, delimiter="T"):
+    # Returns True if parse_datetime would accept isodatetimestr with the
+    # default builder, the range checks are run but nothing is built
+    try:
+        parse_datetime(isodatetimestr, delimiter=delimiter, builder=ValidatingBuilder)
+    except (ValueError, NotImplementedError):
+        return False
+
+    return True
+
+
+def _scan_datetime(isodatetimestr, dateend, timestart):
+    # Single left to right pass over the common <date><delimiter><time>
+    # forms, date and time fields are sliced directly from the input and
+    # passed to the builder as tuples. Returns None for anything else so
+    # the general parse_date and parse_time path can handle, and report, it.
+    datetuple = scan_date(isodatetimestr, dateend)
+
+    if datetuple is None:
+        return None
+
+    timetuple = scan_time(isodatetimestr, timestart)
+
+    if timetuple is None:
+        return None
+
+    return (datetuple, timetuple)
+
+
+def _scan_datetime_fields(isodatetimestr, dateend, timestart):
+    # YYYY-MM-DD or YYYYMMDD, followed by hh:mm:ss or hhmmss, an optional
+    # decimal fraction, and an optional timezone, with the fields read as
+    # ints for the build_datetime_fields of builders setting INTEGER_FIELDS.
+    # Returns None for anything else, which is left to _scan_datetime.
+    if dateend == 10:
+        if isodatetimestr[4] != "-" or isodatetimestr[7] != "-":
+            return None
+
+        monthidx = 5
+    elif dateend == 8:
+        monthidx = 4
+    else:
+        return None
+
+    suffix = _scan_time_suffix(isodatetimestr, timestart)
+
+    if suffix is None:
+        return None
+
+    timeend, tz = suffix
+
+    if (
+        timeend - timestart >= 8
+        and isodatetimestr[timestart + 2] == ":"
+        and isodatetimestr[timestart + 5] == ":"
+    ):
+        minuteidx = timestart + 3
+        secondidx = timestart + 6
+    elif timeend - timestart >= 6:
+        minuteidx = timestart + 2
+        secondidx = timestart + 4
+    else:
+        return None
+
+    fields = (
+        TWO_DIGITS.get(isodatetimestr[0:2]),
+        TWO_DIGITS.get(isodatetimestr[2:4]),
+        TWO_DIGITS.get(isodatetimestr[monthidx : monthidx + 2]),
+        TWO_DIGITS.get(isodatetimestr[dateend - 2 : dateend]),
+        TWO_DIGITS.get(isodatetimestr[timestart : timestart + 2]),
+        TWO_DIGITS.get(isodatetimestr[minuteidx : minuteidx + 2]),
+        TWO_DIGITS.get(isodatetimestr[secondidx : secondidx + 2]),
+    )
+
+    if None in fields:
+        return None
+
+    fractionidx = secondidx + 2
+
+    if fractionidx == timeend:
+        fraction = 0
+        fractiondigits = 0
+    else:
+        fractionstr = isodatetimestr[fractionidx + 1 : timeend]
+
+        if (
+            isodatetimestr[fractionidx] not in ".,"
+            or len(fractionstr) == 0
+            or len(fractionstr) > FIELDS_MAX_FRACTION_DIGITS
+            or fractionstr.strip("0123456789") != ""
+        ):
+            return None
+
+        fraction = int(fractionstr)
+        fractiondigits = len(fractionstr)
+
+    century, year, month, day, hour, minute, second = fields
+
+    return (
+        century * 100 + year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        fraction,
+        fractiondigits,
+        tz,
+    )
+
+
+def scan_date(isodatetimestr, dateend):
+    # The date is isodatetimestr[0:dateend], the DATE_SHAPES plans slice
+    # from the start of the string so the date doesn't need to be split out.
+    # Returns the DateTuple, or None if the date isn't a supported shape.
+    dateshape = DATE_SHAPES.get(get_date_fingerprint(isodatetimestr, dateend))
+
+    if dateshape is None:
+        return None
+
+    componentstrs = dateshape.plan(isodatetimestr)
+
+    if "".join(componentstrs).isdigit() is False:
+        return None
+
+    return dateshape.build(TupleBuilder, componentstrs)
+
+
+def scan_time(isodatetimestr, timestart):
+    # hh[[:]mm[[:]ss]][(.|,)f...][Z|±hh[[:]mm]] starting at timestart,
+    # returns the TimeTuple, or None for anything else
+    suffix = _scan_time_suffix(isodatetimestr, timestart)
+
+    if suffix is None:
+        return None
+
+    timeend, tz = suffix
+
+    hourstr = isodatetimestr[timestart : timestart + 2]
+
+    if timeend - timestart < 2 or hourstr.isdigit() is False:
+        return None
+
+    minutestr = None
+    secondstr = None
+
+    position = timestart + 2
+
+    if position < timeend and isodatetimestr[position] == ":":
+        # hh:mm[:ss]
+        minutestr = isodatetimestr[position + 1 : position + 3]
+
+        if timeend - position < 3 or minutestr.isdigit() is False:
+            return None
+
+        position += 3
+
+        if position < timeend and isodatetimestr[position] == ":":
+            secondstr = isodatetimestr[position + 1 : position + 3]
+
+            if timeend - position < 3 or secondstr.isdigit() is False:
+                return None
+
+            position += 3
+    elif timeend - position >= 2:
+        # hhmm[ss]
+        componentstr = isodatetimestr[position : position + 2]
+
+        if componentstr.isdigit() is True:
+            minutestr = componentstr
+            position += 2
+
+            componentstr = isodatetimestr[position : position + 2]
+
+            if timeend - position >= 2 and componentstr.isdigit() is True:
+                secondstr = componentstr
+                position += 2
+
+    if position < timeend:
+        # Only a decimal fraction of the lowest order component may remain
+        if isodatetimestr[position] not in ".,":
+            return None
+
+        fractionalstr = isodatetimestr[position + 1 : timeend]
+
+        if fractionalstr.isdigit() is False:
+            return None
+
+        if secondstr is not None:
+            secondstr = secondstr + "." + fractionalstr
+        elif minutestr is not None:
+            minutestr = minutestr + "." + fractionalstr
+        else:
+            hourstr = hourstr + "." + fractionalstr
+
+    return TimeTuple(hourstr, minutestr, secondstr, tz)
+
+
+def _scan_time_suffix(isodatetimestr, timestart):
+    # Returns (timeend, tz) for the time starting at timestart, tz being
+    # the TimezoneTuple of any timezone suffix, or None if it needs to be
+    # handled by parse_time
+    #
+    # The timezone suffix forms all have a fixed width, so where it begins
+    # is known from the string length alone, which in turn bounds the only
+    # variable width field, the decimal fraction
+    timeend = len(isodatetimestr)
+    available = timeend - timestart
+    tz = None
+
+    if available < 2:
+        return None
+
+    if isodatetimestr[-1] == "Z":
+        timeend -= 1
+        tz = UTC_TIMEZONE_TUPLE
+    elif available >= 5 and isodatetimestr[-3] in "+-":
+        # ±hh
+        tz = _scan_timezone(isodatetimestr, timeend - 3)
+        timeend -= 3
+    elif available >= 7 and isodatetimestr[-5] in "+-":
+        # ±hhmm
+        tz = _scan_timezone(isodatetimestr, timeend - 5)
+        timeend -= 5
+    elif available >= 8 and isodatetimestr[-6] in "+-" and isodatetimestr[-3] == ":":
+        # ±hh:mm
+        tz = _scan_timezone(isodatetimestr, timeend - 6)
+        timeend -= 6
+
+    if tz is False:
+        return None
+
+    return (timeend, tz)
+
+
+def _scan_timezone(isodatetimestr, signidx):
+    # Returns the TimezoneTuple for a ±hh[[:]mm] suffix, or False if it
+    # needs to be handled by parse_timezone
+    tzstr = isodatetimestr[signidx:]
+    tz = TIMEZONE_TUPLES.get(tzstr)
+
+    if tz is None:
+        try:
+            tz = parse_timezone_tuple(tzstr)
+        except ISOFormatError:
+            return False
+
+    return tz
@@ -6,9 +6,21 @@
 # This software may be modified and distributed under the terms
 # of the BSD license.  See the LICENSE file for details.
 
+from aniso8601.builders import TimezoneTuple, TupleBuilder
 from aniso8601.builders.python import PythonTimeBuilder
 from aniso8601.compat import is_string
 from aniso8601.exceptions import ISOFormatError
+from aniso8601.utcoffset import TIMEZONE_HOURS, TIMEZONE_MINUTES
+
+UTC_TIMEZONE_TUPLE = TimezoneTuple(False, True, None, None, "Z")
+
+# TimezoneTuples for the Z, ±hh, ±hhmm, and ±hh:mm timezone strings parsed
+# so far, filled by parse_timezone_tuple. Only hours and minutes within
+# TIMEZONE_HOURS and TIMEZONE_MINUTES are kept, so the table is bounded by
+# the few thousand forms they allow, other strings take the full path.
+# parse_timezone, and the time and compiled format scanners, look strings
+# up here before calling parse_timezone_tuple.
+TIMEZONE_TUPLES = {}
 
 
 def parse_timezone(tzstr, builder=PythonTimeBuilder):
@@ -16,8 +28,27 @@ def parse_timezone(tzstr, builder=PythonTimeBuilder):
     if is_string(tzstr) is False:
         raise ValueError("Time zone must be string.")
 
-    if len(tzstr) == 1 and tzstr[0] == "Z":
+    tz = TIMEZONE_TUPLES.get(tzstr)
+
+    if tz is None:
+        tz = parse_timezone_tuple(tzstr)
+
+    if builder is TupleBuilder:
+        return tz
+
+    if tz.Z is True:
         return builder.build_timezone(negative=False, Z=True, name=tzstr)
+
+    return builder.build_timezone(negative=tz.negative, hh=tz.hh, mm=tz.mm, name=tzstr)
+
+
+def parse_timezone_tuple(tzstr):
+    # Checks the format of tzstr, returning its TimezoneTuple, which is
+    # added to TIMEZONE_TUPLES if it is a common form
+    if len(tzstr) == 1 and tzstr[0] == "Z":
+        TIMEZONE_TUPLES[tzstr] = UTC_TIMEZONE_TUPLE
+
+        return UTC_TIMEZONE_TUPLE
     elif len(tzstr) == 6:
         # ±hh:mm
         hourstr = tzstr[1:3]
@@ -50,13 +81,17 @@ def parse_timezone(tzstr, builder=PythonTimeBuilder):
                 )
 
     if tzstr[0] == "+":
-        return builder.build_timezone(
-            negative=False, hh=hourstr, mm=minutestr, name=tzstr
-        )
+        tz = TimezoneTuple(False, None, hourstr, minutestr, tzstr)
+    elif tzstr[0] == "-":
+        tz = TimezoneTuple(True, None, hourstr, minutestr, tzstr)
+    else:
+        raise ISOFormatError('"{0}" is not a valid ISO 8601 time offset.'.format(tzstr))
 
-    if tzstr[0] == "-":
-        return builder.build_timezone(
-            negative=True, hh=hourstr, mm=minutestr, name=tzstr
-        )
+    if (
+        hourstr in TIMEZONE_HOURS
+        and (minutestr is None or minutestr in TIMEZONE_MINUTES)
+        and (len(tzstr) != 6 or tzstr[3] == ":")
+    ):
+        TIMEZONE_TUPLES[tzstr] = tz
 
-    raise ISOFormatError('"{0}" is not a valid ISO 8601 time offset.'.format(tzstr))
+    return tz
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2021, Brandon Nielsen
+# All rights reserved.
+#
+# This software may be modified and distributed under the terms
+# of the BSD license.  See the LICENSE file for details.
+
+from aniso8601 import compat
+from aniso8601.builders.python import PythonTimeBuilder
+from aniso8601.compat import decode_ascii, is_bytes, is_string
+from aniso8601.date import DATE_SHAPES, get_date_fingerprint
+from aniso8601.duration import parse_duration
+from aniso8601.exceptions import (
+    DayOutOfBoundsError,
+    HoursOutOfBoundsError,
+    ISOFormatError,
+    LeapSecondError,
+    MidnightBoundsError,
+    MinutesOutOfBoundsError,
+    MonthOutOfBoundsError,
+    RangeCheckError,
+    SecondsOutOfBoundsError,
+    WeekOutOfBoundsError,
+    YearOutOfBoundsError,
+)
+from aniso8601.interval import parse_interval
+from aniso8601.time import parse_datetime, parse_time, scan_date, scan_time
+
+
+class ErrorCode(object):
+    (
+        Type,
+        Format,
+        Unsupported,
+        Range,
+        YearBounds,
+        MonthBounds,
+        WeekBounds,
+        DayBounds,
+        HoursBounds,
+        MinutesBounds,
+        SecondsBounds,
+        MidnightBounds,
+        LeapSecond,
+    ) = list(compat.range(13))
+
+
+EXCEPTION_CODES = {
+    ISOFormatError: ErrorCode.Format,
+    NotImplementedError: ErrorCode.Unsupported,
+    YearOutOfBoundsError: ErrorCode.YearBounds,
+    MonthOutOfBoundsError: ErrorCode.MonthBounds,
+    WeekOutOfBoundsError: ErrorCode.WeekBounds,
+    DayOutOfBoundsError: ErrorCode.DayBounds,
+    HoursOutOfBoundsError: ErrorCode.HoursBounds,
+    MinutesOutOfBoundsError: ErrorCode.MinutesBounds,
+    SecondsOutOfBoundsError: ErrorCode.SecondsBounds,
+    MidnightBoundsError: ErrorCode.MidnightBounds,
+    LeapSecondError: ErrorCode.LeapSecond,
+}
+
+
+class ParseError(object):
+    # Returned in place of a result by the try_parse functions. code is an
+    # ErrorCode, position is the index of the first offending character,
+    # which is only known for decoding errors, extended years, and malformed
+    # dates, and None otherwise. The message is the one the matching parse
+    # function would raise with, and is only formatted when asked for.
+    __slots__ = ("code", "position", "_template", "_args")
+
+    def __init__(self, code, template, args, position=None):
+        self.code = code
+        self.position = position
+        self._template = template
+        self._args = args
+
+    def __repr__(self):
+        return "ParseError(code={0}, position={1})".format(self.code, self.position)
+
+    @property
+    def message(self):
+        return self._template.format(*self._args)
+
+
+def try_parse_date(isodatestr, builder=PythonTimeBuilder):
+    # As parse_date, but returns a ParseError instead of raising, format
+    # errors are found without raising internally
+    if is_string(isodatestr) is False:
+        isodatestr = _decode(isodatestr, "Date")
+
+        if type(isodatestr) is ParseError:
+            return isodatestr
+
+    dateshape = DATE_SHAPES.get(get_date_fingerprint(isodatestr, len(isodatestr)))
+
+    if dateshape is not None:
+        componentstrs = dateshape.plan(isodatestr)
+
+        if "".join(componentstrs).isdigit() is True:
+            return _try_build(dateshape.build, builder, componentstrs)
+
+    return _date_error(isodatestr, len(isodatestr))
+
+
+def try_parse_time(isotimestr, builder=PythonTimeBuilder):
+    # As parse_time, but returns a ParseError instead of raising
+    if is_string(isotimestr) is False:
+        isotimestr = _decode(isotimestr, "Time")
+
+        if type(isotimestr) is ParseError:
+            return isotimestr
+
+    return _try_build(parse_time, isotimestr, builder)
+
+
+def try_parse_datetime(isodatetimestr, delimiter="T", builder=PythonTimeBuilder):
+    # As parse_datetime, but returns a ParseError instead of raising, a
+    # missing delimiter or malformed date is found without raising
+    # internally
+    if is_string(isodatetimestr) is False:
+        isodatetimestr = _decode(isodatetimestr, "Date time")
+
+        if type(isodatetimestr) is ParseError:
+            return isodatetimestr
+
+    delimiteridx = isodatetimestr.find(delimiter)
+
+    if delimiteridx == -1:
+        return ParseError(
+            ErrorCode.Format,
+            'Delimiter "{0}" is not in combined date time string "{1}".',
+            (delimiter, isodatetimestr),
+        )
+
+    datetuple = scan_date(isodatetimestr, delimiteridx)
+
+    if datetuple is None:
+        # The general parser slices out the same date, it would fail too
+        return _date_error(isodatetimestr, delimiteridx)
+
+    timetuple = scan_time(isodatetimestr, delimiteridx + len(delimiter))
+
+    if timetuple is not None:
+        return _try_build(builder.build_datetime, datetuple, timetuple)
+
+    return _try_build(parse_datetime, isodatetimestr, delimiter, builder)
+
+
+def try_parse_duration(isodurationstr, builder=PythonTimeBuilder):
+    # As parse_duration, but returns a ParseError instead of raising
+    if is_string(isodurationstr) is False:
+        isodurationstr = _decode(isodurationstr, "Duration")
+
+        if type(isodurationstr) is ParseError:
+            return isodurationstr
+
+    return _try_build(parse_duration, isodurationstr, builder)
+
+
+def try_parse_interval(
+    isointervalstr,
+    intervaldelimiter="/",
+    datetimedelimiter="T",
+    builder=PythonTimeBuilder,
+):
+    # As parse_interval, but returns a ParseError instead of raising
+    if is_string(isointervalstr) is False:
+        isointervalstr = _decode(isointervalstr, "Interval")
+
+        if type(isointervalstr) is ParseError:
+            return isointervalstr
+
+    return _try_build(
+        parse_interval,
+        isointervalstr,
+        intervaldelimiter,
+        datetimedelimiter,
+        builder,
+    )
+
+
+def _decode(isostr, kind):
+    # Returns the decoded string, or a ParseError
+    if is_bytes(isostr) is False:
+        return ParseError(ErrorCode.Type, "{0} must be string.", (kind,))
+
+    try:
+        return decode_ascii(isostr)
+    except UnicodeDecodeError as e:
+        return ParseError(ErrorCode.Format, "{0}", (e,), position=e.start)
+
+
+def _date_error(isostr, dateend):
+    # The date in isostr[0:dateend] isn't one of DATE_SHAPES
+    if isostr.startswith("+") or isostr.startswith("-"):
+        return ParseError(
+            ErrorCode.Unsupported,
+            "ISO 8601 extended year representation not supported.",
+            (),
+            position=0,
+        )
+
+    datestr = isostr[0:dateend]
+    remainder = datestr.lstrip("0123456789-W")
+
+    if len(remainder) == 0:
+        # Only valid characters, but not in a supported layout
+        position = None
+    else:
+        position = dateend - len(remainder)
+
+    return ParseError(
+        ErrorCode.Format,
+        '"{0}" is not a valid ISO 8601 date.',
+        (datestr,),
+        position=position,
+    )
+
+
+def _try_build(function, *args):
+    # Calls function, returning a ParseError for the errors the parsers
+    # and builders raise, these are raised and caught internally, and have
+    # no position
+    try:
+        return function(*args)
+    except (ValueError, NotImplementedError) as e:
+        code = EXCEPTION_CODES.get(type(e))
+
+        if code is None:
+            if isinstance(e, RangeCheckError) is True:
+                code = ErrorCode.Range
+            else:
+                code = ErrorCode.Format
+
+        return ParseError(code, "{0}", (e,))
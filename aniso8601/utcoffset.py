@@ -8,6 +8,14 @@
 
 import datetime
 
+# Hour and minute strings of the canonical timezone names, the default
+# TZ_HH_LIMIT and TZ_MM_LIMIT ranges, see get_canonical_minutes
+TIMEZONE_HOURS = frozenset("{0:02d}".format(value) for value in range(24))
+TIMEZONE_MINUTES = frozenset("{0:02d}".format(value) for value in range(60))
+
+# Shared UTCOffset instances, keyed by (minutes, name), see intern_utcoffset
+_utcoffsets = {}
+
 
 class UTCOffset(datetime.tzinfo):
     def __init__(self, name=None, minutes=None):
@@ -21,6 +29,25 @@ class UTCOffset(datetime.tzinfo):
         else:
             self._utcdelta = None
 
+    def __eq__(self, other):
+        # Equal offsets with equal names are interchangeable, so they
+        # compare equal, and can be shared
+        if not isinstance(other, UTCOffset):
+            return NotImplemented
+
+        return self._name == other._name and self._utcdelta == other._utcdelta
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def __hash__(self):
+        return hash((self._name, self._utcdelta))
+
     def __repr__(self):
         if self._utcdelta >= datetime.timedelta(hours=0):
             return "+{0} UTC".format(self._utcdelta)
@@ -69,3 +96,52 @@ class UTCOffset(datetime.tzinfo):
         # instead of allowing for a DST to be specified
         # https://docs.python.org/2/library/datetime.html#datetime.tzinfo.dst
         return datetime.timedelta(0)
+
+
+def intern_utcoffset(name=None, minutes=None):
+    # Returns the shared UTCOffset for the name and minutes, creating it
+    # the first time it is asked for. Only offsets with a canonical name
+    # spelling the same minutes are shared, so the table is bounded by the
+    # few thousand canonical names, any other offset is built every time.
+    key = (minutes, name)
+
+    utcoffset = _utcoffsets.get(key)
+
+    if utcoffset is None:
+        utcoffset = UTCOffset(name=name, minutes=minutes)
+
+        if get_canonical_minutes(name) == minutes:
+            _utcoffsets[key] = utcoffset
+
+    return utcoffset
+
+
+def get_canonical_minutes(name):
+    # The offset in minutes spelled by a canonical timezone name, None for
+    # any other name. Canonical names are Z, UTC, and the ASCII ±hh, ±hhmm,
+    # and ±hh:mm names with hours and minutes in TIMEZONE_HOURS and
+    # TIMEZONE_MINUTES.
+    if name == "Z" or name == "UTC":
+        return 0
+
+    if name is None or len(name) not in (3, 5, 6) or name[0] not in ("+", "-"):
+        return None
+
+    if len(name) == 3:
+        minutestr = "00"
+    elif len(name) == 5:
+        minutestr = name[3:5]
+    elif name[3] == ":":
+        minutestr = name[4:6]
+    else:
+        return None
+
+    if name[1:3] not in TIMEZONE_HOURS or minutestr not in TIMEZONE_MINUTES:
+        return None
+
+    minutes = int(name[1:3]) * 60 + int(minutestr)
+
+    if name[0] == "-":
+        return -minutes
+
+    return minutes
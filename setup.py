@@ -29,7 +29,8 @@ setup(
     packages=find_packages(),
     extras_require={
         "dev": TESTS_REQUIRE
-        + ["black", "coverage", "isort", "pre-commit", "pyenchant", "pylint",]
+        + ["black", "coverage", "isort", "pre-commit", "pyenchant", "pylint",],
+        "numpy": ["numpy"],
     },
     test_suite="aniso8601",
     tests_require=TESTS_REQUIRE,